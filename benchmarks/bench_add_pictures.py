@@ -0,0 +1,72 @@
+# encoding: utf-8
+
+"""
+Benchmark of adding many pictures to a document.
+
+Writes *n* distinct PNG images of about 750 KB each to a temporary directory,
+then times adding a picture of each one to a new document, one at a time with
+``Document.add_picture()`` and in one batch with ``Document.add_pictures()``
+on one thread and on one thread per CPU. The process-wide image cache is
+cleared before each run so every image is read, hashed and parsed. Run from
+the repository root with ``python benchmarks/bench_add_pictures.py [n]``.
+"""
+
+from __future__ import absolute_import, division, print_function
+
+import os
+import shutil
+import sys
+import tempfile
+
+from helpers import best_of, png_bytes, report
+
+import docx
+
+from docx.image.cache import image_cache
+
+
+def write_images(dirname, image_count):
+    paths = []
+    base = png_bytes(0, 512, 512)
+    for n in range(image_count):
+        path = os.path.join(dirname, 'image%d.png' % n)
+        with open(path, 'wb') as f:
+            # bytes after IEND make each image distinct, parsers ignore them
+            f.write(base + b'%d' % n)
+        paths.append(path)
+    return paths
+
+
+def one_at_a_time(paths):
+    image_cache.clear()
+    document = docx.Document()
+    for path in paths:
+        document.add_picture(path)
+
+
+def in_a_batch(paths, workers):
+    image_cache.clear()
+    document = docx.Document()
+    document.add_pictures(paths, workers=workers)
+
+
+def main(image_count):
+    dirname = tempfile.mkdtemp()
+    try:
+        paths = write_images(dirname, image_count)
+        workers = os.cpu_count() or 1
+        report('%d pictures:' % image_count, [
+            ('add_picture() each', best_of(lambda: one_at_a_time(paths))),
+            ('add_pictures(), 1 worker', best_of(
+                lambda: in_a_batch(paths, 1)
+            )),
+            ('add_pictures(), %d workers' % workers, best_of(
+                lambda: in_a_batch(paths, workers)
+            )),
+        ])
+    finally:
+        shutil.rmtree(dirname)
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 500)
@@ -0,0 +1,69 @@
+# encoding: utf-8
+
+"""
+Benchmark of dropping relationships from a large document.
+
+Builds a document of *n* sections, each having its own header and ten
+paragraphs of hyperlinks, then times linking every header to the previous
+one, which drops the relationship to each section's header part, and then
+deleting every other paragraph of links and pruning the relationships and parts
+nothing refers to any longer, which drops the hyperlinks of those
+paragraphs. Run from the repository root with
+``python benchmarks/bench_drop_rel.py [section_count]``.
+"""
+
+from __future__ import absolute_import, division, print_function
+
+import sys
+import time
+
+from helpers import report
+
+import docx
+
+
+def build(section_count):
+    document = docx.Document()
+    for n in range(section_count):
+        section = document.sections[-1] if n == 0 else document.add_section()
+        section.header.is_linked_to_previous = False
+        for m in range(10):
+            paragraph = document.add_paragraph('Section %d ' % n)
+            paragraph.add_hyperlink('link', 'https://example.com/%d/%d' % (n, m))
+    return document
+
+
+def main(section_count):
+    start = time.time()
+    document = build(section_count)
+    build_seconds = time.time() - start
+    sections = list(document.sections)
+
+    start = time.time()
+    for section in sections[1:]:
+        section.header.is_linked_to_previous = True
+    link_seconds = time.time() - start
+
+    link_paragraphs = [
+        paragraph for paragraph in document.paragraphs
+        if paragraph.text.startswith('Section')
+    ]
+    for paragraph in link_paragraphs[::2]:
+        p = paragraph._p
+        p.getparent().remove(p)
+    rels = document.part.rels
+    rel_count = len(rels)
+    start = time.time()
+    document.part.package.prune_unreferenced_parts()
+    prune_seconds = time.time() - start
+    assert len(rels) == rel_count - 5 * section_count
+
+    report('%d sections:' % section_count, [
+        ('build', build_seconds),
+        ('link headers to previous', link_seconds),
+        ('prune unreferenced parts', prune_seconds),
+    ])
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 2000)
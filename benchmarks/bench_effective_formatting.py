@@ -0,0 +1,92 @@
+# encoding: utf-8
+
+"""
+Benchmark of reading the effective formatting of every paragraph and run.
+
+Builds a document of *n* paragraphs cycling through a few paragraph styles of
+the default template, each having a plain run, a run in the "Strong"
+character style and a run made bold directly, about 1,000 pages at the
+default size. Times reading the effective bold, italic and size of each run
+and the effective space after and alignment of each paragraph with
+``Run.effective_font`` and ``Paragraph.effective_format``, once resolving the
+styles of the document once and once resolving them afresh for each run and
+paragraph. For comparison it also times finding bold and size by walking the
+``base_style`` chain of the run and paragraph styles for each run. Run from
+the repository root with
+``python benchmarks/bench_effective_formatting.py [paragraph_count]``.
+"""
+
+from __future__ import absolute_import, division, print_function
+
+import sys
+import time
+
+from helpers import report
+
+import docx
+
+PARAGRAPH_STYLES = ('Normal', 'Heading 1', 'Heading 2', 'List Bullet', 'Quote')
+
+
+def build(paragraph_count):
+    document = docx.Document()
+    for n in range(paragraph_count):
+        style = PARAGRAPH_STYLES[n % len(PARAGRAPH_STYLES)]
+        paragraph = document.add_paragraph('Plain text, ', style)
+        paragraph.add_run('strong text, ', 'Strong')
+        paragraph.add_run('bold text.').bold = True
+    return document
+
+
+def read_effective(document, reset):
+    values = []
+    for paragraph in document.paragraphs:
+        if reset:
+            document.styles.reset_effective_formatting()
+        paragraph_format = paragraph.effective_format
+        values.append(
+            (paragraph_format.space_after, paragraph_format.alignment)
+        )
+        for run in paragraph.runs:
+            if reset:
+                document.styles.reset_effective_formatting()
+            font = run.effective_font
+            values.append((font.bold, font.italic, font.size))
+    return values
+
+
+def walk_base_styles(document):
+    values = []
+    for paragraph in document.paragraphs:
+        paragraph_style = paragraph.style
+        for run in paragraph.runs:
+            bold, size = run.font.bold, run.font.size
+            for style in (run.style, paragraph_style):
+                while style is not None:
+                    if bold is None:
+                        bold = style.font.bold
+                    if size is None:
+                        size = style.font.size
+                    style = style.base_style
+            values.append((bold, size))
+    return values
+
+
+def timed(fn, *args):
+    start = time.time()
+    fn(*args)
+    return time.time() - start
+
+
+def main(paragraph_count):
+    document = build(paragraph_count)
+    assert read_effective(document, False) == read_effective(document, True)
+    report('%d paragraphs, %d runs:' % (paragraph_count, 3 * paragraph_count), [
+        ('effective, memoized', timed(read_effective, document, False)),
+        ('effective, unmemoized', timed(read_effective, document, True)),
+        ('walk base_style per run', timed(walk_base_styles, document)),
+    ])
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 5000)
@@ -0,0 +1,52 @@
+# encoding: utf-8
+
+"""
+Benchmark of adding many hyperlinks to a document.
+
+Builds an index document having *n* hyperlinks, ten to an entry paragraph,
+each to its own page URL, with every entry also linking back to the index
+page, then saves it. Times adding the hyperlinks, which creates
+a relationship for each distinct URL and reuses the one for the index page,
+and saving. Run from the repository root with
+``python benchmarks/bench_hyperlinks.py [link_count]``.
+"""
+
+from __future__ import absolute_import, division, print_function
+
+import sys
+import time
+
+from helpers import report
+
+import docx
+
+from docx.compat import BytesIO
+
+
+def add_links(document, link_count):
+    for n in range(link_count):
+        if n % 10 == 0:
+            paragraph = document.add_paragraph('Entry %d: ' % (n // 10))
+            paragraph.add_hyperlink('index', 'https://example.com/index')
+        paragraph.add_hyperlink(' %d' % n, 'https://example.com/p/%d' % n)
+
+
+def main(link_count):
+    document = docx.Document()
+    start = time.time()
+    add_links(document, link_count)
+    add_seconds = time.time() - start
+    rels = document.part.rels
+    assert len(rels) > link_count
+
+    start = time.time()
+    document.save(BytesIO())
+    save_seconds = time.time() - start
+    report('%d hyperlinks, %d relationships:' % (link_count, len(rels)), [
+        ('add hyperlinks', add_seconds),
+        ('save', save_seconds),
+    ])
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 50000)
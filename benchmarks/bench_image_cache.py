@@ -0,0 +1,66 @@
+# encoding: utf-8
+
+"""
+Benchmark of the process-wide image cache in a batch run.
+
+Makes *n* documents, adding the same logo and signature images to each as
+a mail-merge batch would, once with the image cache disabled and once with
+it enabled, and reports the time taken to load the images in each case.
+Run from the repository root with
+``python benchmarks/bench_image_cache.py [document_count]``.
+"""
+
+from __future__ import absolute_import, division, print_function
+
+import gc
+import os
+import sys
+import time
+
+from helpers import report
+
+import docx
+
+from docx.image.cache import image_cache
+
+TEST_FILES = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+    'tests', 'test_files',
+)
+IMAGES = [
+    os.path.join(TEST_FILES, name)
+    for name in ('exif-420-dpi.jpg', '300-dpi.TIF', '150-dpi.png')
+]
+
+
+def load_images(document_count):
+    """
+    Return the seconds spent loading the images into *document_count* new
+    documents, not counting the time to make the documents themselves.
+    """
+    packages = [
+        docx.Document().part.package for _ in range(document_count)
+    ]
+    gc.collect()
+    start = time.time()
+    for package in packages:
+        for path in IMAGES:
+            package.get_or_add_image_part(path)
+    return time.time() - start
+
+
+def main(document_count):
+    image_cache.max_bytes = 0
+    uncached = load_images(document_count)
+    image_cache.max_bytes = 64 * 1024 * 1024
+    image_cache.clear()
+    cached = load_images(document_count)
+    report('%d documents, %d images each:' % (document_count, len(IMAGES)), [
+        ('no image cache', uncached),
+        ('image cache', cached),
+    ])
+    print('  %d hits, %d misses' % (image_cache.hits, image_cache.misses))
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 200)
@@ -0,0 +1,84 @@
+# encoding: utf-8
+
+"""
+Benchmark of parsing image headers.
+
+Times parsing the header of each JPEG and TIFF image in ``tests/test_files``,
+the same way ``Image.from_blob()`` does when a picture is added, *n* times
+over, and checks that every image still gives the pixel size and dots per
+inch it should. The PNG, GIF and BMP images are timed too, for comparison.
+Run from the repository root with
+``python benchmarks/bench_image_headers.py [repeat_count]``.
+"""
+
+from __future__ import absolute_import, division, print_function
+
+import os
+import sys
+
+from helpers import best_of, report
+
+from docx.compat import BytesIO
+from docx.image.image import _ImageHeaderFactory
+
+
+test_files_dir = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), '..', 'tests', 'test_files'
+)
+
+# filename: (px_width, px_height, horz_dpi, vert_dpi)
+corpus = {
+    '300-dpi.jpg':        (1504, 1936, 300, 300),
+    'exif-420-dpi.jpg':   (2048, 1536, 72, 72),
+    'jfif-iguana.jpg':    (100, 68, 72, 72),
+    'python-icon.jpeg':   (204, 204, 72, 72),
+    '300-dpi.TIF':        (2464, 3248, 300, 300),
+    '72-dpi.tiff':        (48, 48, 72, 72),
+    'little-endian.tif':  (1600, 2100, 200, 200),
+    '150-dpi.png':        (901, 1350, 150, 150),
+    '300-dpi.png':        (860, 579, 300, 300),
+    'monty-truth.png':    (150, 214, 72, 72),
+    'python-powered.png': (140, 56, 72, 72),
+    'sonic.gif':          (290, 360, 72, 72),
+    'python.bmp':         (211, 71, 96, 96),
+}
+
+
+def load(filename):
+    with open(os.path.join(test_files_dir, filename), 'rb') as f:
+        return f.read()
+
+
+def parse_headers(blobs, repeat_count):
+    for _ in range(repeat_count):
+        for blob in blobs:
+            _ImageHeaderFactory(BytesIO(blob))
+
+
+def main(repeat_count):
+    rows = []
+    for kind, extensions in (
+        ('JPEG', ('.jpg', '.jpeg')),
+        ('TIFF', ('.tif', '.tiff')),
+        ('PNG, GIF and BMP', ('.png', '.gif', '.bmp')),
+    ):
+        filenames = sorted(
+            name for name in corpus
+            if os.path.splitext(name)[1].lower() in extensions
+        )
+        blobs = [load(name) for name in filenames]
+        for name, blob in zip(filenames, blobs):
+            header = _ImageHeaderFactory(BytesIO(blob))
+            actual = (
+                header.px_width, header.px_height,
+                header.horz_dpi, header.vert_dpi
+            )
+            assert actual == corpus[name], (name, actual)
+        rows.append(('%s, %d images' % (kind, len(blobs)), best_of(
+            lambda: parse_headers(blobs, repeat_count)
+        )))
+    report('%d times over:' % repeat_count, rows)
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1000)
@@ -0,0 +1,37 @@
+# encoding: utf-8
+
+"""
+Benchmark of adding many images, many of them duplicates, to a package.
+
+Adds *n* images drawn from *n* / 4 distinct small PNG images to the image
+parts of a new document, as a product catalog with repeated photos would,
+reporting the time taken. Run from the repository root with
+``python benchmarks/bench_image_parts.py [image_count]``.
+"""
+
+from __future__ import absolute_import, division, print_function
+
+import io
+import sys
+
+from helpers import best_of, png_bytes, report
+
+import docx
+
+
+def main(image_count):
+    blobs = [png_bytes(seed, 16, 16) for seed in range(image_count // 4)]
+
+    def add_images():
+        package = docx.Document().part.package
+        for n in range(image_count):
+            package.get_or_add_image_part(io.BytesIO(blobs[n * 7 % len(blobs)]))
+        assert len(package.image_parts) == len(blobs)
+
+    report('%d images, %d distinct:' % (image_count, len(blobs)), [
+        ('get_or_add_image_part()', best_of(add_images, repeat=1)),
+    ])
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 5000)
@@ -0,0 +1,81 @@
+# encoding: utf-8
+
+"""
+Benchmark of reading the block items of a long document.
+
+Streams a document of *n* paragraphs to a temporary file, then reads the text
+and style of each one, once through ``Document(path).paragraphs`` and once
+through ``docx.iter_block_items(path)``, reporting the time to the first
+paragraph, the total time and the peak resident memory of each. Each is run
+in a fresh process, as lxml allocates outside the Python heap. Run from the
+repository root with
+``python benchmarks/bench_iter_block_items.py [paragraph_count]``.
+"""
+
+from __future__ import absolute_import, division, print_function
+
+import multiprocessing
+import os
+import resource
+import sys
+import tempfile
+import time
+
+import helpers  # noqa: F401, puts the working-tree docx package on sys.path
+
+import docx
+
+
+def write_document(path, paragraph_count):
+    document = docx.Document()
+    with document.stream(path) as stream:
+        for n in range(paragraph_count):
+            style = 'Heading 1' if n % 50 == 0 else None
+            stream.add_paragraph('clause %d of the agreement' % n, style)
+
+
+def paragraphs(path):
+    return docx.Document(path).paragraphs
+
+
+def block_items(path):
+    return docx.iter_block_items(path)
+
+
+def measure(fn, path):
+    """
+    Return `(first_seconds, seconds, peak_kib)` for reading each paragraph
+    produced by *fn* from the document at *path*.
+    """
+    start = time.time()
+    first = None
+    for paragraph in fn(path):
+        paragraph.text, paragraph.style.name
+        if first is None:
+            first = time.time() - start
+    seconds = time.time() - start
+    return first, seconds, resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+
+def main(paragraph_count):
+    fd, path = tempfile.mkstemp(suffix='.docx')
+    os.close(fd)
+    try:
+        write_document(path, paragraph_count)
+        print('%d paragraphs:' % paragraph_count)
+        for label, fn in (
+            ('.paragraphs', paragraphs), ('iter_block_items()', block_items)
+        ):
+            pool = multiprocessing.Pool(1)
+            first, seconds, peak_kib = pool.apply(measure, (fn, path))
+            pool.close()
+            pool.join()
+            print('  %-20s first %6.3f s  all %7.3f s %8.1f MiB peak' % (
+                label, first, seconds, peak_kib / 1024.0
+            ))
+    finally:
+        os.remove(path)
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100000)
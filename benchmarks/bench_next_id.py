@@ -0,0 +1,55 @@
+# encoding: utf-8
+
+"""
+Benchmark of allocating drawing ids as pictures are added.
+
+Times adding *n* pictures of the same small image to a new document, each in
+its own paragraph, one at a time with ``Document.add_picture()`` and in one
+batch with ``Document.add_pictures()``. The image is read and parsed once, so
+the time is spent creating the pictures, including giving each a drawing id
+unique in the document. Run from the repository root with
+``python benchmarks/bench_next_id.py [picture_count]``.
+"""
+
+from __future__ import absolute_import, division, print_function
+
+import sys
+import time
+
+from helpers import png_bytes, report
+
+import docx
+
+from docx.compat import BytesIO
+
+
+def one_at_a_time(document, streams):
+    for stream in streams:
+        document.add_picture(stream)
+
+
+def in_a_batch(document, streams):
+    document.add_pictures(streams, workers=1)
+
+
+def timed(fn, picture_count, blob):
+    document = docx.Document()
+    streams = [BytesIO(blob) for _ in range(picture_count)]
+    start = time.time()
+    fn(document, streams)
+    seconds = time.time() - start
+    ids = [shape._inline.docPr.id for shape in document.inline_shapes]
+    assert ids == list(range(1, picture_count + 1))
+    return seconds
+
+
+def main(picture_count):
+    blob = png_bytes(0, 32, 32)
+    report('%d pictures:' % picture_count, [
+        ('add_picture() each', timed(one_at_a_time, picture_count, blob)),
+        ('add_pictures()', timed(in_a_batch, picture_count, blob)),
+    ])
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 5000)
@@ -0,0 +1,64 @@
+# encoding: utf-8
+
+"""
+Benchmark of relationship-graph walks on a package having many parts.
+
+Builds a synthetic package of *n* small parts, each related from a root part
+and also chained to the next, like embedded media referenced from several
+places, then times ``OpcPackage.iter_parts()``, saving the package and
+opening it again. Run from the repository root with
+``python benchmarks/bench_rel_graph.py [part_count]``.
+"""
+
+from __future__ import absolute_import, division, print_function
+
+import io
+import sys
+
+from helpers import best_of, report
+
+from docx.opc.constants import RELATIONSHIP_TYPE as RT
+from docx.opc.package import OpcPackage
+from docx.opc.packuri import PackURI
+from docx.opc.part import Part
+
+
+def build_package(part_count):
+    package = OpcPackage()
+    root = Part(
+        PackURI('/custom/root.bin'), 'application/octet-stream', b'root',
+        package
+    )
+    package.load_rel(RT.CUSTOM_XML, root, 'rId1')
+    prior = root
+    for n in range(1, part_count + 1):
+        part = Part(
+            PackURI('/custom/item%d.bin' % n), 'application/octet-stream',
+            b'item', package
+        )
+        root.load_rel(RT.CUSTOM_XML, part, 'rId%d' % n)
+        prior.load_rel(RT.CUSTOM_XML_PROPS, part, 'rId%d' % (part_count + 1))
+        prior = part
+    return package
+
+
+def main(part_count):
+    package = build_package(part_count)
+    stream = io.BytesIO()
+    package.save(stream)
+
+    def save():
+        package.save(io.BytesIO())
+
+    def open_():
+        OpcPackage.open(io.BytesIO(stream.getvalue()))
+
+    report('%d-part package:' % part_count, [
+        ('iter_parts()', best_of(lambda: list(package.iter_parts()))),
+        ('save()', best_of(save)),
+        ('open()', best_of(open_)),
+    ])
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 10000)
@@ -0,0 +1,65 @@
+# encoding: utf-8
+
+"""
+Benchmark of ``Document.save()`` against the number of worker threads.
+
+Builds a document having many sections, each with its own header and footer
+part full of text and its own image, then times saving it serially and with
+``workers`` of 2, 4 ... up to the number of cores. Run from the repository
+root with ``python benchmarks/bench_save.py [sections]``.
+"""
+
+from __future__ import absolute_import, division, print_function
+
+import io
+import multiprocessing
+import sys
+
+from helpers import best_of, png_bytes, report
+
+from docx import Document
+from docx.shared import Inches
+
+
+def build_document(section_count):
+    document = Document()
+    text = 'The quick brown fox jumps over the lazy dog. ' * 20
+    for idx in range(section_count):
+        section = document.sections[-1]
+        for header_footer in (section.header, section.footer):
+            header_footer.is_linked_to_previous = False
+            for _ in range(40):
+                header_footer.add_paragraph(text)
+        document.add_paragraph(text)
+        document.add_picture(io.BytesIO(png_bytes(idx)), width=Inches(1))
+        document.add_section()
+    return document
+
+
+def main(section_count):
+    document = build_document(section_count)
+    cpu_count = multiprocessing.cpu_count()
+    worker_counts = [1] + [n for n in (2, 4, 8, 16) if n <= cpu_count]
+
+    def save(workers):
+        stream = io.BytesIO()
+        document.save(stream, workers=workers)
+        return stream.getvalue()
+
+    outputs = set(save(workers) for workers in worker_counts)
+    assert len(outputs) == 1, 'output differs with worker count'
+
+    rows = [
+        ('workers=%d' % workers, best_of(lambda: save(workers)))
+        for workers in worker_counts
+    ]
+    report(
+        'Document.save(), %d sections, %d parts, %d cores:' % (
+            section_count, len(document.part.package.parts), cpu_count
+        ),
+        rows
+    )
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100)
@@ -0,0 +1,55 @@
+# encoding: utf-8
+
+"""
+Benchmark of finding sections and their inherited headers in a long document.
+
+Builds a document of *n* sections of ten paragraphs each, where only the first
+section defines a header, then times reading the start type of each section
+by index and reading the header text of the last 50 sections, which is
+inherited from the first section by way of every section between. Run from
+the repository root with ``python benchmarks/bench_sections.py [n]``.
+"""
+
+from __future__ import absolute_import, division, print_function
+
+import sys
+import time
+
+from helpers import report
+
+import docx
+
+
+def build(section_count):
+    document = docx.Document()
+    document.sections[0].header.paragraphs[0].text = 'Header'
+    for n in range(section_count):
+        for m in range(10):
+            document.add_paragraph('Section %d paragraph %d' % (n, m))
+        if n < section_count - 1:
+            document.add_section()
+    return document
+
+
+def main(section_count):
+    document = build(section_count)
+    sections = document.sections
+
+    start = time.time()
+    start_types = [sections[n].start_type for n in range(len(sections))]
+    index_seconds = time.time() - start
+    assert len(start_types) == section_count
+
+    start = time.time()
+    for section in sections[-50:]:
+        assert section.header.paragraphs[0].text == 'Header'
+    header_seconds = time.time() - start
+
+    report('%d sections:' % section_count, [
+        ('each section by index', index_seconds),
+        ('inherited headers of last 50', header_seconds),
+    ])
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 2000)
@@ -0,0 +1,90 @@
+# encoding: utf-8
+
+"""
+Benchmark of adding many large pictures to a document and saving it.
+
+Writes *n* distinct PNG images of about 3 MB each to a temporary directory,
+then adds each one to a new document as a picture and saves it, once holding
+the images in memory and once with ``Document.spool_images`` set, reporting
+the time taken and the peak resident memory of each. Each is run in a fresh
+process so their peaks don't mix. Run from the repository root with
+``python benchmarks/bench_spool_images.py [image_count]``.
+"""
+
+from __future__ import absolute_import, division, print_function
+
+import multiprocessing
+import os
+import resource
+import shutil
+import struct
+import sys
+import tempfile
+import time
+import zlib
+
+from helpers import png_bytes
+
+import docx
+
+
+def write_images(dirname, image_count):
+    """
+    Write *image_count* PNG images of noise to *dirname*, each made distinct
+    by a text chunk, and return their paths.
+    """
+    base = png_bytes(0, 1024, 1024)
+    iend = base.rindex(b'IEND') - 4
+    paths = []
+    for n in range(image_count):
+        data = b'Comment\x00image %d' % n
+        crc = zlib.crc32(b'tEXt' + data) & 0xFFFFFFFF
+        text_chunk = (
+            struct.pack('>I', len(data)) + b'tEXt' + data +
+            struct.pack('>I', crc)
+        )
+        path = os.path.join(dirname, 'image%d.png' % n)
+        with open(path, 'wb') as f:
+            f.write(base[:iend] + text_chunk + base[iend:])
+        paths.append(path)
+    return paths
+
+
+def add_pictures_and_save(paths, docx_path, spool):
+    """
+    Return `(seconds, peak_kib)` for adding a picture of each image in
+    *paths* to a new document and saving it to *docx_path*.
+    """
+    start = time.time()
+    document = docx.Document()
+    document.spool_images = spool
+    for path in paths:
+        document.add_picture(path)
+    document.save(docx_path)
+    seconds = time.time() - start
+    return seconds, resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+
+def main(image_count):
+    dirname = tempfile.mkdtemp()
+    try:
+        paths = write_images(dirname, image_count)
+        image_bytes = sum(os.path.getsize(path) for path in paths)
+        print('%d images, %.1f MiB:' % (image_count, image_bytes / 2.0**20))
+        for label, spool in (('in memory', False), ('spooled', True)):
+            docx_path = os.path.join(dirname, 'pictures.docx')
+            pool = multiprocessing.Pool(1)
+            seconds, peak_kib = pool.apply(
+                add_pictures_and_save, (paths, docx_path, spool)
+            )
+            pool.close()
+            pool.join()
+            print('  %-12s %7.3f s %8.1f MiB peak' % (
+                label, seconds, peak_kib / 1024.0
+            ))
+    finally:
+        shutil.rmtree(dirname)
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100)
@@ -0,0 +1,70 @@
+# encoding: utf-8
+
+"""
+Benchmark of streaming a long document compared to building and saving it.
+
+Writes *n* table-like paragraphs, as an audit report would, once by adding
+them all to a |Document| and saving it and once through
+``Document.stream()``, reporting the time taken and the peak resident memory
+of each. Each is run in a fresh process, as lxml allocates outside the
+Python heap and peak memory can't be reset. Run from the repository root with
+``python benchmarks/bench_stream.py [paragraph_count]``.
+"""
+
+from __future__ import absolute_import, division, print_function
+
+import io
+import multiprocessing
+import resource
+import sys
+import time
+
+import helpers  # noqa: F401, puts the working-tree docx package on sys.path
+
+import docx
+
+
+def rows(paragraph_count):
+    for n in range(paragraph_count):
+        yield 'entry %d\tledger %d\tamount %d.%02d' % (n, n % 97, n, n % 100)
+
+
+def build_and_save(paragraph_count):
+    document = docx.Document()
+    for text in rows(paragraph_count):
+        document.add_paragraph(text)
+    document.save(io.BytesIO())
+
+
+def stream(paragraph_count):
+    document = docx.Document()
+    with document.stream(io.BytesIO()) as stream:
+        for text in rows(paragraph_count):
+            stream.add_paragraph(text)
+
+
+def measure(fn, paragraph_count):
+    """
+    Return `(seconds, peak_kib)` for calling *fn* with *paragraph_count*,
+    where *peak_kib* is the peak resident memory of this process.
+    """
+    start = time.time()
+    fn(paragraph_count)
+    seconds = time.time() - start
+    return seconds, resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+
+def main(paragraph_count):
+    print('%d paragraphs:' % paragraph_count)
+    for label, fn in (('add + save()', build_and_save), ('stream()', stream)):
+        pool = multiprocessing.Pool(1)
+        seconds, peak_kib = pool.apply(measure, (fn, paragraph_count))
+        pool.close()
+        pool.join()
+        print('  %-16s %8.3f s %10.1f MiB peak' % (
+            label, seconds, peak_kib / 1024.0
+        ))
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 50000)
@@ -0,0 +1,54 @@
+# encoding: utf-8
+
+"""
+Benchmark of assigning styles by name in bulk.
+
+Adds *n* paragraphs of one run each to a new document, then times setting
+the style of each paragraph and run by name, cycling through a few paragraph
+and character styles of the default template, and reading the paragraph
+styles back. Run from the repository root with
+``python benchmarks/bench_styles.py [paragraph_count]``.
+"""
+
+from __future__ import absolute_import, division, print_function
+
+import sys
+import time
+
+from helpers import report
+
+import docx
+
+PARAGRAPH_STYLES = ('Heading 2', 'List Bullet', 'Body Text', 'Quote')
+CHARACTER_STYLES = ('Strong', 'Emphasis', 'Intense Emphasis')
+
+
+def main(paragraph_count):
+    document = docx.Document()
+    paragraphs = [document.add_paragraph() for _ in range(paragraph_count)]
+    runs = [paragraph.add_run('text') for paragraph in paragraphs]
+
+    start = time.time()
+    for n, paragraph in enumerate(paragraphs):
+        paragraph.style = PARAGRAPH_STYLES[n % len(PARAGRAPH_STYLES)]
+    paragraph_seconds = time.time() - start
+
+    start = time.time()
+    for n, run in enumerate(runs):
+        run.style = CHARACTER_STYLES[n % len(CHARACTER_STYLES)]
+    run_seconds = time.time() - start
+
+    start = time.time()
+    names = [paragraph.style.name for paragraph in paragraphs]
+    read_seconds = time.time() - start
+    assert names[:4] == list(PARAGRAPH_STYLES)
+
+    report('%d paragraphs:' % paragraph_count, [
+        ('set paragraph styles', paragraph_seconds),
+        ('set run styles', run_seconds),
+        ('read paragraph styles', read_seconds),
+    ])
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 20000)
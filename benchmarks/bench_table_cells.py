@@ -0,0 +1,58 @@
+# encoding: utf-8
+
+"""
+Benchmark of cell access on a large table.
+
+Times reading every cell of a *rows* x 20 table with ``Table.cell()``, one
+``row_cells()`` call per row and one ``column_cells()`` call per column, and
+filling the table cell by cell while adding its rows one at a time. Run from
+the repository root with ``python benchmarks/bench_table_cells.py [rows]``.
+"""
+
+from __future__ import absolute_import, division, print_function
+
+import sys
+
+from helpers import best_of, report
+
+import docx
+
+COLS = 20
+
+
+def main(row_count):
+    document = docx.Document()
+    table = document.add_table(row_count, COLS)
+
+    def cell_by_cell():
+        for row_idx in range(row_count):
+            for col_idx in range(COLS):
+                table.cell(row_idx, col_idx)
+
+    def row_by_row():
+        for row_idx in range(row_count):
+            table.row_cells(row_idx)
+
+    def column_by_column():
+        for col_idx in range(COLS):
+            table.column_cells(col_idx)
+
+    def fill_growing_table():
+        growing = document.add_table(1, COLS)
+        for row_idx in range(row_count // 10):
+            if row_idx:
+                growing.add_row()
+            for col_idx in range(COLS):
+                growing.cell(row_idx, col_idx).text = 'x'
+
+    report('%d x %d table:' % (row_count, COLS), [
+        ('cell() for each cell', best_of(cell_by_cell)),
+        ('row_cells() for each row', best_of(row_by_row)),
+        ('column_cells() for each col', best_of(column_by_column)),
+        ('fill %d rows as added' % (row_count // 10),
+         best_of(fill_growing_table, repeat=1)),
+    ])
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 2000)
@@ -0,0 +1,51 @@
+# encoding: utf-8
+
+"""
+Benchmark of building a table from 2-D data.
+
+Builds a *rows* x 10 table of generated values, once by adding an empty
+table and setting the text of each cell and once with
+``Document.add_table_from_rows()`` from a generator. Run from the repository
+root with ``python benchmarks/bench_table_rows.py [rows]``.
+"""
+
+from __future__ import absolute_import, division, print_function
+
+import sys
+
+from helpers import best_of, report
+
+import docx
+
+COLS = 10
+
+
+def data(row_count):
+    for n in range(row_count):
+        yield ['r%d c%d' % (n, col) for col in range(COLS)]
+
+
+def cell_by_cell(row_count):
+    document = docx.Document()
+    table = document.add_table(row_count, COLS)
+    for row, values in zip(table.rows, data(row_count)):
+        for cell, value in zip(row.cells, values):
+            cell.text = value
+
+
+def from_rows(row_count):
+    document = docx.Document()
+    document.add_table_from_rows(data(row_count))
+
+
+def main(row_count):
+    report('%d x %d table:' % (row_count, COLS), [
+        ('add_table() + cell.text', best_of(
+            lambda: cell_by_cell(row_count), repeat=1
+        )),
+        ('add_table_from_rows()', best_of(lambda: from_rows(row_count))),
+    ])
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 10000)
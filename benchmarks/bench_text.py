@@ -0,0 +1,83 @@
+# encoding: utf-8
+
+"""
+Benchmark of extracting the text of a whole document.
+
+Builds a document of *n* paragraphs of several runs each, with a table every
+100 paragraphs, then times getting the text of every paragraph through the
+proxy objects, for each paragraph of the body and of each table cell,
+against ``Document.iter_text()``. The proxy path is timed both joining the
+text of each |Run|, as ``Paragraph.text`` used to, and with
+``Paragraph.text``. Run from the repository root with
+``python benchmarks/bench_text.py [paragraph_count]``.
+"""
+
+from __future__ import absolute_import, division, print_function
+
+import sys
+
+from helpers import best_of, report
+
+import docx
+
+from docx.table import Table
+from docx.text.paragraph import Paragraph
+
+
+def build_document(paragraph_count):
+    document = docx.Document()
+    for n in range(paragraph_count):
+        paragraph = document.add_paragraph('Clause %d: ' % n)
+        paragraph.add_run('the parties agree')
+        paragraph.add_run('\tto the terms').bold = True
+        paragraph.add_run(' set out below.')
+        if n % 100 == 0:
+            table = document.add_table(3, 4)
+            for cell in table._cells:
+                cell.text = 'cell %d' % n
+    return document
+
+
+def run_text(paragraph):
+    return ''.join(run.text for run in paragraph.runs)
+
+
+def paragraph_text(paragraph):
+    return paragraph.text
+
+
+def proxy_text(container, text_of):
+    """
+    Generate the text of each paragraph in *container* through the proxy
+    objects, using *text_of* to get the text of a |Paragraph|.
+    """
+    for item in container.iter_block_items():
+        if isinstance(item, Paragraph):
+            yield text_of(item)
+        elif isinstance(item, Table):
+            for row in item.rows:
+                for cell in row.cells:
+                    for text in proxy_text(cell, text_of):
+                        yield text
+
+
+def main(paragraph_count):
+    document = build_document(paragraph_count)
+    assert list(proxy_text(document, run_text)) == list(
+        document.iter_text(headers_and_footers=False)
+    )
+    report('%d paragraphs:' % paragraph_count, [
+        ('Run.text per run', best_of(
+            lambda: list(proxy_text(document, run_text))
+        )),
+        ('Paragraph.text per paragraph', best_of(
+            lambda: list(proxy_text(document, paragraph_text))
+        )),
+        ('Document.iter_text()', best_of(
+            lambda: list(document.iter_text(headers_and_footers=False))
+        )),
+    ])
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 20000)
@@ -0,0 +1,63 @@
+# encoding: utf-8
+
+"""
+Helpers shared by the benchmark scripts in this directory.
+
+The scripts are run directly, e.g. ``python benchmarks/bench_save.py``, from
+the root of the repository so the working-tree ``docx`` package is used.
+"""
+
+from __future__ import absolute_import, division, print_function
+
+import os
+import random
+import struct
+import sys
+import timeit
+import zlib
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+def best_of(fn, repeat=3):
+    """
+    Return the shortest wall-clock time in seconds taken by calling *fn* with
+    no arguments, over *repeat* calls.
+    """
+    return min(timeit.repeat(fn, number=1, repeat=repeat))
+
+
+def png_bytes(seed, px_width=256, px_height=256):
+    """
+    Return the bytes of an RGB PNG image of random noise, different for each
+    *seed*. Noise does not compress, so the image is about 3 bytes/pixel.
+    """
+    rnd = random.Random(seed)
+    row_len = px_width * 3
+    raw = b''.join(
+        b'\x00' + bytes(bytearray(rnd.getrandbits(8) for _ in range(row_len)))
+        for _ in range(px_height)
+    )
+
+    def chunk(chunk_type, data):
+        crc = zlib.crc32(chunk_type + data) & 0xFFFFFFFF
+        return struct.pack('>I', len(data)) + chunk_type + data + (
+            struct.pack('>I', crc)
+        )
+
+    ihdr = struct.pack('>IIBBBBB', px_width, px_height, 8, 2, 0, 0, 0)
+    return b''.join((
+        b'\x89PNG\r\n\x1a\n',
+        chunk(b'IHDR', ihdr),
+        chunk(b'IDAT', zlib.compress(raw, 1)),
+        chunk(b'IEND', b''),
+    ))
+
+
+def report(title, rows):
+    """
+    Print *rows*, a sequence of `(label, seconds)` pairs, under *title*.
+    """
+    print(title)
+    for label, seconds in rows:
+        print('  %-32s %8.3f s' % (label, seconds))
@@ -9,24 +9,94 @@ OpcPackage graph.
 from __future__ import absolute_import, division, print_function
 
 import os
+import threading
 
 from docx.opc.constants import CONTENT_TYPE as CT
 from docx.package import Package
 
 
-def Document(docx=None):
+def Document(docx=None, lazy=False):
     """
     Return a |Document| object loaded from *docx*, where *docx* can be
     either a path to a ``.docx`` file (a string) or a file-like object. If
     *docx* is missing or ``None``, the built-in default document "template"
-    is loaded.
+    is loaded. The default template is parsed only once per process and
+    copied for each new document, see |TemplateRegistry|.
+
+    When *lazy* is |True|, parts are read from *docx* and parsed only when
+    first used, which makes opening large packages cheap when only a few
+    of their parts are needed. In that case *docx* must stay available and
+    unchanged for as long as the document is in use. With no *docx*, the
+    default template is then opened lazily itself rather than copied.
     """
-    docx = _default_docx_path() if docx is None else docx
-    document_part = Package.open(docx).main_document_part
-    if document_part.content_type != CT.WML_DOCUMENT_MAIN:
-        tmpl = "file '%s' is not a Word file, content type is '%s'"
-        raise ValueError(tmpl % (docx, document_part.content_type))
-    return document_part.document
+    if docx is None:
+        if not lazy:
+            return templates.document(_default_docx_path())
+        docx = _default_docx_path()
+    return _document_part_of(Package.open(docx, lazy), docx).document
+
+
+def iter_block_items(docx):
+    """
+    Generate a |Paragraph|, |Table| or |StructuredDocumentTag| object for
+    each block item in the body of the document in *docx*, a path to
+    a ``.docx`` file or a file-like object, in document order. The document
+    is read incrementally, so memory use stays bounded and the first items
+    are available right away however large it is. The items are read-only
+    and each is valid only until the next one is generated. Other parts,
+    such as styles, are loaded as they are needed. The package file is
+    closed once all items have been generated or the generator is closed.
+    """
+    package = Package.open(docx, lazy=True)
+    try:
+        for block_item in _document_part_of(package, docx).iter_block_items():
+            yield block_item
+    finally:
+        package.close()
+
+
+class TemplateRegistry(object):
+    """
+    Cache of parsed templates from which any number of new documents can be
+    made cheaply. A template is opened and parsed the first time a document
+    is made from it. Each later document gets its own deep copy of the
+    already-parsed parts, with no file access or XML parsing. Safe to share
+    between threads; only the lookup of a template is serialized, the
+    copying is not.
+
+    ``docx.api.templates`` is the registry used by :func:`Document` for the
+    default template, and it can be used for other templates too::
+
+        document = templates.document('letterhead.docx')
+    """
+    def __init__(self):
+        super(TemplateRegistry, self).__init__()
+        self._packages = {}
+        self._lock = threading.Lock()
+
+    def clear(self):
+        """
+        Forget all cached templates, for example after a template file has
+        changed on disk.
+        """
+        with self._lock:
+            self._packages.clear()
+
+    def document(self, template):
+        """
+        Return a new |Document| copied from *template*, the path to
+        a ``.docx`` file. Changes to the document do not affect the template
+        or other documents made from it.
+        """
+        key = os.path.abspath(template)
+        with self._lock:
+            package = self._packages.get(key)
+            if package is None:
+                package = self._packages[key] = Package.open(template)
+        return _document_part_of(package.clone(), template).document
+
+
+templates = TemplateRegistry()
 
 
 def _default_docx_path():
@@ -35,3 +105,16 @@ def _default_docx_path():
     """
     _thisdir = os.path.split(__file__)[0]
     return os.path.join(_thisdir, 'templates', 'default.docx')
+
+
+def _document_part_of(package, docx):
+    """
+    Return the main document part of *package*, which was loaded from
+    *docx*. Raises |ValueError| if *package* is not a WordprocessingML
+    package.
+    """
+    document_part = package.main_document_part
+    if document_part.content_type != CT.WML_DOCUMENT_MAIN:
+        tmpl = "file '%s' is not a Word file, content type is '%s'"
+        raise ValueError(tmpl % (docx, document_part.content_type))
+    return document_part
@@ -8,10 +8,14 @@ specialized ones like structured document tags.
 
 from __future__ import absolute_import, division, print_function, unicode_literals
 
+from docx.oxml.ns import qn
 from docx.oxml.table import CT_Tbl
 from docx.shared import Parented
 from docx.text.paragraph import Paragraph
 
+_p_tag, _tbl_tag, _sdt_tag = qn('w:p'), qn('w:tbl'), qn('w:sdt')
+_block_item_tags = (_p_tag, _tbl_tag, _sdt_tag)
+
 
 class BlockItemContainer(Parented):
     """Base class for proxy objects that can contain block items.
@@ -39,6 +43,27 @@ class BlockItemContainer(Parented):
             paragraph.style = style
         return paragraph
 
+    def add_pictures(self, image_descriptors, width=None, height=None,
+                     workers=None):
+        """
+        Return a list of picture shapes, one for each image in
+        *image_descriptors*, each newly added in its own paragraph at the
+        end of the content in this container, in order. Each image is a path
+        or a file-like object and is scaled by *width* and *height* as by
+        :meth:`.Run.add_picture`. The images are read, hashed and parsed on
+        a pool of *workers* threads, one per CPU by default, which is much
+        faster than adding many pictures one at a time.
+        """
+        from .shape import InlineShape
+        inlines = self.part.new_pic_inlines(
+            image_descriptors, width, height, workers
+        )
+        shapes = []
+        for inline in inlines:
+            self.add_paragraph().add_run()._r.add_drawing(inline)
+            shapes.append(InlineShape(inline))
+        return shapes
+
     def add_table(self, rows, cols, width):
         """
         Return a table of *width* having *rows* rows and *cols* columns,
@@ -50,11 +75,55 @@ class BlockItemContainer(Parented):
         self._element._insert_tbl(tbl)
         return Table(tbl, self)
 
+    def add_table_from_rows(self, rows, width, style=None, header=None):
+        """
+        Return a table of *width* having a row for each sequence of cell
+        values in *rows*, newly appended to the content in this container.
+        *rows* can be any iterable, including a generator or a 2-D array
+        such as ``numpy.ndarray``; for a pandas ``DataFrame`` pass
+        ``df.values`` or ``df.itertuples(index=False)``. *header*, when not
+        |None|, is a sequence of column headings added as a first row that
+        repeats at the top of each page. Each value other than |None| is
+        converted to text with ``str()``. The table has as many columns as
+        *header*, or as the first row if there is no header; having neither
+        raises |ValueError|. Shorter rows are padded with empty cells and a
+        longer row raises |ValueError|.
+        *style* is applied as by :attr:`.Table.style`.
+
+        The whole table is built in one pass, which is much faster than
+        adding an empty table and setting the text of each cell.
+        """
+        from .table import Table
+        tbl = CT_Tbl.new_tbl_from_rows(rows, width, header)
+        self._element._insert_tbl(tbl)
+        table = Table(tbl, self)
+        if style is not None:
+            table.style = style
+        return table
+
     def add_sdt(self):
         sdt= self._add_sdt()
         sdt.init_toc()
         return sdt
 
+    def iter_block_items(self):
+        """
+        Generate a |Paragraph|, |Table| or |StructuredDocumentTag| object for
+        each block item in this container, in document order. Unlike
+        combining :attr:`paragraphs` and :attr:`tables`, this takes a single
+        pass over the children of the container.
+        """
+        from .sdt import StructuredDocumentTag
+        from .table import Table
+        for element in self._element.iterchildren(*_block_item_tags):
+            tag = element.tag
+            if tag == _p_tag:
+                yield Paragraph(element, self)
+            elif tag == _tbl_tag:
+                yield Table(element, self)
+            else:
+                yield StructuredDocumentTag(element, self)
+
     @property
     def paragraphs(self):
         """
@@ -4,9 +4,15 @@
 
 from __future__ import absolute_import, division, print_function, unicode_literals
 
+from contextlib import ExitStack
+
+from lxml import etree
+
 from docx.blkcntnr import BlockItemContainer
 from docx.enum.section import WD_SECTION
 from docx.enum.text import WD_BREAK
+from docx.oxml.ns import qn
+from docx.oxml.text.paragraph import iter_paragraph_text
 from docx.section import Section, Sections
 from docx.shared import ElementProxy, Emu
 from random import randrange as rr
@@ -93,6 +99,17 @@ class Document(ElementProxy):
         run = self.add_paragraph().add_run()
         return run.add_picture(image_path_or_stream, width, height)
 
+    def add_pictures(self, images, width=None, height=None, workers=None):
+        """
+        Return a list of new picture shapes, one for each path or stream in
+        *images*, each added in its own paragraph at the end of the
+        document, in order, as :meth:`add_picture` does. *width* and
+        *height* apply to every picture. The images are read, hashed and
+        parsed on a pool of *workers* threads, one per CPU by default, so
+        adding hundreds of pictures uses all cores.
+        """
+        return self._body.add_pictures(images, width, height, workers)
+
     def add_section(self, start_type=WD_SECTION.NEW_PAGE):
         """
         Return a |Section| object representing a new section added at the end
@@ -102,6 +119,7 @@ class Document(ElementProxy):
         """
         new_sectPr = self._element.body.add_section_break()
         new_sectPr.start_type = start_type
+        self._part.reset_section_index()
         return Section(new_sectPr, self._part)
 
     def add_table(self, rows, cols, style=None):
@@ -115,6 +133,17 @@ class Document(ElementProxy):
         table.style = style
         return table
 
+    def add_table_from_rows(self, rows, style=None, header=None):
+        """
+        Add a table having a row for each sequence of cell values in *rows*,
+        with optional column headings *header* and table style *style*, as
+        described in :meth:`.BlockItemContainer.add_table_from_rows`. The
+        table spans the width between the margins of the last section.
+        """
+        return self._body.add_table_from_rows(
+            rows, self._block_width, style, header
+        )
+
     def init_toc(self):
         return self._body.add_sdt()
 
@@ -145,6 +174,31 @@ class Document(ElementProxy):
         """
         return self._part.inline_shapes
 
+    def iter_block_items(self):
+        """
+        Generate a |Paragraph|, |Table| or |StructuredDocumentTag| object for
+        each block item in the body of this document, in document order.
+        """
+        return self._body.iter_block_items()
+
+    def iter_text(self, headers_and_footers=True):
+        """
+        Generate the text of each paragraph in this document, the same as its
+        :attr:`Paragraph.text`. The paragraphs of the body come first, in
+        document order and including those in tables, followed by those of
+        each header and footer unless *headers_and_footers* is |False|. The
+        text is read directly from the XML, without creating a proxy object
+        for each paragraph and run, which makes this the fast way to get the
+        text of a document.
+        """
+        for text in iter_paragraph_text(self._element.body):
+            yield text
+        if not headers_and_footers:
+            return
+        for hdrftr_part in self._part.iter_hdrftr_parts():
+            for text in iter_paragraph_text(hdrftr_part.element):
+                yield text
+
     @property
     def paragraphs(self):
         """
@@ -161,12 +215,20 @@ class Document(ElementProxy):
         """
         return self._part
 
-    def save(self, path_or_stream):
+    def save(self, path_or_stream, compression=None, workers=None):
         """
         Save this document to *path_or_stream*, which can be either a path to
         a filesystem location (a string) or a file-like object.
+
+        *compression* is an optional |CompressionPolicy| choosing the zip
+        compression of each part by its content type, for example
+        ``CompressionPolicy.store_images(compresslevel=1)`` to skip
+        recompressing JPEG and PNG images and deflate the rest quickly.
+        When *workers* is greater than 1, parts are serialized and
+        compressed on that many threads, which speeds up saving documents
+        having many large parts. The file written is the same either way.
         """
-        self._part.save(path_or_stream)
+        self._part.save(path_or_stream, compression, workers)
 
     @property
     def sections(self):
@@ -181,6 +243,39 @@ class Document(ElementProxy):
         """
         return self._part.settings
 
+    @property
+    def spool_images(self):
+        """
+        Read/write. When |True|, the bytes of each image added to this
+        document are not held in memory until it is saved. The picture
+        refers to its image file instead, or to a temporary file a stream is
+        copied to, and is streamed from there into the package when the
+        document is saved. Memory use stays flat however many large images
+        are added, but an image file must not change before the document is
+        saved. |False| by default.
+        """
+        return self._part.package.image_parts.spool_images
+
+    @spool_images.setter
+    def spool_images(self, value):
+        self._part.package.image_parts.spool_images = bool(value)
+
+    def stream(self, path_or_stream, compression=None):
+        """
+        Return a |DocumentStream| that saves this document to
+        *path_or_stream* while content is appended to it, writing each block
+        item to the file and dropping it from memory as soon as the next one
+        is added. Memory use stays flat however long the document gets::
+
+            with document.stream('report.docx') as stream:
+                for row in rows:
+                    stream.add_paragraph(row.text)
+
+        Content already in the document comes first. *compression* is used as
+        it is by :meth:`save`.
+        """
+        return DocumentStream(self, path_or_stream, compression)
+
     @property
     def styles(self):
         """
@@ -233,6 +328,141 @@ class Document(ElementProxy):
 
 
 
+class DocumentStream(object):
+    """
+    Append-only writer saving a |Document| as block items are added to it.
+
+    Each block item is written to ``word/document.xml`` in the package, and
+    removed from the document, once the next one is added, so the block item
+    most recently returned can still be changed. Headers, footers, styles,
+    numbering and images are kept in their parts as usual and saved when the
+    stream is closed. Not intended to be constructed directly, use
+    :meth:`Document.stream`. Used as a context manager, the stream is closed
+    when the block exits.
+    """
+    def __init__(self, document, path_or_stream, compression=None):
+        super(DocumentStream, self).__init__()
+        self._document = document
+        self._exit_stack = ExitStack()
+        part = document.part
+        stream = self._exit_stack.enter_context(
+            part.package.save_streaming(path_or_stream, part, compression)
+        )
+        self._xf = self._exit_stack.enter_context(
+            etree.xmlfile(stream, encoding='UTF-8')
+        )
+        self._xf.write_declaration(standalone=True)
+        document_elm = document.element
+        body = self._body = document_elm.body
+        self._exit_stack.enter_context(self._xf.element(
+            document_elm.tag, dict(document_elm.attrib),
+            nsmap=document_elm.nsmap
+        ))
+        for child in document_elm:
+            if child is body:
+                break
+            self._xf.write(child)
+        self._exit_stack.enter_context(
+            self._xf.element(body.tag, dict(body.attrib))
+        )
+        self._closed = False
+        self._flush()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type is None:
+            self.close()
+        elif not self._closed:
+            self._closed = True
+            self._exit_stack.__exit__(exc_type, exc_value, traceback)
+
+    def add_page_break(self):
+        """Return newly |Paragraph| object containing only a page break."""
+        self._flush()
+        return self._document.add_page_break()
+
+    def add_paragraph(self, text='', style=None):
+        """
+        Return a paragraph newly added to the end of the document, as
+        :meth:`Document.add_paragraph` does.
+        """
+        self._flush()
+        return self._document.add_paragraph(text, style)
+
+    def add_picture(self, image_path_or_stream, width=None, height=None):
+        """
+        Return a new picture shape added in its own paragraph at the end of
+        the document, as :meth:`Document.add_picture` does.
+        """
+        self._flush()
+        return self._document.add_picture(image_path_or_stream, width, height)
+
+    def add_pictures(self, images, width=None, height=None, workers=None):
+        """
+        Return a list of new picture shapes, each added in its own paragraph
+        at the end of the document, as :meth:`Document.add_pictures` does.
+        """
+        self._flush()
+        return self._document.add_pictures(images, width, height, workers)
+
+    def add_section(self, start_type=WD_SECTION.NEW_PAGE):
+        """
+        Return a |Section| object representing a new section added at the end
+        of the document, as :meth:`Document.add_section` does.
+        """
+        self._flush()
+        return self._document.add_section(start_type)
+
+    def add_table(self, rows, cols, style=None):
+        """
+        Return a table newly added to the end of the document, as
+        :meth:`Document.add_table` does.
+        """
+        self._flush()
+        return self._document.add_table(rows, cols, style)
+
+    def add_table_from_rows(self, rows, style=None, header=None):
+        """
+        Return a table newly added to the end of the document, as
+        :meth:`Document.add_table_from_rows` does.
+        """
+        self._flush()
+        return self._document.add_table_from_rows(rows, style, header)
+
+    def close(self):
+        """
+        Write the remaining content and the rest of the package, then close
+        the file. Nothing can be added once the stream is closed.
+        """
+        if self._closed:
+            return
+        self._flush()
+        sectPr = self._body.sectPr
+        if sectPr is not None:
+            self._xf.write(sectPr)
+        self._closed = True
+        self._exit_stack.close()
+
+    def _flush(self):
+        """
+        Write the block items in the document body to the package and remove
+        them from the body. The final `w:sectPr` stays until close, it is
+        what later sections and block widths are computed from.
+        """
+        if self._closed:
+            raise ValueError('document stream is closed')
+        body, part = self._body, self._document.part
+        for element in list(body):
+            if element.tag == qn('w:sectPr'):
+                continue
+            self._xf.write(element)
+            part.reserve_ids(element)
+            body.remove(element)
+        part.reset_section_index()
+
+
 class _Body(BlockItemContainer):
     """
     Proxy for ``<w:body>`` element in this document, having primarily a
@@ -249,4 +479,5 @@ class _Body(BlockItemContainer):
         preserved.
         """
         self._body.clear_content()
+        self.part.reset_section_index()
         return self
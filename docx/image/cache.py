@@ -0,0 +1,161 @@
+# encoding: utf-8
+
+"""
+Process-wide cache of parsed images, shared by all documents.
+"""
+
+from __future__ import absolute_import, division, print_function
+
+from collections import OrderedDict
+import os
+import threading
+
+from ..compat import is_string
+from .image import Image, _read_and_hash
+
+
+class ImageCache(object):
+    """
+    Size-bounded, least-recently-used cache of |Image| objects, each holding
+    the blob of an image file and the metadata parsed from its header. An
+    image file is keyed by its absolute path, modification time and size,
+    so a cached image is reused without reading the file at all until the
+    file changes. An image stream is keyed by the SHA1 hash of its content,
+    so it is read and hashed but its header is not parsed again. Safe to
+    share between threads.
+
+    ``docx.image.cache.image_cache`` is the cache used when a picture is
+    added to any document. It holds images for the life of the process, so
+    it is off by default, with a :attr:`max_bytes` of ``0``. A batch run
+    adding the same images to many documents turns it on by setting
+    :attr:`max_bytes`, e.g. to ``64 * 1024 * 1024``, and off again by
+    setting it back to ``0``, which also releases the cached images. Its
+    :attr:`hits` and :attr:`misses` counters show how well it is working.
+    """
+    def __init__(self, max_bytes=64*1024*1024):
+        super(ImageCache, self).__init__()
+        self._max_bytes = max_bytes
+        self._images = OrderedDict()
+        self._size = 0
+        self._hits = 0
+        self._misses = 0
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._images)
+
+    def clear(self):
+        """
+        Forget all cached images and reset the hit and miss counters.
+        """
+        with self._lock:
+            self._images.clear()
+            self._size = 0
+            self._hits = self._misses = 0
+
+    @property
+    def hits(self):
+        """
+        The number of images found in this cache since it was created or
+        last cleared.
+        """
+        return self._hits
+
+    def image(self, image_descriptor):
+        """
+        Return the |Image| loaded from *image_descriptor*, a path or
+        file-like object, as :meth:`.Image.from_file` does, reusing the
+        cached one when the same image has been loaded before. The image is
+        simply loaded when :attr:`max_bytes` is ``0``.
+        """
+        if not self._max_bytes:
+            return Image.from_file(image_descriptor)
+
+        if is_string(image_descriptor):
+            path = os.path.abspath(image_descriptor)
+            stat = os.stat(path)
+            key = (path, stat.st_mtime_ns, stat.st_size)
+            image = self._get(key)
+            if image is None:
+                image = Image.from_file(image_descriptor)
+                self._put(key, image)
+            return image
+
+        stream = image_descriptor
+        stream.seek(0)
+        blob, sha1 = _read_and_hash(stream)
+        image = self._get(sha1)
+        if image is None:
+            image = Image._from_stream(stream, blob, None, sha1)
+            self._put(sha1, image)
+        return image
+
+    @property
+    def max_bytes(self):
+        """
+        Read/write. The most bytes the blobs of the cached images may take
+        up together. Lowering it discards least recently used images as
+        needed.
+        """
+        return self._max_bytes
+
+    @max_bytes.setter
+    def max_bytes(self, value):
+        with self._lock:
+            self._max_bytes = value
+            self._trim()
+
+    @property
+    def misses(self):
+        """
+        The number of images loaded because they were not found in this
+        cache since it was created or last cleared.
+        """
+        return self._misses
+
+    @property
+    def size(self):
+        """
+        The total number of bytes in the blobs of the cached images.
+        """
+        return self._size
+
+    def _get(self, key):
+        """
+        Return the image cached under *key*, marking it most recently used,
+        or |None| if there isn't one.
+        """
+        with self._lock:
+            image = self._images.get(key)
+            if image is None:
+                self._misses += 1
+                return None
+            self._images.move_to_end(key)
+            self._hits += 1
+            return image
+
+    def _put(self, key, image):
+        """
+        Cache *image* under *key*, discarding the least recently used images
+        as needed to keep the total blob size within :attr:`max_bytes`. An
+        image larger than that is not cached.
+        """
+        image_size = len(image.blob)
+        with self._lock:
+            if image_size > self._max_bytes or key in self._images:
+                return
+            self._images[key] = image
+            self._size += image_size
+            self._trim()
+
+    def _trim(self):
+        """
+        Discard least recently used images until the total blob size is
+        within :attr:`max_bytes`. The caller must hold the lock.
+        """
+        while self._size > self._max_bytes:
+            _, evicted = self._images.popitem(last=False)
+            self._size -= len(evicted.blob)
+
+
+image_cache = ImageCache(max_bytes=0)
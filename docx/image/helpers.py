@@ -2,6 +2,10 @@
 
 from __future__ import absolute_import, division, print_function
 
+import mmap
+import weakref
+
+from contextlib import contextmanager
 from struct import Struct
 
 from .exceptions import UnexpectedEndOfFileError
@@ -16,6 +20,9 @@ class StreamReader(object):
     Wraps a file-like object to provide access to structured data from a
     binary file. Byte-order is configurable. *base_offset* is added to any
     base value provided to calculate actual location for reads.
+
+    Values are unpacked directly from :attr:`buffer`, the bytes of the whole
+    stream, rather than by seeking and reading the stream for each one.
     """
     def __init__(self, stream, byte_order, base_offset=0):
         super(StreamReader, self).__init__()
@@ -24,6 +31,21 @@ class StreamReader(object):
             LITTLE_ENDIAN if byte_order == LITTLE_ENDIAN else BIG_ENDIAN
         )
         self._base_offset = base_offset
+        self._buffer = None
+        self._short = _structs[self._byte_order + 'H']
+        self._long = _structs[self._byte_order + 'L']
+
+    @property
+    def buffer(self):
+        """
+        The bytes of the wrapped stream, as a bytes-like object supporting
+        ``find()`` and slicing. This is the stream's own buffer for an
+        in-memory stream and a read-only memory map for a file where
+        possible, so the stream is read at most once.
+        """
+        if self._buffer is None:
+            self._buffer = _buffer_of(self._stream)
+        return self._buffer
 
     def read(self, count):
         """
@@ -34,40 +56,31 @@ class StreamReader(object):
     def read_byte(self, base, offset=0):
         """
         Return the int value of the byte at the file position defined by
-        self._base_offset + *base* + *offset*. If *base* is None, the byte is
-        read from the current position in the stream.
+        self._base_offset + *base* + *offset*.
         """
-        fmt = 'B'
-        return self._read_int(fmt, base, offset)
+        return self._unpack_item(_structs['B'], base, offset)
 
     def read_long(self, base, offset=0):
         """
         Return the int value of the four bytes at the file position defined by
-        self._base_offset + *base* + *offset*. If *base* is None, the long is
-        read from the current position in the stream. The endian setting of
-        this instance is used to interpret the byte layout of the long.
+        self._base_offset + *base* + *offset*. The endian setting of this
+        instance is used to interpret the byte layout of the long.
         """
-        fmt = '<L' if self._byte_order is LITTLE_ENDIAN else '>L'
-        return self._read_int(fmt, base, offset)
+        return self._unpack_item(self._long, base, offset)
 
     def read_short(self, base, offset=0):
         """
         Return the int value of the two bytes at the file position determined
         by *base* and *offset*, similarly to ``read_long()`` above.
         """
-        fmt = b'<H' if self._byte_order is LITTLE_ENDIAN else b'>H'
-        return self._read_int(fmt, base, offset)
+        return self._unpack_item(self._short, base, offset)
 
     def read_str(self, char_count, base, offset=0):
         """
         Return a string containing the *char_count* bytes at the file
         position determined by self._base_offset + *base* + *offset*.
         """
-        def str_struct(char_count):
-            format_ = '%ds' % char_count
-            return Struct(format_)
-        struct = str_struct(char_count)
-        chars = self._unpack_item(struct, base, offset)
+        chars = self._read_bytes(char_count, base, offset)
         unicode_str = chars.decode('UTF-8')
         return unicode_str
 
@@ -82,16 +95,66 @@ class StreamReader(object):
         return self._stream.tell()
 
     def _read_bytes(self, byte_count, base, offset):
-        self.seek(base, offset)
-        bytes_ = self._stream.read(byte_count)
+        location = self._base_offset + base + offset
+        bytes_ = self.buffer[location:location+byte_count]
         if len(bytes_) < byte_count:
             raise UnexpectedEndOfFileError
-        return bytes_
-
-    def _read_int(self, fmt, base, offset):
-        struct = Struct(fmt)
-        return self._unpack_item(struct, base, offset)
+        return bytes(bytes_)
 
     def _unpack_item(self, struct, base, offset):
-        bytes_ = self._read_bytes(struct.size, base, offset)
-        return struct.unpack(bytes_)[0]
+        location = self._base_offset + base + offset
+        buffer = self._buffer
+        if buffer is None:
+            buffer = self.buffer
+        if location + struct.size > len(buffer):
+            raise UnexpectedEndOfFileError
+        return struct.unpack_from(buffer, location)[0]
+
+
+_structs = dict(
+    (fmt, Struct(fmt)) for fmt in ('B', '<H', '>H', '<L', '>L')
+)
+
+
+@contextmanager
+def closing_buffer(stream):
+    """
+    Context manager closing the memory map made for the bytes of *stream*,
+    if a |StreamReader| made one, when the block exits. Readers of *stream*
+    cannot be used after that.
+    """
+    try:
+        yield stream
+    finally:
+        mapped = _mapped_streams.pop(stream, None)
+        if mapped is not None:
+            mapped.close()
+
+
+def _buffer_of(stream):
+    """
+    Return the bytes of *stream*, without copying them where possible. A file
+    is memory mapped once, the map being shared by all readers of *stream*
+    until it is closed by :func:`closing_buffer`.
+    """
+    getvalue = getattr(stream, 'getvalue', None)
+    if getvalue is not None:
+        return getvalue()
+    mapped = _mapped_streams.get(stream)
+    if mapped is not None:
+        return mapped
+    try:
+        mapped = mmap.mmap(stream.fileno(), 0, access=mmap.ACCESS_READ)
+    except (AttributeError, EnvironmentError, ValueError):
+        pass
+    else:
+        try:
+            _mapped_streams[stream] = mapped
+            return mapped
+        except TypeError:
+            mapped.close()
+    stream.seek(0)
+    return stream.read()
+
+
+_mapped_streams = weakref.WeakKeyDictionary()
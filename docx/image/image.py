@@ -9,9 +9,12 @@ from __future__ import absolute_import, division, print_function
 
 import hashlib
 import os
+import tempfile
 
 from ..compat import BytesIO, is_string
+from ..opc.phys_pkg import FileBlob
 from .exceptions import UnrecognizedImageError
+from .helpers import closing_buffer
 from ..shared import Emu, Inches, lazyproperty
 
 
@@ -20,11 +23,12 @@ class Image(object):
     Graphical image stream such as JPEG, PNG, or GIF with properties and
     methods required by ImagePart.
     """
-    def __init__(self, blob, filename, image_header):
+    def __init__(self, blob, filename, image_header, sha1=None):
         super(Image, self).__init__()
         self._blob = blob
         self._filename = filename
         self._image_header = image_header
+        self._sha1 = sha1
 
     @classmethod
     def from_blob(cls, blob):
@@ -36,29 +40,41 @@ class Image(object):
         return cls._from_stream(stream, blob)
 
     @classmethod
-    def from_file(cls, image_descriptor):
+    def from_file(cls, image_descriptor, spool=False):
         """
         Return a new |Image| subclass instance loaded from the image file
         identified by *image_descriptor*, a path or file-like object.
+        The image is read in chunks and hashed as it is read, so its SHA1
+        digest costs no further pass over the bytes.
+
+        When *spool* is |True|, the bytes of the image are not kept in
+        memory. The image refers to the file at the path instead, or to
+        a temporary spool file the stream is copied to, through its
+        :attr:`file_blob`.
         """
+        if spool:
+            return cls._spooled(image_descriptor)
         if is_string(image_descriptor):
             path = image_descriptor
             with open(path, 'rb') as f:
-                blob = f.read()
-                stream = BytesIO(blob)
+                blob, sha1 = _read_and_hash(f)
+            stream = BytesIO(blob)
             filename = os.path.basename(path)
         else:
             stream = image_descriptor
             stream.seek(0)
-            blob = stream.read()
+            blob, sha1 = _read_and_hash(stream)
             filename = None
-        return cls._from_stream(stream, blob, filename)
+        return cls._from_stream(stream, blob, filename, sha1)
 
     @property
     def blob(self):
         """
-        The bytes of the image 'file'
+        The bytes of the image 'file'. They are read from disk each time for
+        a spooled image.
         """
+        if isinstance(self._blob, FileBlob):
+            return self._blob.load()
         return self._blob
 
     @property
@@ -79,6 +95,16 @@ class Image(object):
         """
         return os.path.splitext(self._filename)[1][1:]
 
+    @property
+    def file_blob(self):
+        """
+        The |FileBlob| referring to the bytes of this image on disk when it
+        was loaded with *spool*, or |None| when they are held in memory.
+        """
+        if isinstance(self._blob, FileBlob):
+            return self._blob
+        return None
+
     @property
     def filename(self):
         """
@@ -160,15 +186,17 @@ class Image(object):
 
         return Emu(width), Emu(height)
 
-    @lazyproperty
+    @property
     def sha1(self):
         """
         SHA1 hash digest of the image blob
         """
-        return hashlib.sha1(self._blob).hexdigest()
+        if self._sha1 is None:
+            self._sha1 = hashlib.sha1(self._blob).hexdigest()
+        return self._sha1
 
     @classmethod
-    def _from_stream(cls, stream, blob, filename=None):
+    def _from_stream(cls, stream, blob, filename=None, sha1=None):
         """
         Return an instance of the |Image| subclass corresponding to the
         format of the image in *stream*.
@@ -176,7 +204,70 @@ class Image(object):
         image_header = _ImageHeaderFactory(stream)
         if filename is None:
             filename = 'image.%s' % image_header.default_ext
-        return cls(blob, filename, image_header)
+        return cls(blob, filename, image_header, sha1)
+
+    @classmethod
+    def _spooled(cls, image_descriptor):
+        """
+        Return an instance of the |Image| subclass corresponding to the
+        format of the image identified by *image_descriptor*, holding
+        a |FileBlob| rather than its bytes. A stream is copied to a spool
+        file, removed once the image and any part made from it are gone.
+        """
+        if is_string(image_descriptor):
+            path = os.path.abspath(image_descriptor)
+            sha1 = hashlib.sha1()
+            with open(path, 'rb') as f:
+                for chunk in iter_chunks(f):
+                    sha1.update(chunk)
+                image_header = _ImageHeaderFactory(f)
+            filename = os.path.basename(path)
+            return cls(
+                FileBlob(path), filename, image_header, sha1.hexdigest()
+            )
+
+        stream = image_descriptor
+        stream.seek(0)
+        fd, path = tempfile.mkstemp(prefix='docx-image-')
+        file_blob = FileBlob(path, delete=True)
+        with os.fdopen(fd, 'w+b') as f:
+            sha1 = _read_and_hash(stream, spool_file=f)[1]
+            image_header = _ImageHeaderFactory(f)
+        filename = 'image.%s' % image_header.default_ext
+        return cls(file_blob, filename, image_header, sha1)
+
+
+def iter_chunks(stream, chunk_size=1024*1024):
+    """
+    Generate the bytes remaining in the binary file-like object *stream*
+    in chunks of up to *chunk_size* bytes.
+    """
+    while True:
+        chunk = stream.read(chunk_size)
+        if not chunk:
+            return
+        yield chunk
+
+
+def _read_and_hash(stream, spool_file=None):
+    """
+    Return a `(blob, sha1)` 2-tuple of the bytes remaining in *stream* and
+    their SHA1 hex digest, hashing each chunk as it is read. When
+    *spool_file* is given, each chunk is written to it rather than kept and
+    *blob* is |None|.
+    """
+    sha1 = hashlib.sha1()
+    chunks = []
+    for chunk in iter_chunks(stream):
+        sha1.update(chunk)
+        if spool_file is None:
+            chunks.append(chunk)
+        else:
+            spool_file.write(chunk)
+    if spool_file is not None:
+        spool_file.flush()
+        return None, sha1.hexdigest()
+    return b''.join(chunks), sha1.hexdigest()
 
 
 def _ImageHeaderFactory(stream):
@@ -195,7 +286,8 @@ def _ImageHeaderFactory(stream):
         end = offset + len(signature_bytes)
         found_bytes = header[offset:end]
         if found_bytes == signature_bytes:
-            return cls.from_stream(stream)
+            with closing_buffer(stream):
+                return cls.from_stream(stream)
     raise UnrecognizedImageError
 
 
@@ -343,6 +343,7 @@ class NAMESPACE(object):
         'http://schemas.openxmlformats.org/drawingml/2006/wordprocessingDraw'
         'ing'
     )
+    OFC_OFFICE = 'urn:schemas-microsoft-com:office:office'
     OFC_RELATIONSHIPS = (
         'http://schemas.openxmlformats.org/officeDocument/2006/relationships'
     )
@@ -9,6 +9,8 @@ the package related custom element classes.
 
 from __future__ import absolute_import, print_function, unicode_literals
 
+from collections import Counter
+
 from lxml import etree
 
 from .constants import NAMESPACE as NS, RELATIONSHIP_TARGET_MODE as RTM
@@ -25,11 +27,40 @@ nsmap = {
     'r':  NS.OFC_RELATIONSHIPS,
 }
 
+# relationship references in part XML, every attribute in the relationships
+# namespace (r:id, r:embed, r:link, ...) and the legacy VML o:relid
+_rel_refs_xpath = etree.XPath(
+    '//@r:*|//@o:relid',
+    namespaces={'o': NS.OFC_OFFICE, 'r': NS.OFC_RELATIONSHIPS}
+)
+
+# number of those references to the rId in variable `rId`
+_rel_ref_count_xpath = etree.XPath(
+    'count(//@r:*[.=$rId]|//@o:relid[.=$rId])',
+    namespaces={'o': NS.OFC_OFFICE, 'r': NS.OFC_RELATIONSHIPS}
+)
+
 
 # ===========================================================================
 # functions
 # ===========================================================================
 
+def count_rel_refs(part_elm):
+    """
+    Return a |Counter| of the references to each rId in the XML of
+    *part_elm*, found in one pass over the tree.
+    """
+    return Counter(str(rId) for rId in _rel_refs_xpath(part_elm))
+
+
+def count_refs_to_rel(part_elm, rId):
+    """
+    Return the number of references to *rId* in the XML of *part_elm*. The
+    tree is searched in C, without building a count for every rId.
+    """
+    return int(_rel_ref_count_xpath(part_elm, rId=rId))
+
+
 def parse_xml(text):
     """
     ``etree.fromstring()`` replacement that uses oxml parser
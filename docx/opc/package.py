@@ -7,11 +7,12 @@ from __future__ import absolute_import, division, print_function, unicode_litera
 from docx.opc.constants import RELATIONSHIP_TYPE as RT
 from docx.opc.packuri import PACKAGE_URI, PackURI
 from docx.opc.part import PartFactory
+from docx.opc.phys_pkg import LazyBlob
 from docx.opc.parts.coreprops import CorePropertiesPart
 from docx.opc.pkgreader import PackageReader
 from docx.opc.pkgwriter import PackageWriter
 from docx.opc.rel import Relationships
-from docx.opc.shared import lazyproperty
+from docx.opc.shared import lazyproperty, walk_rel_graph
 
 
 class OpcPackage(object):
@@ -33,6 +34,34 @@ class OpcPackage(object):
         # subclass
         pass
 
+    def clone(self):
+        """
+        Return a new package of this type that is an independent copy of this
+        one, for example to make many documents from one template without
+        opening it each time. Each part is copied using its
+        :meth:`~.Part.clone` method and the relationship graph is rebuilt
+        between the copies.
+        """
+        package = self.__class__()
+        clones = dict(
+            (part, part.clone(package)) for part in self.iter_parts()
+        )
+
+        def copy_rels(source, clone):
+            for rel in source.rels.values():
+                target = rel.target_ref if rel.is_external else (
+                    clones[rel.target_part]
+                )
+                clone.load_rel(rel.reltype, target, rel.rId, rel.is_external)
+
+        copy_rels(self, package)
+        for part, clone in clones.items():
+            copy_rels(part, clone)
+        for clone in clones.values():
+            clone.after_unmarshal()
+        package.after_unmarshal()
+        return package
+
     @property
     def core_properties(self):
         """
@@ -46,43 +75,31 @@ class OpcPackage(object):
         Generate exactly one reference to each relationship in the package by
         performing a depth-first traversal of the rels graph.
         """
-        def walk_rels(source, visited=None):
-            visited = [] if visited is None else visited
-            for rel in source.rels.values():
-                yield rel
-                if rel.is_external:
-                    continue
-                part = rel.target_part
-                if part in visited:
-                    continue
-                visited.append(part)
-                new_source = part
-                for rel in walk_rels(new_source, visited):
-                    yield rel
-
-        for rel in walk_rels(self):
+        for rel, _, _ in self._walk_rel_graph():
             yield rel
 
+    def close(self):
+        """
+        Close the package file that the parts of this package not loaded yet
+        are read from, when it was opened lazily. Those parts can't be loaded
+        afterward. Does nothing for a package read whole.
+        """
+        phys_readers = set()
+        for part in self.iter_parts():
+            blob = part._blob
+            if isinstance(blob, LazyBlob) and blob.phys_reader is not None:
+                phys_readers.add(blob.phys_reader)
+        for phys_reader in phys_readers:
+            phys_reader.close()
+
     def iter_parts(self):
         """
         Generate exactly one reference to each of the parts in the package by
         performing a depth-first traversal of the rels graph.
         """
-        def walk_parts(source, visited=list()):
-            for rel in source.rels.values():
-                if rel.is_external:
-                    continue
-                part = rel.target_part
-                if part in visited:
-                    continue
-                visited.append(part)
+        for _, part, _ in self._walk_rel_graph():
+            if part is not None:
                 yield part
-                new_source = part
-                for part in walk_parts(new_source, visited):
-                    yield part
-
-        for part in walk_parts(self):
-            yield part
 
     def load_rel(self, reltype, target, rId, is_external=False):
         """
@@ -120,12 +137,18 @@ class OpcPackage(object):
                 return PackURI(candidate_partname)
 
     @classmethod
-    def open(cls, pkg_file):
+    def open(cls, pkg_file, lazy=False):
         """
         Return an |OpcPackage| instance loaded with the contents of
         *pkg_file*.
+
+        When *lazy* is |True|, part blobs are left in the package file until
+        something asks for them and XML parts are parsed the first time
+        their element is used, so the cost of opening depends on the parts
+        actually used rather than on the size of the package. *pkg_file*
+        must remain available and unchanged while the package is in use.
         """
-        pkg_reader = PackageReader.from_file(pkg_file)
+        pkg_reader = PackageReader.from_file(pkg_file, lazy)
         package = cls()
         Unmarshaller.unmarshal(pkg_reader, package, PartFactory)
         return package
@@ -146,6 +169,21 @@ class OpcPackage(object):
         """
         return [part for part in self.iter_parts()]
 
+    def prune_unreferenced_parts(self):
+        """
+        Remove the relationships of each part that nothing in its XML refers
+        to, like those to images and hyperlinks whose XML has been deleted,
+        and return a list of the parts no longer reachable as a result, which
+        are no longer in the package. Intended to be called once before
+        saving, it counts the references in each part in one pass over its
+        XML. Only parts changed since they were loaded are examined.
+        """
+        parts = self.parts
+        for part in parts:
+            part.drop_unreferenced_rels()
+        remaining_parts = set(self.iter_parts())
+        return [part for part in parts if part not in remaining_parts]
+
     def relate_to(self, part, reltype):
         """
         Return rId key of relationship to *part*, from the existing
@@ -162,14 +200,40 @@ class OpcPackage(object):
         """
         return Relationships(PACKAGE_URI.baseURI)
 
-    def save(self, pkg_file):
+    def save(self, pkg_file, compression=None, workers=None):
         """
         Save this package to *pkg_file*, where *file* can be either a path to
-        a file (a string) or a file-like object.
-        """
-        for part in self.parts:
+        a file (a string) or a file-like object. *compression* is an optional
+        |CompressionPolicy| choosing the zip compression used for each part
+        by its content type. All parts are deflated at the default level
+        when it is omitted. Parts are serialized and compressed on
+        *workers* threads when *workers* is greater than 1.
+        """
+        parts = self.parts
+        for part in parts:
             part.before_marshal()
-        PackageWriter.write(pkg_file, self.rels, self.parts)
+        PackageWriter.write(pkg_file, self.rels, parts, compression, workers)
+
+    def save_streaming(self, pkg_file, part, compression=None):
+        """
+        Return a context manager that saves this package to *pkg_file* while
+        the XML of *part* is written piecemeal to the writable binary stream
+        it provides, for a part too large to be held in memory. The other
+        parts are saved as they stand when the block exits. *compression*
+        is used as it is by :meth:`save`.
+        """
+        return PackageWriter.streaming(pkg_file, self, part, compression)
+
+    def _walk_rel_graph(self):
+        """
+        Generate a `(rel, part, part_rels)` 3-tuple for each relationship in
+        the package, as produced by |walk_rel_graph|.
+        """
+        return walk_rel_graph(
+            self.rels.values(),
+            lambda rel: rel.target_part,
+            lambda part: part.rels.values(),
+        )
 
     @property
     def _core_properties_part(self):
@@ -8,14 +8,25 @@ from __future__ import (
     absolute_import, division, print_function, unicode_literals
 )
 
+from copy import deepcopy
+
 from .compat import cls_method_fn
-from .oxml import serialize_part_xml
+from .constants import RELATIONSHIP_TYPE as RT
+from .oxml import count_refs_to_rel, count_rel_refs, serialize_part_xml
 from ..oxml import parse_xml
 from .packuri import PackURI
+from .phys_pkg import LazyBlob
 from .rel import Relationships
 from .shared import lazyproperty
 
 
+# types of relationship that exist only to be referred to by rId from the
+# XML of their source part, so are unused when nothing there refers to them
+_REFERENCED_RELTYPES = frozenset(
+    (RT.FOOTER, RT.HEADER, RT.HYPERLINK, RT.IMAGE)
+)
+
+
 class Part(object):
     """
     Base class for package parts. Provides common properties and methods, but
@@ -54,10 +65,23 @@ class Part(object):
         """
         Contents of this package part as a sequence of bytes. May be text or
         binary. Intended to be overridden by subclasses. Default behavior is
-        to return load blob.
+        to return load blob, read from the package file at this point when
+        the package was opened lazily.
         """
+        if isinstance(self._blob, LazyBlob):
+            return self._blob.load()
         return self._blob
 
+    def clone(self, package):
+        """
+        Return a copy of this part belonging to *package*, having no
+        relationships. The blob is shared with the copy rather than copied,
+        blobs being immutable.
+        """
+        return self.load(
+            self._partname, self._content_type, self._blob, package
+        )
+
     @property
     def content_type(self):
         """
@@ -69,11 +93,33 @@ class Part(object):
         """
         Remove the relationship identified by *rId* if its reference count
         is less than 2. Relationships with a reference count of 0 are
-        implicit relationships.
+        implicit relationships. The references are counted in the XML of this
+        part as it stands, with an XPath evaluated in C.
         """
-        if self._rel_ref_count(rId) < 2:
+        if count_refs_to_rel(self._element, rId) < 2:
             del self.rels[rId]
 
+    def drop_unreferenced_rels(self):
+        """
+        Remove each relationship of a type only ever referred to by rId, like
+        an image or hyperlink, that nothing in this part refers to. A part
+        without XML has no such relationships, so this does nothing unless
+        overridden by a subclass.
+        """
+        pass
+
+    @property
+    def is_modified(self):
+        """
+        |True| if this part may have changed since it was loaded, including
+        when it was newly created rather than loaded. Only a lazily-loaded
+        part whose content has not been brought into memory in changeable
+        form, like the parsed element of an XML part, is known to be
+        unmodified. Such a part is written by copying it from the package it
+        was loaded from.
+        """
+        return not isinstance(self._blob, LazyBlob)
+
     @classmethod
     def load(cls, partname, content_type, blob, package):
         return cls(partname, content_type, blob, package)
@@ -155,14 +201,6 @@ class Part(object):
         rel = self.rels[rId]
         return rel.target_ref
 
-    def _rel_ref_count(self, rId):
-        """
-        Return the count of references in this part's XML to the relationship
-        identified by *rId*.
-        """
-        rIds = self._element.xpath('//@r:id')
-        return len([_rId for _rId in rIds if _rId == rId])
-
 
 class PartFactory(object):
     """
@@ -219,6 +257,32 @@ class XmlPart(Part):
     def blob(self):
         return serialize_part_xml(self._element)
 
+    @property
+    def _element(self):
+        """
+        The root XML element of this part. When the part was loaded lazily,
+        its blob is parsed on first access and then released.
+        """
+        if self._parsed_element is None and self._blob is not None:
+            self._parsed_element = parse_xml(self._blob.load())
+            self._blob = None
+        return self._parsed_element
+
+    @_element.setter
+    def _element(self, element):
+        self._parsed_element = element
+
+    def clone(self, package):
+        """
+        Return a copy of this part belonging to *package*, having no
+        relationships. The copy gets a deep copy of the XML of this part,
+        which is much faster than parsing it again.
+        """
+        return self.__class__(
+            self._partname, self._content_type, deepcopy(self._element),
+            package
+        )
+
     @property
     def element(self):
         """
@@ -226,8 +290,36 @@ class XmlPart(Part):
         """
         return self._element
 
+    def drop_unreferenced_rels(self):
+        """
+        Remove each relationship of a type only ever referred to by rId, like
+        an image or hyperlink, that nothing in the XML of this part refers to.
+        The references are counted afresh in one pass over the XML, catching
+        any removed without the relationship being dropped. A part unchanged
+        since it was lazily loaded is left as it is, without parsing it.
+        """
+        if not self.is_modified:
+            return
+        rel_ref_counts = count_rel_refs(self._element)
+        unreferenced_rIds = [
+            rel.rId for rel in self.rels.values()
+            if rel.reltype in _REFERENCED_RELTYPES
+            and not rel_ref_counts[rel.rId]
+        ]
+        for rId in unreferenced_rIds:
+            del self.rels[rId]
+
     @classmethod
     def load(cls, partname, content_type, blob, package):
+        """
+        Return a new instance of this part loaded from *blob*. Parsing is
+        deferred until the element is first used when *blob* is
+        a |LazyBlob|.
+        """
+        if isinstance(blob, LazyBlob):
+            xml_part = cls(partname, content_type, None, package)
+            xml_part._blob = blob
+            return xml_part
         element = parse_xml(blob)
         return cls(partname, content_type, element, package)
 
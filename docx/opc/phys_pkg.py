@@ -6,15 +6,191 @@ Provides a general interface to a *physical* OPC package, such as a zip file.
 
 from __future__ import absolute_import
 
+from contextlib import closing
 import os
+import shutil
+import struct
+import weakref
+import zlib
 
-from zipfile import ZipFile, is_zipfile, ZIP_DEFLATED
+from zipfile import (
+    _FH_EXTRA_FIELD_LENGTH,
+    _FH_FILENAME_LENGTH,
+    _FH_SIGNATURE,
+    BadZipfile,
+    is_zipfile,
+    sizeFileHeader,
+    stringFileHeader,
+    structFileHeader,
+    ZIP_DEFLATED,
+    ZIP_STORED,
+    ZipFile,
+    ZipInfo,
+)
 
 from .compat import is_string
+from .constants import CONTENT_TYPE as CT
 from .exceptions import PackageNotFoundError
 from .packuri import CONTENT_TYPES_URI
 
 
+# modification time of each member written, the earliest a zip can express
+_ZIP_EPOCH = (1980, 1, 1, 0, 0, 0)
+
+
+class CompressionPolicy(object):
+    """
+    Zip compression to use for each member of a package being written, chosen
+    by the content type of the part it holds.
+
+    Members are compressed using *compress_type* at *compresslevel* unless
+    their content type appears in *content_types*, a mapping of content type
+    to a `(compress_type, compresslevel)` 2-tuple. *compress_type* is one of
+    the `zipfile` constants like `ZIP_DEFLATED` or `ZIP_STORED` and
+    a *compresslevel* of |None| means the `zipfile` default for that
+    compress type. Rels items and the content types item are compressed by
+    the rules for their own content types, `CT.OPC_RELATIONSHIPS` and
+    `CT.XML` respectively.
+    """
+    def __init__(self, compress_type=ZIP_DEFLATED, compresslevel=None,
+                 content_types=None):
+        super(CompressionPolicy, self).__init__()
+        self._compression = (compress_type, compresslevel)
+        self._content_types = dict(content_types or {})
+
+    def compression_for(self, content_type):
+        """
+        Return the `(compress_type, compresslevel)` 2-tuple to use for
+        a member holding content of *content_type*.
+        """
+        return self._content_types.get(content_type, self._compression)
+
+    @classmethod
+    def store_images(cls, compresslevel=None):
+        """
+        Return a policy that stores images already compressed by their own
+        format, like JPEG and PNG, without compressing them again and
+        deflates all other members at *compresslevel*. Use a low level, like
+        1, to favor save speed over file size.
+        """
+        stored = (ZIP_STORED, None)
+        return cls(ZIP_DEFLATED, compresslevel, {
+            CT.GIF: stored, CT.JPEG: stored, CT.MS_PHOTO: stored,
+            CT.PNG: stored,
+        })
+
+
+class LazyBlob(object):
+    """
+    Reference to the blob of a member of a physical package that is read
+    from the package only when :meth:`load` is called. Used in place of the
+    blob itself when a package is opened lazily, so the (possibly large)
+    contents of a part need not be read until something asks for them. The
+    physical package must remain open, and unchanged, for as long as any of
+    its lazy blobs are in use.
+    """
+    def __init__(self, phys_reader, pack_uri):
+        super(LazyBlob, self).__init__()
+        self._phys_reader = phys_reader
+        self._pack_uri = pack_uri
+
+    def load(self):
+        """
+        Return the bytes of the referenced member, read from the physical
+        package. The bytes are not cached, each call reads them afresh.
+        """
+        return self._phys_reader.blob_for(self._pack_uri)
+
+    def open(self):
+        """
+        Return a readable binary file-like object providing the bytes of the
+        referenced member as they are read from the physical package, so
+        a large member can be processed without holding it in memory. The
+        caller is responsible for closing it.
+        """
+        return self._phys_reader.stream_for(self._pack_uri)
+
+    @property
+    def phys_reader(self):
+        """
+        The physical package reader this blob is read from, |None| for
+        a blob not read from a package.
+        """
+        return self._phys_reader
+
+    @property
+    def raw_member(self):
+        """
+        A `(zinfo, raw_bytes)` 2-tuple for the referenced member, where
+        *raw_bytes* is its still-compressed content, suitable for copying the
+        member into another zip archive without recompressing it. |None|
+        when the physical package is not a zip archive.
+        """
+        return self._phys_reader.raw_member_for(self._pack_uri)
+
+    def reads_from(self, pkg_file):
+        """
+        Return |True| if this blob is read from *pkg_file*, such that
+        writing a package to *pkg_file* would destroy it.
+        """
+        return self._phys_reader.reads_from(pkg_file)
+
+
+class FileBlob(LazyBlob):
+    """
+    Reference to a blob held in a file on disk at *path* rather than in
+    memory, read only when :meth:`load` or :meth:`open` is called, just as
+    |LazyBlob| references a member of a package. Used for an image spooled
+    to disk so a document having many large images needn't hold them all in
+    memory. The file must remain unchanged for as long as the blob is in
+    use. When *delete* is |True|, the file is a spool file owned by this
+    blob and is removed once the blob is no longer referenced.
+    """
+    def __init__(self, path, delete=False):
+        super(FileBlob, self).__init__(None, None)
+        self._path = path
+        if delete:
+            weakref.finalize(self, _remove_quietly, path)
+
+    def load(self):
+        """
+        Return the bytes of the referenced file. The bytes are not cached,
+        each call reads them afresh.
+        """
+        with open(self._path, 'rb') as f:
+            return f.read()
+
+    def open(self):
+        """
+        Return a readable binary file object on the referenced file. The
+        caller is responsible for closing it.
+        """
+        return open(self._path, 'rb')
+
+    @property
+    def path(self):
+        """
+        Path to the file holding the bytes of this blob.
+        """
+        return self._path
+
+    @property
+    def raw_member(self):
+        """
+        |None|, a file on disk has no compressed form to copy.
+        """
+        return None
+
+    def reads_from(self, pkg_file):
+        """
+        Return |True| if *pkg_file* is a path to the file this blob is read
+        from, such that writing a package to *pkg_file* would destroy it.
+        """
+        return is_string(pkg_file) and os.path.exists(pkg_file) and (
+            os.path.samefile(self._path, pkg_file)
+        )
+
+
 class PhysPkgReader(object):
     """
     Factory for physical package reader objects.
@@ -40,7 +216,7 @@ class PhysPkgWriter(object):
     """
     Factory for physical package writer objects.
     """
-    def __new__(cls, pkg_file):
+    def __new__(cls, pkg_file, compression=None):
         return super(PhysPkgWriter, cls).__new__(_ZipPkgWriter)
 
 
@@ -80,6 +256,26 @@ class _DirPkgReader(PhysPkgReader):
         """
         return self.blob_for(CONTENT_TYPES_URI)
 
+    def raw_member_for(self, pack_uri):
+        """
+        Return |None|, the members of a package directory are not
+        compressed so there is no raw form to copy.
+        """
+        return None
+
+    def reads_from(self, pkg_file):
+        """
+        Return |False|, a package directory is never the target of a write.
+        """
+        return False
+
+    def reopen(self):
+        """
+        Provides interface consistency with |ZipFileSystem|, but does
+        nothing, a package directory is never rewritten.
+        """
+        pass
+
     def rels_xml_for(self, source_uri):
         """
         Return rels item XML for source with *source_uri*, or None if the
@@ -91,6 +287,13 @@ class _DirPkgReader(PhysPkgReader):
             rels_xml = None
         return rels_xml
 
+    def stream_for(self, pack_uri):
+        """
+        Return a readable binary file object on the file corresponding to
+        *pack_uri* in package directory.
+        """
+        return open(os.path.join(self._path, pack_uri.membername), 'rb')
+
 
 class _ZipPkgReader(PhysPkgReader):
     """
@@ -98,6 +301,7 @@ class _ZipPkgReader(PhysPkgReader):
     """
     def __init__(self, pkg_file):
         super(_ZipPkgReader, self).__init__()
+        self._pkg_file = pkg_file
         self._zipf = ZipFile(pkg_file, 'r')
 
     def blob_for(self, pack_uri):
@@ -120,6 +324,49 @@ class _ZipPkgReader(PhysPkgReader):
         """
         return self.blob_for(CONTENT_TYPES_URI)
 
+    def raw_member_for(self, pack_uri):
+        """
+        Return a `(zinfo, raw_bytes)` 2-tuple for the member corresponding to
+        *pack_uri*, *raw_bytes* being its content as stored in the archive,
+        still compressed. Returns |None| for an encrypted member, which
+        cannot be copied that way.
+        """
+        zinfo = self._zipf.getinfo(pack_uri.membername)
+        if zinfo.flag_bits & 0x01:
+            return None
+        fp = self._zipf.fp
+        fp.seek(zinfo.header_offset)
+        fheader = struct.unpack(structFileHeader, fp.read(sizeFileHeader))
+        if fheader[_FH_SIGNATURE] != stringFileHeader:
+            raise BadZipfile(
+                "Bad local file header for member '%s'" % zinfo.filename
+            )
+        fp.seek(
+            fheader[_FH_FILENAME_LENGTH] + fheader[_FH_EXTRA_FIELD_LENGTH],
+            os.SEEK_CUR
+        )
+        return zinfo, fp.read(zinfo.compress_size)
+
+    def reads_from(self, pkg_file):
+        """
+        Return |True| if this reader reads from *pkg_file*, either the same
+        stream object or a path to the same file.
+        """
+        source = self._pkg_file
+        if is_string(source) and is_string(pkg_file):
+            return os.path.exists(pkg_file) and os.path.samefile(
+                source, pkg_file
+            )
+        return source is pkg_file
+
+    def reopen(self):
+        """
+        Open the zip archive afresh, after the package file has been
+        replaced or rewritten by a package having the same members. The
+        archive must have been closed first.
+        """
+        self._zipf = ZipFile(self._pkg_file, 'r')
+
     def rels_xml_for(self, source_uri):
         """
         Return rels item XML for source with *source_uri* or None if no rels
@@ -131,14 +378,30 @@ class _ZipPkgReader(PhysPkgReader):
             rels_xml = None
         return rels_xml
 
+    def stream_for(self, pack_uri):
+        """
+        Return a readable binary file-like object that decompresses the
+        member corresponding to *pack_uri* as it is read.
+        """
+        return self._zipf.open(pack_uri.membername)
+
 
 class _ZipPkgWriter(PhysPkgWriter):
     """
-    Implements |PhysPkgWriter| interface for a zip file OPC package.
+    Implements |PhysPkgWriter| interface for a zip file OPC package. Members
+    are compressed as directed by *compression*, a |CompressionPolicy|,
+    when one is provided and are deflated otherwise.
+
+    Members are stamped with the zip epoch (1980-01-01) as their
+    modification time, as Word does, so writing the same parts always
+    produces the same bytes.
     """
-    def __init__(self, pkg_file):
+    def __init__(self, pkg_file, compression=None):
         super(_ZipPkgWriter, self).__init__()
         self._zipf = ZipFile(pkg_file, 'w', compression=ZIP_DEFLATED)
+        self._compression = (
+            CompressionPolicy() if compression is None else compression
+        )
 
     def close(self):
         """
@@ -147,9 +410,110 @@ class _ZipPkgWriter(PhysPkgWriter):
         """
         self._zipf.close()
 
-    def write(self, pack_uri, blob):
+    def compress(self, pack_uri, blob, content_type=None):
+        """
+        Return a `(zinfo, raw_bytes)` 2-tuple for *blob* compressed for
+        storage as the member corresponding to *pack_uri*, ready to be
+        written by :meth:`write_raw`. *content_type* selects the compression
+        used. The archive is not touched, so this method may be called from
+        any thread.
+        """
+        compress_type, compresslevel = self._compression.compression_for(
+            content_type
+        )
+        if compress_type == ZIP_STORED:
+            raw_bytes = blob
+        elif compress_type == ZIP_DEFLATED:
+            compressor = zlib.compressobj(
+                zlib.Z_DEFAULT_COMPRESSION if compresslevel is None
+                else compresslevel,
+                zlib.DEFLATED, -15
+            )
+            raw_bytes = compressor.compress(blob) + compressor.flush()
+        else:
+            raise ValueError(
+                "OPC package members must be stored or deflated, got compre"
+                "ss type %r" % compress_type
+            )
+        zinfo = ZipInfo(pack_uri.membername, _ZIP_EPOCH)
+        zinfo.compress_type = compress_type
+        zinfo.CRC = zlib.crc32(blob) & 0xFFFFFFFF
+        zinfo.compress_size = len(raw_bytes)
+        zinfo.file_size = len(blob)
+        return zinfo, raw_bytes
+
+    def copy(self, pack_uri, lazy_blob, content_type=None):
+        """
+        Write the member referenced by *lazy_blob* to this zip package with
+        the membername corresponding to *pack_uri*. A member of a zip
+        package is copied as-is, without being decompressed and compressed
+        again, so it keeps the compression of its source package. Any other
+        blob, like a |FileBlob|, is streamed into the member in chunks,
+        compressed as *content_type* directs, so it is never held in memory
+        whole.
+        """
+        raw_member = lazy_blob.raw_member
+        if raw_member is None:
+            with closing(lazy_blob.open()) as src:
+                with self.open(pack_uri, content_type) as dst:
+                    shutil.copyfileobj(src, dst, 1024*1024)
+            return
+        src_zinfo, raw_bytes = raw_member
+        zinfo = ZipInfo(pack_uri.membername, src_zinfo.date_time)
+        zinfo.compress_type = src_zinfo.compress_type
+        zinfo.CRC = src_zinfo.CRC
+        zinfo.compress_size = src_zinfo.compress_size
+        zinfo.file_size = src_zinfo.file_size
+        self.write_raw(zinfo, raw_bytes)
+
+    def open(self, pack_uri, content_type=None):
+        """
+        Return a writable binary file-like object that writes the member
+        corresponding to *pack_uri* to this zip package as bytes are written
+        to it, so a large member never needs to be held in memory.
+        *content_type* selects the compression type and level of the member.
+        No other member can be written until the returned object is closed.
+        """
+        compress_type, compresslevel = self._compression.compression_for(
+            content_type
+        )
+        zinfo = ZipInfo(pack_uri.membername, _ZIP_EPOCH)
+        zinfo.compress_type = compress_type
+        # ---ZipFile.open() takes the level of a member it writes from here---
+        zinfo._compresslevel = compresslevel
+        zinfo.external_attr = 0o600 << 16
+        return self._zipf.open(zinfo, 'w')
+
+    def write(self, pack_uri, blob, content_type=None):
         """
         Write *blob* to this zip package with the membername corresponding to
-        *pack_uri*.
+        *pack_uri*. *content_type* selects the compression used for the
+        member.
+        """
+        self.write_raw(*self.compress(pack_uri, blob, content_type))
+
+    def write_raw(self, zinfo, raw_bytes):
         """
-        self._zipf.writestr(pack_uri.membername, blob)
+        Append a member described by *zinfo* having the already-compressed
+        content *raw_bytes* to this zip package.
+        """
+        zipf = self._zipf
+        zinfo.external_attr = 0o600 << 16
+        zinfo.header_offset = zipf.fp.tell()
+        zipf.fp.write(zinfo.FileHeader())
+        zipf.fp.write(raw_bytes)
+        zipf.start_dir = zipf.fp.tell()
+        zipf.filelist.append(zinfo)
+        zipf.NameToInfo[zinfo.filename] = zinfo
+        zipf._didModify = True
+
+
+def _remove_quietly(path):
+    """
+    Remove the file at *path*, ignoring any error, for example when it has
+    already been removed.
+    """
+    try:
+        os.remove(path)
+    except OSError:
+        pass
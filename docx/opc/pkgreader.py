@@ -10,8 +10,8 @@ from __future__ import absolute_import
 from .constants import RELATIONSHIP_TARGET_MODE as RTM
 from .oxml import parse_xml
 from .packuri import PACKAGE_URI, PackURI
-from .phys_pkg import PhysPkgReader
-from .shared import CaseInsensitiveDict
+from .phys_pkg import LazyBlob, PhysPkgReader
+from .shared import CaseInsensitiveDict, walk_rel_graph
 
 
 class PackageReader(object):
@@ -25,17 +25,24 @@ class PackageReader(object):
         self._sparts = sparts
 
     @staticmethod
-    def from_file(pkg_file):
+    def from_file(pkg_file, lazy=False):
         """
         Return a |PackageReader| instance loaded with contents of *pkg_file*.
+
+        When *lazy* is |True|, part blobs are not read up front. Each
+        serialized part instead gets a |LazyBlob| that reads its bytes from
+        the package on demand, and the physical package is left open for
+        that purpose. Only the content types item and the rels items, needed
+        to discover the parts, are read during the call.
         """
         phys_reader = PhysPkgReader(pkg_file)
         content_types = _ContentTypeMap.from_xml(phys_reader.content_types_xml)
         pkg_srels = PackageReader._srels_for(phys_reader, PACKAGE_URI)
         sparts = PackageReader._load_serialized_parts(
-            phys_reader, pkg_srels, content_types
+            phys_reader, pkg_srels, content_types, lazy
         )
-        phys_reader.close()
+        if not lazy:
+            phys_reader.close()
         return PackageReader(content_types, pkg_srels, sparts)
 
     def iter_sparts(self):
@@ -58,14 +65,18 @@ class PackageReader(object):
                 yield (spart.partname, srel)
 
     @staticmethod
-    def _load_serialized_parts(phys_reader, pkg_srels, content_types):
+    def _load_serialized_parts(phys_reader, pkg_srels, content_types,
+                               lazy=False):
         """
         Return a list of |_SerializedPart| instances corresponding to the
         parts in *phys_reader* accessible by walking the relationship graph
-        starting with *pkg_srels*.
+        starting with *pkg_srels*. The blob of each is a |LazyBlob| when
+        *lazy* is |True|.
         """
         sparts = []
-        part_walker = PackageReader._walk_phys_parts(phys_reader, pkg_srels)
+        part_walker = PackageReader._walk_phys_parts(
+            phys_reader, pkg_srels, lazy=lazy
+        )
         for partname, blob, reltype, srels in part_walker:
             content_type = content_types[partname]
             spart = _SerializedPart(
@@ -85,30 +96,27 @@ class PackageReader(object):
             source_uri.baseURI, rels_xml)
 
     @staticmethod
-    def _walk_phys_parts(phys_reader, srels, visited_partnames=None):
+    def _walk_phys_parts(phys_reader, srels, lazy=False):
         """
         Generate a 4-tuple `(partname, blob, reltype, srels)` for each of the
         parts in *phys_reader* by walking the relationship graph rooted at
-        srels.
+        srels. *blob* is a |LazyBlob| rather than the part bytes when *lazy*
+        is |True|.
         """
-        if visited_partnames is None:
-            visited_partnames = []
-        for srel in srels:
-            if srel.is_external:
-                continue
-            partname = srel.target_partname
-            if partname in visited_partnames:
+        def srels_for(partname):
+            return PackageReader._srels_for(phys_reader, partname)
+
+        rel_graph = walk_rel_graph(
+            srels, lambda srel: srel.target_partname, srels_for
+        )
+        for srel, partname, part_srels in rel_graph:
+            if partname is None:
                 continue
-            visited_partnames.append(partname)
-            reltype = srel.reltype
-            part_srels = PackageReader._srels_for(phys_reader, partname)
-            blob = phys_reader.blob_for(partname)
-            yield (partname, blob, reltype, part_srels)
-            next_walker = PackageReader._walk_phys_parts(
-                phys_reader, part_srels, visited_partnames
+            blob = (
+                LazyBlob(phys_reader, partname) if lazy
+                else phys_reader.blob_for(partname)
             )
-            for partname, blob, reltype, srels in next_walker:
-                yield (partname, blob, reltype, srels)
+            yield (partname, blob, srel.reltype, part_srels)
 
 
 class _ContentTypeMap(object):
@@ -7,6 +7,15 @@ Convention (OPC) package, essentially an implementation of OpcPackage.save()
 
 from __future__ import absolute_import
 
+import os
+import shutil
+import tempfile
+
+from contextlib import contextmanager
+from io import BytesIO
+from multiprocessing.pool import ThreadPool
+
+from .compat import is_string
 from .constants import CONTENT_TYPE as CT
 from .oxml import CT_Types, serialize_part_xml
 from .packuri import CONTENT_TYPES_URI, PACKAGE_URI
@@ -23,18 +32,90 @@ class PackageWriter(object):
     be instantiated.
     """
     @staticmethod
-    def write(pkg_file, pkg_rels, parts):
+    def write(pkg_file, pkg_rels, parts, compression=None, workers=None):
         """
         Write a physical package (.pptx file) to *pkg_file* containing
         *pkg_rels* and *parts* and a content types stream based on the
-        content types of the parts.
+        content types of the parts. Members are compressed as directed by
+        *compression*, a |CompressionPolicy|, when provided. Parts are
+        serialized and compressed on a pool of *workers* threads when
+        *workers* is greater than 1, the package produced is the same
+        either way.
         """
-        phys_writer = PhysPkgWriter(pkg_file)
+        if PackageWriter._is_lazy_load_source(pkg_file, parts):
+            return PackageWriter._write_over_source(
+                pkg_file, pkg_rels, parts, compression, workers
+            )
+        phys_writer = PhysPkgWriter(pkg_file, compression)
         PackageWriter._write_content_types_stream(phys_writer, parts)
         PackageWriter._write_pkg_rels(phys_writer, pkg_rels)
-        PackageWriter._write_parts(phys_writer, parts)
+        if workers is not None and workers > 1:
+            PackageWriter._write_parts_in_parallel(
+                phys_writer, parts, workers
+            )
+        else:
+            PackageWriter._write_parts(phys_writer, parts)
+        phys_writer.close()
+
+    @staticmethod
+    @contextmanager
+    def streaming(pkg_file, package, streamed_part, compression=None):
+        """
+        Context manager that writes *package* to *pkg_file* while the blob of
+        its *streamed_part* is produced piecemeal. It provides a writable
+        binary stream that receives the serialized XML of *streamed_part*,
+        which is written straight to the package member as it arrives. The
+        rest of *package*, as it stands when the block exits, is written
+        after that member. The content of *streamed_part* itself is never
+        serialized. When the block exits on an exception and *pkg_file* is a
+        path, the partly written file is removed. Raises |ValueError| if
+        *pkg_file* is the package that parts of *package* are still being
+        lazily read from.
+        """
+        if PackageWriter._is_lazy_load_source(pkg_file, package.parts):
+            raise ValueError(
+                "can't stream a package over the file it was lazily loaded "
+                "from"
+            )
+        phys_writer = PhysPkgWriter(pkg_file, compression)
+        try:
+            with phys_writer.open(
+                streamed_part.partname, streamed_part.content_type
+            ) as stream:
+                yield stream
+            parts = package.parts
+            for part in parts:
+                part.before_marshal()
+            PackageWriter._write_content_types_stream(phys_writer, parts)
+            PackageWriter._write_pkg_rels(phys_writer, package.rels)
+            PackageWriter._write_parts(
+                phys_writer, [p for p in parts if p is not streamed_part]
+            )
+            if len(streamed_part._rels):
+                phys_writer.write(
+                    streamed_part.partname.rels_uri, streamed_part._rels.xml,
+                    CT.OPC_RELATIONSHIPS
+                )
+        except BaseException:
+            phys_writer.close()
+            if is_string(pkg_file) and os.path.exists(pkg_file):
+                os.remove(pkg_file)
+            raise
         phys_writer.close()
 
+    @staticmethod
+    def _is_lazy_load_source(pkg_file, parts):
+        """
+        Return |True| if any unmodified part in *parts* is still read from
+        *pkg_file*, the package it was lazily loaded from.
+        """
+        for part in parts:
+            if part.is_modified:
+                continue
+            if part._blob.reads_from(pkg_file):
+                return True
+        return False
+
     @staticmethod
     def _write_content_types_stream(phys_writer, parts):
         """
@@ -42,18 +123,131 @@ class PackageWriter(object):
         appropriate content type lookup target for each part in *parts*.
         """
         cti = _ContentTypesItem.from_parts(parts)
-        phys_writer.write(CONTENT_TYPES_URI, cti.blob)
+        phys_writer.write(CONTENT_TYPES_URI, cti.blob, CT.XML)
+
+    @staticmethod
+    def _source_readers(pkg_file, parts):
+        """
+        Return the physical package readers that unmodified parts in *parts*
+        are still being read from *pkg_file* by.
+        """
+        phys_readers = []
+        for part in parts:
+            if part.is_modified or not part._blob.reads_from(pkg_file):
+                continue
+            phys_reader = part._blob.phys_reader
+            if phys_reader is not None and phys_reader not in phys_readers:
+                phys_readers.append(phys_reader)
+        return phys_readers
+
+    @staticmethod
+    def _write_over_source(pkg_file, pkg_rels, parts, compression, workers):
+        """
+        Write the package to *pkg_file*, a path or stream that unmodified
+        parts in *parts* are still being read from. Writing *pkg_file* in
+        place would truncate it before those parts are copied, so the
+        package is written to a temporary file alongside a path, which then
+        replaces it, or to memory for a stream, which is then rewritten from
+        the start. The source package is closed while it is replaced and
+        reopened after, so those parts read from the new package, which
+        holds the same members.
+        """
+        phys_readers = PackageWriter._source_readers(pkg_file, parts)
+        if not is_string(pkg_file):
+            spool = BytesIO()
+            PackageWriter.write(spool, pkg_rels, parts, compression, workers)
+            for phys_reader in phys_readers:
+                phys_reader.close()
+            try:
+                pkg_file.seek(0)
+                pkg_file.truncate()
+                pkg_file.write(spool.getvalue())
+            finally:
+                for phys_reader in phys_readers:
+                    phys_reader.reopen()
+            return
+
+        dirname, filename = os.path.split(os.path.abspath(pkg_file))
+        fd, tmp_path = tempfile.mkstemp(prefix='.%s.' % filename, dir=dirname)
+        os.close(fd)
+        try:
+            PackageWriter.write(
+                tmp_path, pkg_rels, parts, compression, workers
+            )
+            shutil.copymode(pkg_file, tmp_path)
+            for phys_reader in phys_readers:
+                phys_reader.close()
+            try:
+                os.replace(tmp_path, pkg_file)
+            finally:
+                for phys_reader in phys_readers:
+                    phys_reader.reopen()
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
 
     @staticmethod
     def _write_parts(phys_writer, parts):
         """
         Write the blob of each part in *parts* to the package, along with a
-        rels item for its relationships if and only if it has any.
+        rels item for its relationships if and only if it has any. A part
+        unmodified since it was lazily loaded is copied from its source
+        package rather than reserialized, and a part whose blob is spooled
+        to disk is streamed from there.
         """
         for part in parts:
-            phys_writer.write(part.partname, part.blob)
+            if part.is_modified:
+                phys_writer.write(
+                    part.partname, part.blob, part.content_type
+                )
+            else:
+                phys_writer.copy(
+                    part.partname, part._blob, part.content_type
+                )
             if len(part._rels):
-                phys_writer.write(part.partname.rels_uri, part._rels.xml)
+                phys_writer.write(
+                    part.partname.rels_uri, part._rels.xml,
+                    CT.OPC_RELATIONSHIPS
+                )
+
+    @staticmethod
+    def _write_parts_in_parallel(phys_writer, parts, workers):
+        """
+        Write *parts* to the package as :meth:`_write_parts` does, but
+        serialize and compress them on a pool of *workers* threads. lxml
+        serialization and zlib compression both release the GIL, so these
+        run truly in parallel. Members are appended to the archive by the
+        calling thread, in the order of *parts*, as they become ready.
+        """
+        def compress_part(part):
+            member = (
+                phys_writer.compress(
+                    part.partname, part.blob, part.content_type
+                ) if part.is_modified else None
+            )
+            rels_member = (
+                phys_writer.compress(
+                    part.partname.rels_uri, part._rels.xml,
+                    CT.OPC_RELATIONSHIPS
+                ) if len(part._rels) else None
+            )
+            return part, member, rels_member
+
+        pool = ThreadPool(workers)
+        try:
+            for part, member, rels_member in pool.imap(compress_part, parts):
+                if member is None:
+                    phys_writer.copy(
+                        part.partname, part._blob, part.content_type
+                    )
+                else:
+                    phys_writer.write_raw(*member)
+                if rels_member is not None:
+                    phys_writer.write_raw(*rels_member)
+        finally:
+            pool.terminate()
+            pool.join()
 
     @staticmethod
     def _write_pkg_rels(phys_writer, pkg_rels):
@@ -61,7 +255,9 @@ class PackageWriter(object):
         Write the XML rels item for *pkg_rels* ('/_rels/.rels') to the
         package.
         """
-        phys_writer.write(PACKAGE_URI.rels_uri, pkg_rels.xml)
+        phys_writer.write(
+            PACKAGE_URI.rels_uri, pkg_rels.xml, CT.OPC_RELATIONSHIPS
+        )
 
 
 class _ContentTypesItem(object):
@@ -8,17 +8,47 @@ from __future__ import (
     absolute_import, division, print_function, unicode_literals
 )
 
+from .compat import is_string
 from .oxml import CT_Relationships
 
 
 class Relationships(dict):
     """
     Collection object for |_Relationship| instances, having list semantics.
+
+    The relationships are indexed by reltype and by `(reltype, target,
+    is_external)` as they are added and removed, and the lowest rId number
+    that may be free is remembered, so finding a relationship, adding one
+    and finding the part of a reltype each take constant time however many
+    relationships there are. The indexes are kept up to date by every
+    method that adds, replaces or removes a relationship, including the
+    ``dict`` methods such as :meth:`pop` and :meth:`update`.
     """
     def __init__(self, baseURI):
         super(Relationships, self).__init__()
         self._baseURI = baseURI
         self._target_parts_by_rId = {}
+        self._rels_by_key = {}
+        self._rels_by_reltype = {}
+        self._rId_cursor = 1
+
+    def __delitem__(self, rId):
+        rel = self[rId]
+        super(Relationships, self).__delitem__(rId)
+        self._forget(rId, rel)
+
+    def __ior__(self, other):
+        self.update(other)
+        return self
+
+    def __setitem__(self, rId, rel):
+        if rId in self:
+            del self[rId]
+        super(Relationships, self).__setitem__(rId, rel)
+        if not rel.is_external:
+            self._target_parts_by_rId[rId] = rel.target_part
+        self._rels_by_key.setdefault(_rel_key(rel), {})[rId] = rel
+        self._rels_by_reltype.setdefault(rel.reltype, {})[rId] = rel
 
     def add_relationship(self, reltype, target, rId, is_external=False):
         """
@@ -26,10 +56,12 @@ class Relationships(dict):
         """
         rel = _Relationship(rId, reltype, target, self._baseURI, is_external)
         self[rId] = rel
-        if not is_external:
-            self._target_parts_by_rId[rId] = target
         return rel
 
+    def clear(self):
+        for rId in list(self):
+            del self[rId]
+
     def get_or_add(self, reltype, target_part):
         """
         Return relationship of *reltype* to *target_part*, newly added if not
@@ -54,6 +86,18 @@ class Relationships(dict):
             )
         return rel.rId
 
+    def pop(self, rId, *default):
+        if default and rId not in self:
+            return default[0]
+        rel = self[rId]
+        del self[rId]
+        return rel
+
+    def popitem(self):
+        rId, rel = super(Relationships, self).popitem()
+        self._forget(rId, rel)
+        return rId, rel
+
     def part_with_reltype(self, reltype):
         """
         Return target part of rel with matching *reltype*, raising |KeyError|
@@ -71,6 +115,15 @@ class Relationships(dict):
         """
         return self._target_parts_by_rId
 
+    def setdefault(self, rId, rel=None):
+        if rId not in self:
+            self[rId] = rel
+        return self[rId]
+
+    def update(self, *args, **kwargs):
+        for rId, rel in dict(*args, **kwargs).items():
+            self[rId] = rel
+
     @property
     def xml(self):
         """
@@ -84,25 +137,26 @@ class Relationships(dict):
             )
         return rels_elm.xml
 
+    def _forget(self, rId, rel):
+        """
+        Remove *rel*, just removed from the collection with key *rId*, from
+        the indexes, and let *rId* be reused.
+        """
+        self._target_parts_by_rId.pop(rId, None)
+        self._unindex(rId, rel)
+        n = _rId_number(rId)
+        if n is not None and n < self._rId_cursor:
+            self._rId_cursor = n
+
     def _get_matching(self, reltype, target, is_external=False):
         """
         Return relationship of matching *reltype*, *target*, and
         *is_external* from collection, or None if not found.
         """
-        def matches(rel, reltype, target, is_external):
-            if rel.reltype != reltype:
-                return False
-            if rel.is_external != is_external:
-                return False
-            rel_target = rel.target_ref if rel.is_external else rel.target_part
-            if rel_target != target:
-                return False
-            return True
-
-        for rel in self.values():
-            if matches(rel, reltype, target, is_external):
-                return rel
-        return None
+        matching = self._rels_by_key.get((reltype, target, bool(is_external)))
+        if not matching:
+            return None
+        return next(iter(matching.values()))
 
     def _get_rel_of_type(self, reltype):
         """
@@ -110,25 +164,61 @@ class Relationships(dict):
         Raises |KeyError| if no matching relationship is found. Raises
         |ValueError| if more than one matching relationship is found.
         """
-        matching = [rel for rel in self.values() if rel.reltype == reltype]
-        if len(matching) == 0:
+        matching = self._rels_by_reltype.get(reltype)
+        if not matching:
             tmpl = "no relationship of type '%s' in collection"
             raise KeyError(tmpl % reltype)
         if len(matching) > 1:
             tmpl = "multiple relationships of type '%s' in collection"
             raise ValueError(tmpl % reltype)
-        return matching[0]
+        return next(iter(matching.values()))
 
     @property
     def _next_rId(self):
         """
         Next available rId in collection, starting from 'rId1' and making use
         of any gaps in numbering, e.g. 'rId2' for rIds ['rId1', 'rId3'].
+        The search starts from the lowest number that may be free rather
+        than from 1.
+        """
+        n = self._rId_cursor
+        while 'rId%d' % n in self:
+            n += 1
+        self._rId_cursor = n
+        return 'rId%d' % n
+
+    def _unindex(self, rId, rel):
         """
-        for n in range(1, len(self)+2):
-            rId_candidate = 'rId%d' % n  # like 'rId19'
-            if rId_candidate not in self:
-                return rId_candidate
+        Remove *rel*, which had key *rId*, from the reltype and target
+        indexes. The next relationship having the same reltype and target,
+        if there is one, is then the one found by target.
+        """
+        for index, key in (
+            (self._rels_by_reltype, rel.reltype),
+            (self._rels_by_key, _rel_key(rel)),
+        ):
+            rels = index[key]
+            del rels[rId]
+            if not rels:
+                del index[key]
+
+
+def _rel_key(rel):
+    """
+    Return the `(reltype, target, is_external)` key *rel* is indexed by.
+    """
+    target = rel.target_ref if rel.is_external else rel.target_part
+    return rel.reltype, target, rel.is_external
+
+
+def _rId_number(rId):
+    """
+    Return the int number of *rId*, like 19 for 'rId19', or |None| when
+    *rId* isn't of that form.
+    """
+    if is_string(rId) and rId.startswith('rId') and rId[3:].isdigit():
+        return int(rId[3:])
+    return None
 
 
 class _Relationship(object):
@@ -45,3 +45,39 @@ def lazyproperty(f):
             return value
 
     return property(get_prop_value, doc=docstring)
+
+
+def walk_rel_graph(rels, target_of, rels_of):
+    """
+    Generate a `(rel, target, target_rels)` 3-tuple for each relationship
+    reachable from *rels* by a depth-first traversal of the relationship
+    graph, such as the relationships of a package. *target* and
+    *target_rels* are |None| unless *rel* reaches its target for the first
+    time, in which case the walk proceeds through *target_rels* before
+    moving on to the relationships following *rel*.
+
+    *target_of* is called with an internal relationship to get the hashable
+    key identifying its target, like a partname or part, and *rels_of* is
+    called once with each newly-reached target to get its relationships.
+    Visited targets are kept in a set and pending relationships on an
+    explicit stack, so the walk takes time linear in the size of the graph
+    and is not limited by the recursion depth.
+    """
+    visited = set()
+    stack = [iter(rels)]
+    while stack:
+        for rel in stack[-1]:
+            if rel.is_external:
+                yield rel, None, None
+                continue
+            target = target_of(rel)
+            if target in visited:
+                yield rel, None, None
+                continue
+            visited.add(target)
+            target_rels = rels_of(target)
+            yield rel, target, target_rels
+            stack.append(iter(target_rels))
+            break
+        else:
+            stack.pop()
@@ -9,7 +9,7 @@ from __future__ import absolute_import
 
 from lxml import etree
 
-from .ns import NamespacePrefixedTag, nsmap
+from .ns import NamespacePrefixedTag, nsmap, qn
 
 
 # configure XML parser
@@ -29,6 +29,32 @@ def parse_xml(xml):
     return root_element
 
 
+def iterparse_children(stream, parent_tag, child_tags):
+    """
+    Generate each element having one of *child_tags* that is a child of an
+    element having *parent_tag*, in document order, parsing the XML in
+    *stream* incrementally. Tags are namespace-prefixed, e.g. ``'w:p'``.
+    Custom element classes are produced as they are by :func:`parse_xml`.
+    Each generated element is complete, but is cleared when the next
+    element is requested and removed after that, so memory use is bounded by
+    the largest child rather than the whole document.
+    """
+    parent_clark_name = qn(parent_tag)
+    context = etree.iterparse(
+        stream, tag=[qn(tag) for tag in child_tags],
+        remove_blank_text=True, resolve_entities=False
+    )
+    context.set_element_class_lookup(element_class_lookup)
+    for _, element in context:
+        parent = element.getparent()
+        if parent is None or parent.tag != parent_clark_name:
+            continue
+        while element.getprevious() is not None:
+            del parent[0]
+        yield element
+        element.clear()
+
+
 def register_element_cls(tag, cls):
     """
     Register *cls* to be constructed when the oxml parser encounters an
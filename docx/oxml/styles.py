@@ -4,7 +4,12 @@
 Custom element classes related to the styles part
 """
 
+from copy import deepcopy
+
+from lxml import etree
+
 from ..enum.style import WD_STYLE_TYPE
+from .ns import nsmap, qn
 from .simpletypes import ST_DecimalNumber, ST_OnOff, ST_String
 from .xmlchemy import (
     BaseOxmlElement, OptionalAttribute, RequiredAttribute, ZeroOrMore,
@@ -12,6 +17,104 @@ from .xmlchemy import (
 )
 
 
+# style lookups, compiled once and given the id or name as a variable
+_style_by_id = etree.XPath('w:style[@w:styleId=$styleId]', namespaces=nsmap)
+_style_by_name = etree.XPath('w:style[w:name/@w:val=$name]', namespaces=nsmap)
+
+# property elements whose attributes each apply on their own, so an override
+# only replaces the attributes it has
+_PARTIAL_PROPS = frozenset(
+    qn('w:%s' % tag) for tag in ('ind', 'lang', 'rFonts', 'spacing')
+)
+
+# property elements that are not formatting and so aren't layered
+_UNLAYERED_PROPS = frozenset(
+    qn('w:%s' % tag) for tag in (
+        'pPrChange', 'pStyle', 'rPr', 'rPrChange', 'rStyle', 'sectPr'
+    )
+)
+
+# run properties that toggle, rather than replace, the value they have in
+# the paragraph style when set again in a character style
+_TOGGLE_PROPS = frozenset(
+    qn('w:%s' % tag) for tag in (
+        'b', 'bCs', 'caps', 'dstrike', 'emboss', 'i', 'iCs', 'imprint',
+        'outline', 'shadow', 'smallCaps', 'strike', 'vanish'
+    )
+)
+
+# attributes an override of one of them clears the others of, for the
+# partial property elements where they are alternatives
+_EXCLUSIVE_ATTRS = {
+    qn('w:firstLine'): (qn('w:hanging'), qn('w:hangingChars')),
+    qn('w:firstLineChars'): (qn('w:hanging'), qn('w:hangingChars')),
+    qn('w:hanging'): (qn('w:firstLine'), qn('w:firstLineChars')),
+    qn('w:hangingChars'): (qn('w:firstLine'), qn('w:firstLineChars')),
+    qn('w:line'): (qn('w:lineRule'),),
+}
+
+
+def layer_props(props, overrides, toggle=False):
+    """
+    Apply the properties in *overrides* on top of those in *props*, both
+    ``<w:pPr>`` or both ``<w:rPr>`` elements, changing *props* in place.
+    A property in *overrides* replaces the same property in *props*, except
+    that the attributes of `w:ind`, `w:spacing`, `w:rFonts` and `w:lang` are
+    replaced one at a time and the tab stops of `w:tabs` are merged by
+    position. When *toggle* is |True|, a toggle property such as `w:b` set
+    in both is turned off when the two values are the same and on
+    otherwise, as when a character style is applied over a paragraph style.
+    Style references, revisions and section properties are not layered.
+    """
+    if overrides is None:
+        return
+    for override in overrides:
+        tag = override.tag
+        if not isinstance(tag, str) or tag in _UNLAYERED_PROPS:
+            continue
+        prop = props.find(tag)
+        if prop is None:
+            props.append(deepcopy(override))
+        elif tag in _PARTIAL_PROPS:
+            _layer_attrs(prop, override)
+        elif tag == qn('w:tabs'):
+            _layer_tabs(prop, override)
+        elif toggle and tag in _TOGGLE_PROPS:
+            prop.val = prop.val != override.val
+        else:
+            prop.addnext(deepcopy(override))
+            props.remove(prop)
+
+
+def _layer_attrs(prop, override):
+    """
+    Set each attribute of *override* on *prop*, clearing the attributes of
+    *prop* it is an alternative to.
+    """
+    for name, value in override.attrib.items():
+        for excluded in _EXCLUSIVE_ATTRS.get(name, ()):
+            if excluded not in override.attrib:
+                prop.attrib.pop(excluded, None)
+        prop.set(name, value)
+
+
+def _layer_tabs(tabs, override):
+    """
+    Merge the tab stops of *override* into *tabs*, each replacing any tab
+    stop at its position. A tab stop of type "clear" removes the one at its
+    position without adding itself.
+    """
+    tab_by_pos = dict((tab.get(qn('w:pos')), tab) for tab in tabs)
+    for tab in override:
+        pos = tab.get(qn('w:pos'))
+        if pos in tab_by_pos:
+            tabs.remove(tab_by_pos.pop(pos))
+        if tab.get(qn('w:val')) != 'clear':
+            tab_by_pos[pos] = deepcopy(tab)
+    for pos in sorted(tab_by_pos, key=int):
+        tabs.append(tab_by_pos[pos])
+
+
 def styleId_from_name(name):
     """
     Return the style id corresponding to *name*, taking into account
@@ -323,14 +426,35 @@ class CT_Styles(BaseOxmlElement):
         # spec calls for last default in document order
         return default_styles_for_type[-1]
 
+    @property
+    def default_pPr(self):
+        """
+        The `w:docDefaults/w:pPrDefault/w:pPr` descendant holding the default
+        paragraph properties of the document, or |None| if not present.
+        """
+        try:
+            return self.xpath('w:docDefaults/w:pPrDefault/w:pPr')[0]
+        except IndexError:
+            return None
+
+    @property
+    def default_rPr(self):
+        """
+        The `w:docDefaults/w:rPrDefault/w:rPr` descendant holding the default
+        run properties of the document, or |None| if not present.
+        """
+        try:
+            return self.xpath('w:docDefaults/w:rPrDefault/w:rPr')[0]
+        except IndexError:
+            return None
+
     def get_by_id(self, styleId):
         """
         Return the ``<w:style>`` child element having ``styleId`` attribute
         matching *styleId*, or |None| if not found.
         """
-        xpath = 'w:style[@w:styleId="%s"]' % styleId
         try:
-            return self.xpath(xpath)[0]
+            return _style_by_id(self, styleId=styleId)[0]
         except IndexError:
             return None
 
@@ -339,9 +463,8 @@ class CT_Styles(BaseOxmlElement):
         Return the ``<w:style>`` child element having ``<w:name>`` child
         element with value *name*, or |None| if not found.
         """
-        xpath = 'w:style[w:name/@w:val="%s"]' % name
         try:
-            return self.xpath(xpath)[0]
+            return _style_by_name(self, name=name)[0]
         except IndexError:
             return None
 
@@ -6,10 +6,16 @@ from __future__ import (
     absolute_import, division, print_function, unicode_literals
 )
 
+from copy import deepcopy
+import numbers
+import re
+
+from lxml import etree
+
 from . import parse_xml
 from ..enum.table import WD_CELL_VERTICAL_ALIGNMENT, WD_ROW_HEIGHT_RULE
 from ..exceptions import InvalidSpanError
-from .ns import nsdecls, qn
+from .ns import nsdecls, nsmap, qn
 from ..shared import Emu, Twips
 from .simpletypes import (
     ST_Merge, ST_TblLayoutType, ST_TblWidth, ST_TwipsMeasure, XsdInt
@@ -19,6 +25,15 @@ from .xmlchemy import (
     RequiredAttribute, ZeroOrOne, ZeroOrMore
 )
 
+_special_chars = re.compile('[\t\r\n]')
+
+# position of a row or grid column among its siblings, counted by libxml2
+# rather than by listing the siblings in Python
+_preceding_tr_count = etree.XPath('count(preceding-sibling::w:tr)', namespaces=nsmap)
+_preceding_gridCol_count = etree.XPath(
+    'count(preceding-sibling::w:gridCol)', namespaces=nsmap
+)
+
 
 class CT_Height(BaseOxmlElement):
     """
@@ -36,6 +51,35 @@ class CT_Row(BaseOxmlElement):
     trPr = ZeroOrOne('w:trPr')        # custom inserter below
     tc = ZeroOrMore('w:tc')
 
+    def copy_formatting(self):
+        """
+        Return a new ``<w:tr>`` element formatted like this one but without
+        its content. It has a copy of the row properties of this row and
+        a cell for each of its cells, with the same cell properties less any
+        vertical merge. Each cell has a single paragraph with the paragraph
+        properties of the first paragraph of the original cell. If that
+        paragraph has a run, the new one has an empty run with the same
+        run properties, ready to have its text set.
+        """
+        tr = deepcopy(self)
+        for tc in tr.tc_lst:
+            p_lst = tc.p_lst
+            pPr = p_lst[0].pPr if p_lst else None
+            r_lst = p_lst[0].r_lst if p_lst else []
+            rPr = r_lst[0].rPr if r_lst else None
+            tc.clear_content()
+            tcPr = tc.tcPr
+            if tcPr is not None:
+                tcPr._remove_vMerge()
+            p = tc.add_p()
+            if pPr is not None:
+                p.append(pPr)
+            if r_lst:
+                r = p.add_r()
+                if rPr is not None:
+                    r.append(rPr)
+        return tr
+
     def tc_at_grid_col(self, idx):
         """
         The ``<w:tc>`` element appearing at grid column *idx*. Raises
@@ -56,7 +100,7 @@ class CT_Row(BaseOxmlElement):
         The index of this ``<w:tr>`` element within its parent ``<w:tbl>``
         element.
         """
-        return self.getparent().tr_lst.index(self)
+        return int(_preceding_tr_count(self))
 
     @property
     def trHeight_hRule(self):
@@ -139,6 +183,52 @@ class CT_Tbl(BaseOxmlElement):
         """
         return len(self.tblGrid.gridCol_lst)
 
+    def add_trs(self, n_or_rows, template_tr=None):
+        """
+        Return a list of ``<w:tr>`` elements newly appended to this table,
+        each a copy of ``template_tr.copy_formatting()``. When *template_tr*
+        is |None| each has an empty cell per grid column, sized to the
+        column, as by :meth:`.Table.add_row`. *n_or_rows* is either a number
+        of empty rows or an iterable of rows, each a sequence of values set
+        as the text of successive cells, as by ``str()``; |None| leaves
+        a cell empty. A row with more values than the template has cells
+        raises |ValueError|.
+        """
+        if template_tr is None:
+            prototype = self._new_tr()
+            for gridCol in self.tblGrid.gridCol_lst:
+                tc = prototype.add_tc()
+                tc.width = gridCol.w
+        else:
+            prototype = template_tr.copy_formatting()
+        if isinstance(n_or_rows, numbers.Integral):
+            rows = [()] * n_or_rows
+        else:
+            rows = n_or_rows
+
+        tc_count = len(prototype.tc_lst)
+        trs = []
+        for tr_idx, values in enumerate(rows):
+            tr = deepcopy(prototype)
+            texts = ['' if value is None else str(value) for value in values]
+            if len(texts) > tc_count:
+                raise ValueError(
+                    'row %d has more than %d cells' % (tr_idx, tc_count)
+                )
+            texts += [''] * (tc_count - len(texts))
+            for tc, text in zip(tr.tc_lst, texts):
+                p = tc.p_lst[0]
+                r_lst = p.r_lst
+                if not text:
+                    for r in r_lst:
+                        p.remove(r)
+                    continue
+                r = r_lst[0] if r_lst else p.add_r()
+                r.text = text
+            self.append(tr)
+            trs.append(tr)
+        return trs
+
     def iter_tcs(self):
         """
         Generate each of the `w:tc` elements in this table, left to right and
@@ -157,6 +247,70 @@ class CT_Tbl(BaseOxmlElement):
         """
         return parse_xml(cls._tbl_xml(rows, cols, width))
 
+    @classmethod
+    def new_tbl_from_rows(cls, rows, width, header=None):
+        """
+        Return a new `w:tbl` element having a row for each sequence of cell
+        values in *rows*, with *width* distributed evenly between the
+        columns. When *header* is a sequence of values, it becomes a first
+        row marked to repeat at the top of each page. The column count is
+        that of *header*, or of the first row when *header* is |None|; there
+        being neither raises |ValueError|. Rows having fewer values are
+        padded with empty cells, and a row having more raises |ValueError|.
+        Each value other than |None| becomes the text of a single run in its
+        cell, as by ``str()``.
+
+        *rows* is iterated only once and the whole subtree is built directly
+        rather than through the ``w:tc`` proxies, so this is suitable for
+        large tables produced from a generator.
+        """
+        rows = iter(rows)
+        first_row = next(rows, None) if header is None else header
+        if first_row is None:
+            raise ValueError('no header and no rows to take column count from')
+        first_rows = (list(first_row),)
+        col_count = len(first_rows[0])
+        col_width = Emu(width/col_count) if col_count > 0 else Emu(0)
+        tbl = parse_xml(cls._tbl_xml(0, col_count, width))
+
+        empty_tr = parse_xml('<w:tr %s>%s</w:tr>' % (
+            nsdecls('w'), cls._tcs_xml(col_count, col_width)
+        ))
+        r_tag, t_tag = qn('w:r'), qn('w:t')
+        space_attr = qn('xml:space')
+
+        def add_tr(tr_idx, values):
+            tr = deepcopy(empty_tr)
+            tcs = list(tr)
+            for col_idx, value in enumerate(values):
+                if col_idx == col_count:
+                    raise ValueError(
+                        'row %d has more than %d cells' % (tr_idx, col_count)
+                    )
+                if value is None:
+                    continue
+                text = str(value)
+                if not text:
+                    continue
+                r = etree.SubElement(tcs[col_idx][1], r_tag)
+                if _special_chars.search(text):
+                    r.text = text
+                    continue
+                t = etree.SubElement(r, t_tag)
+                t.text = text
+                if len(text.strip()) < len(text):
+                    t.set(space_attr, 'preserve')
+            tbl.append(tr)
+            return tr
+
+        if first_rows:
+            tr = add_tr(0, first_rows[0])
+            if header is not None:
+                tr.get_or_add_trPr()._add_tblHeader()
+        for tr_idx, values in enumerate(rows, len(first_rows)):
+            add_tr(tr_idx, values)
+        return tbl
+
     @property
     def tblStyle_val(self):
         """
@@ -255,7 +409,7 @@ class CT_TblGridCol(BaseOxmlElement):
         The index of this ``<w:gridCol>`` element within its parent
         ``<w:tblGrid>`` element.
         """
-        return self.getparent().gridCol_lst.index(self)
+        return int(_preceding_gridCol_count(self))
 
 
 class CT_TblLayoutType(BaseOxmlElement):
@@ -689,7 +843,7 @@ class CT_Tc(BaseOxmlElement):
         """
         The tbl element this tc element appears in.
         """
-        return self.xpath('./ancestor::w:tbl[position()=1]')[0]
+        return self._ancestor(qn('w:tbl'))
 
     @property
     def _tc_above(self):
@@ -713,7 +867,7 @@ class CT_Tc(BaseOxmlElement):
         """
         The tr element this tc element appears in.
         """
-        return self.xpath('./ancestor::w:tr[position()=1]')[0]
+        return self._ancestor(qn('w:tr'))
 
     @property
     def _tr_above(self):
@@ -721,11 +875,9 @@ class CT_Tc(BaseOxmlElement):
         The tr element prior in sequence to the tr this cell appears in.
         Raises |ValueError| if called on a cell in the top-most row.
         """
-        tr_lst = self._tbl.tr_lst
-        tr_idx = tr_lst.index(self._tr)
-        if tr_idx == 0:
-            raise ValueError('no tr above topmost tr')
-        return tr_lst[tr_idx-1]
+        for tr in self._tr.itersiblings(qn('w:tr'), preceding=True):
+            return tr
+        raise ValueError('no tr above topmost tr')
 
     @property
     def _tr_below(self):
@@ -733,19 +885,27 @@ class CT_Tc(BaseOxmlElement):
         The tr element next in sequence after the tr this cell appears in, or
         |None| if this cell appears in the last row.
         """
-        tr_lst = self._tbl.tr_lst
-        tr_idx = tr_lst.index(self._tr)
-        try:
-            return tr_lst[tr_idx+1]
-        except IndexError:
-            return None
+        for tr in self._tr.itersiblings(qn('w:tr')):
+            return tr
+        return None
 
     @property
     def _tr_idx(self):
         """
         The row index of the tr element this tc element appears in.
         """
-        return self._tbl.tr_lst.index(self._tr)
+        return self._tr.tr_idx
+
+    def _ancestor(self, tag):
+        """
+        The nearest ancestor of this element having Clark-notation *tag*,
+        found by walking up the tree rather than by an XPath query. Raises
+        |IndexError| if there isn't one, as when this cell is not in
+        a table.
+        """
+        for ancestor in self.iterancestors(tag):
+            return ancestor
+        raise IndexError('tc element has no %s ancestor' % tag)
 
 
 class CT_TcPr(BaseOxmlElement):
@@ -845,6 +1005,7 @@ class CT_TrPr(BaseOxmlElement):
         'w:trPrChange'
     )
     trHeight = ZeroOrOne('w:trHeight', successors=_tag_seq[8:])
+    tblHeader = ZeroOrOne('w:tblHeader', successors=_tag_seq[9:])
     del _tag_seq
 
     @property
@@ -4,10 +4,76 @@
 Custom element classes related to paragraphs (CT_P).
 """
 
-from ..ns import qn
+from lxml import etree
+
+from ..ns import nsmap, qn
 from ..xmlchemy import BaseOxmlElement, OxmlElement, ZeroOrMore, ZeroOrOne
 
 
+# run content making up the text of a paragraph, that of the runs directly in
+# the paragraph and of the runs in its hyperlinks
+_run_text_items = 'w:r/*[self::w:t or self::w:tab or self::w:br or self::w:cr]'
+_text_items_of_p = etree.XPath(
+    '%s | w:hyperlink/%s' % (_run_text_items, _run_text_items),
+    namespaces=nsmap
+)
+
+_p_tag, _r_tag, _hyperlink_tag = qn('w:p'), qn('w:r'), qn('w:hyperlink')
+_t_tag, _tab_tag = qn('w:t'), qn('w:tab')
+_story_tags = (qn('w:body'), qn('w:hdr'), qn('w:ftr'))
+_text_tags = (_p_tag, _t_tag, _tab_tag, qn('w:br'), qn('w:cr'))
+
+
+def iter_paragraph_text(element):
+    """
+    Generate the text of each block-level paragraph within *element*, in
+    document order, as :attr:`CT_P.text` would give it. Paragraphs in tables
+    and content controls are included, those in text boxes are not. The
+    paragraphs and their text are all found in a single pass over the tree,
+    so this is much faster than getting the text of each paragraph in turn.
+    """
+    p = text = None
+    for item in element.iter(*_text_tags):
+        tag = item.tag
+        if tag == _p_tag:
+            if _is_in_run(item):
+                continue
+            if p is not None:
+                yield ''.join(text)
+            p, text = item, []
+            continue
+        r = item.getparent()
+        if p is None or r.tag != _r_tag:
+            continue
+        parent = r.getparent()
+        if parent.tag == _hyperlink_tag:
+            parent = parent.getparent()
+        if parent is not p:
+            continue
+        if tag == _t_tag:
+            text.append(item.text or '')
+        elif tag == _tab_tag:
+            text.append('\t')
+        else:
+            text.append('\n')
+    if p is not None:
+        yield ''.join(text)
+
+
+def _is_in_run(p):
+    """
+    Return |True| if the `w:p` element *p* is inside a run, like the
+    paragraphs of a text box, rather than being a block-level paragraph.
+    """
+    for ancestor in p.iterancestors():
+        tag = ancestor.tag
+        if tag == _r_tag:
+            return True
+        if tag in _story_tags:
+            return False
+    return False
+
+
 class CT_P(BaseOxmlElement):
     """
     ``<w:p>`` element, containing the properties and text for a paragraph.
@@ -78,3 +144,21 @@ class CT_P(BaseOxmlElement):
     def style(self, style):
         pPr = self.get_or_add_pPr()
         pPr.style = style
+
+    @property
+    def text(self):
+        """
+        The text of the runs in this paragraph, including the runs in its
+        hyperlinks. Tabs and line breaks are mapped to ``\\t`` and ``\\n``
+        characters respectively.
+        """
+        text = []
+        for item in _text_items_of_p(self):
+            tag = item.tag
+            if tag == _t_tag:
+                text.append(item.text or '')
+            elif tag == _tab_tag:
+                text.append('\t')
+            else:
+                text.append('\n')
+        return ''.join(text)
@@ -4,6 +4,10 @@
 
 from __future__ import absolute_import, division, print_function, unicode_literals
 
+import os
+from multiprocessing.pool import ThreadPool
+
+from docx.image.cache import image_cache
 from docx.image.image import Image
 from docx.opc.constants import RELATIONSHIP_TYPE as RT
 from docx.opc.package import OpcPackage
@@ -30,11 +34,30 @@ class Package(OpcPackage):
         """
         return self.image_parts.get_or_add_image_part(image_descriptor)
 
+    def get_or_add_image_parts(self, image_descriptors, workers=None):
+        """Return list of |ImagePart| containing each image in *image_descriptors*.
+
+        The images are loaded on a pool of *workers* threads, see
+        :meth:`ImageParts.get_or_add_image_parts`.
+        """
+        return self.image_parts.get_or_add_image_parts(image_descriptors, workers)
+
     @lazyproperty
     def image_parts(self):
         """|ImageParts| collection object for this package."""
         return ImageParts()
 
+    def prune_unreferenced_parts(self):
+        """Remove parts nothing refers to any longer and return a list of them.
+
+        See :meth:`.OpcPackage.prune_unreferenced_parts`. Image parts removed are
+        dropped from the image part collection as well, so their part names are free
+        to be used again and an image added later gets a new part.
+        """
+        removed_parts = super(Package, self).prune_unreferenced_parts()
+        self.image_parts.drop(removed_parts)
+        return removed_parts
+
     def _gather_image_parts(self):
         """Load the image part collection with all the image parts in package."""
         for rel in self.iter_rels():
@@ -52,9 +75,14 @@ class ImageParts(object):
 
     def __init__(self):
         self._image_parts = []
+        self._image_part_set = set()
+        self._used_numbers = set()
+        self._next_number = 1
+        self._by_sha1 = None
+        self.spool_images = False
 
     def __contains__(self, item):
-        return self._image_parts.__contains__(item)
+        return item in self._image_part_set
 
     def __iter__(self):
         return self._image_parts.__iter__()
@@ -64,18 +92,63 @@ class ImageParts(object):
 
     def append(self, item):
         self._image_parts.append(item)
+        self._image_part_set.add(item)
+        self._used_numbers.add(item.partname.idx)
+        if self._by_sha1 is not None:
+            self._by_sha1.setdefault(item.sha1, item)
+
+    def drop(self, image_parts):
+        """Remove each of *image_parts* in this collection from it.
+
+        Parts in *image_parts* but not in the collection are ignored. The used
+        part-name numbers are recollected from the parts that remain and the hash
+        index is rebuilt from them on next use, their hashes being kept by each part.
+        """
+        dropped = self._image_part_set.intersection(image_parts)
+        if not dropped:
+            return
+        self._image_parts = [p for p in self._image_parts if p not in dropped]
+        self._image_part_set -= dropped
+        self._used_numbers = set(p.partname.idx for p in self._image_parts)
+        self._next_number = 1
+        self._by_sha1 = None
 
     def get_or_add_image_part(self, image_descriptor):
         """Return |ImagePart| object containing image identified by *image_descriptor*.
 
         The image-part is newly created if a matching one is not present in the
-        collection.
+        collection. The image is loaded through the process-wide |ImageCache|, so when
+        that is turned on an image already used by any document is not read or parsed
+        again. When `spool_images` is |True|, the image is spooled to disk instead, so
+        the new part does not hold its bytes in memory.
         """
-        image = Image.from_file(image_descriptor)
-        matching_image_part = self._get_by_sha1(image.sha1)
-        if matching_image_part is not None:
-            return matching_image_part
-        return self._add_image_part(image)
+        image = self._load_image(image_descriptor)
+        return self._get_or_add_image_part_for(image)
+
+    def get_or_add_image_parts(self, image_descriptors, workers=None):
+        """Return list of |ImagePart| object for each image in *image_descriptors*.
+
+        Each image is loaded as by :meth:`get_or_add_image_part`, but the images are
+        read, hashed and parsed on a pool of *workers* threads, one per CPU by default,
+        since reading and hashing release the GIL. The parts are then matched or
+        added in the order of *image_descriptors*, so part names are assigned just as
+        they would be one image at a time. A stream must appear only once in
+        *image_descriptors*, as it is read by one thread.
+        """
+        image_descriptors = list(image_descriptors)
+        if workers is None:
+            workers = os.cpu_count() or 1
+        workers = min(workers, len(image_descriptors))
+        if workers > 1:
+            pool = ThreadPool(workers)
+            try:
+                images = pool.map(self._load_image, image_descriptors)
+            finally:
+                pool.terminate()
+                pool.join()
+        else:
+            images = [self._load_image(d) for d in image_descriptors]
+        return [self._get_or_add_image_part_for(image) for image in images]
 
     def _add_image_part(self, image):
         """
@@ -87,15 +160,39 @@ class ImageParts(object):
         self.append(image_part)
         return image_part
 
+    def _get_or_add_image_part_for(self, image):
+        """
+        Return the image part in this collection matching *image*, newly created and
+        appended to the collection if there isn't one.
+        """
+        matching_image_part = self._get_by_sha1(image.sha1)
+        if matching_image_part is not None:
+            return matching_image_part
+        return self._add_image_part(image)
+
     def _get_by_sha1(self, sha1):
         """
         Return the image part in this collection having a SHA1 hash matching
-        *sha1*, or |None| if not found.
+        *sha1*, or |None| if not found. The parts are indexed by hash on
+        first use, so the parts of a loaded document are hashed only when an
+        image is added to it.
+        """
+        if self._by_sha1 is None:
+            by_sha1 = {}
+            for image_part in self._image_parts:
+                by_sha1.setdefault(image_part.sha1, image_part)
+            self._by_sha1 = by_sha1
+        return self._by_sha1.get(sha1)
+
+    def _load_image(self, image_descriptor):
+        """
+        Return the |Image| identified by *image_descriptor*, spooled to disk when
+        `spool_images` is |True| and loaded through the process-wide |ImageCache|,
+        off unless turned on, otherwise.
         """
-        for image_part in self._image_parts:
-            if image_part.sha1 == sha1:
-                return image_part
-        return None
+        if self.spool_images:
+            return Image.from_file(image_descriptor, spool=True)
+        return image_cache.image(image_descriptor)
 
     def _next_image_partname(self, ext):
         """
@@ -104,10 +201,9 @@ class ImageParts(object):
         partname is unique by number, without regard to the extension. *ext*
         does not include the leading period.
         """
-        def image_partname(n):
-            return PackURI('/word/media/image%d.%s' % (n, ext))
-        used_numbers = [image_part.partname.idx for image_part in self]
-        for n in range(1, len(self)+1):
-            if n not in used_numbers:
-                return image_partname(n)
-        return image_partname(len(self)+1)
+        used_numbers = self._used_numbers
+        n = self._next_number
+        while n in used_numbers:
+            n += 1
+        self._next_number = n
+        return PackURI('/word/media/image%d.%s' % (n, ext))
@@ -6,13 +6,20 @@ from __future__ import absolute_import, division, print_function, unicode_litera
 
 from docx.document import Document
 from docx.opc.constants import RELATIONSHIP_TYPE as RT
+from docx.opc.phys_pkg import LazyBlob
+from docx.oxml import iterparse_children
+from docx.oxml.ns import qn
 from docx.parts.hdrftr import FooterPart, HeaderPart
 from docx.parts.numbering import NumberingPart
 from docx.parts.settings import SettingsPart
 from docx.parts.story import BaseStoryPart
 from docx.parts.styles import StylesPart
+from docx.sdt import StructuredDocumentTag
+from docx.section import SectionIndex
 from docx.shape import InlineShapes
 from docx.shared import lazyproperty
+from docx.table import Table
+from docx.text.paragraph import Paragraph
 
 
 class DocumentPart(BaseStoryPart):
@@ -24,6 +31,8 @@ class DocumentPart(BaseStoryPart):
     objects provides access to this part object for that purpose.
     """
 
+    _section_index = None
+
     def add_footer_part(self):
         """Return (footer_part, rId) pair for newly-created footer part."""
         footer_part = FooterPart.new(self.package)
@@ -89,6 +98,34 @@ class DocumentPart(BaseStoryPart):
         """
         return InlineShapes(self._element.body, self)
 
+    def iter_block_items(self):
+        """
+        Generate a |Paragraph|, |Table| or |StructuredDocumentTag| object for
+        each block item in the body of this document, in document order, as
+        :meth:`.Document.iter_block_items` does.
+
+        When this part was loaded lazily and has not been parsed yet, its XML
+        is parsed incrementally as items are generated and is never held in
+        memory whole. Each item is then a read-only snapshot, valid only
+        until the next item is generated, when its element is cleared.
+        Otherwise the items of the body already in memory are generated.
+        """
+        if not isinstance(self._blob, LazyBlob):
+            elements = self._element.body.iterchildren(
+                qn('w:p'), qn('w:tbl'), qn('w:sdt')
+            )
+            return self._block_items_of(elements)
+        return self._iterparse_block_items()
+
+    def iter_hdrftr_parts(self):
+        """
+        Generate each header and footer part of this document, in the order
+        of their relationships.
+        """
+        for rel in self.rels.values():
+            if rel.reltype in (RT.HEADER, RT.FOOTER) and not rel.is_external:
+                yield rel.target_part
+
     @lazyproperty
     def numbering_part(self):
         """
@@ -103,12 +140,38 @@ class DocumentPart(BaseStoryPart):
             self.relate_to(numbering_part, RT.NUMBERING)
             return numbering_part
 
-    def save(self, path_or_stream):
+    def reset_section_index(self):
+        """Discard the section index, to be rebuilt on next use."""
+        self._section_index = None
+
+    @property
+    def resolved_styles(self):
+        """
+        The |ResolvedStyles| memo of the formatting the styles of this
+        document resolve to.
+        """
+        return self._styles_part.resolved_styles
+
+    def save(self, path_or_stream, compression=None, workers=None):
         """
         Save this document to *path_or_stream*, which can be either a path to
-        a filesystem location (a string) or a file-like object.
+        a filesystem location (a string) or a file-like object, compressing
+        parts as directed by the optional |CompressionPolicy| *compression*
+        on *workers* threads.
+        """
+        self.package.save(path_or_stream, compression, workers)
+
+    @property
+    def section_index(self):
+        """|SectionIndex| of the sections in this document.
+
+        It is built on first use and kept until :meth:`reset_section_index` is called,
+        which this library does whenever it adds or removes a section. The index itself
+        rebuilds when a section break it holds is removed from the document directly.
         """
-        self.package.save(path_or_stream)
+        if self._section_index is None:
+            self._section_index = SectionIndex(self._element)
+        return self._section_index
 
     @property
     def settings(self):
@@ -136,6 +199,34 @@ class DocumentPart(BaseStoryPart):
             self._toc_headings=[]
         self.toc_headings.append(bookmark)
 
+    def _block_items_of(self, elements):
+        """
+        Generate a |Paragraph|, |Table| or |StructuredDocumentTag| proxy for
+        each of the `w:p`, `w:tbl` and `w:sdt` elements in *elements*.
+        """
+        for element in elements:
+            tag = element.tag
+            if tag == qn('w:p'):
+                yield Paragraph(element, self)
+            elif tag == qn('w:tbl'):
+                yield Table(element, self)
+            else:
+                yield StructuredDocumentTag(element, self)
+
+    def _iterparse_block_items(self):
+        """
+        Generate the block items of the body of this document while parsing
+        its lazily-loaded XML, see :meth:`iter_block_items`.
+        """
+        stream = self._blob.open()
+        try:
+            for item in self._block_items_of(
+                iterparse_children(stream, 'w:body', ('w:p', 'w:tbl', 'w:sdt'))
+            ):
+                yield item
+        finally:
+            stream.close()
+
     @property
     def _settings_part(self):
         """
@@ -8,10 +8,12 @@ from __future__ import (
     absolute_import, division, print_function, unicode_literals
 )
 
+from contextlib import closing
 import hashlib
 
-from docx.image.image import Image
+from docx.image.image import Image, iter_chunks
 from docx.opc.part import Part
+from docx.opc.phys_pkg import LazyBlob
 from docx.shared import Emu, Inches
 
 
@@ -23,6 +25,7 @@ class ImagePart(Part):
     def __init__(self, partname, content_type, blob, image=None):
         super(ImagePart, self).__init__(partname, content_type, blob)
         self._image = image
+        self._sha1 = None
 
     @property
     def default_cx(self):
@@ -63,9 +66,12 @@ class ImagePart(Part):
     def from_image(cls, image, partname):
         """
         Return an |ImagePart| instance newly created from *image* and
-        assigned *partname*.
+        assigned *partname*. The part refers to the image file on disk
+        rather than holding its bytes when *image* is spooled.
         """
-        return ImagePart(partname, image.content_type, image.blob, image)
+        file_blob = image.file_blob
+        blob = image.blob if file_blob is None else file_blob
+        return ImagePart(partname, image.content_type, blob, image)
 
     @property
     def image(self):
@@ -84,6 +90,27 @@ class ImagePart(Part):
     @property
     def sha1(self):
         """
-        SHA1 hash digest of the blob of this image part.
+        SHA1 hash digest of the blob of this image part. It is computed only
+        once, and taken from the |Image| the part was created from when there
+        is one. The blob of a part loaded lazily is hashed in chunks as it is
+        read from the package rather than loaded whole.
         """
-        return hashlib.sha1(self._blob).hexdigest()
+        if self._sha1 is None:
+            self._sha1 = self._compute_sha1()
+        return self._sha1
+
+    def _compute_sha1(self):
+        """
+        Return the SHA1 hash of the blob of this part, taken from its image
+        when that has been loaded. A lazily loaded blob is hashed in chunks
+        as it is read from the package, without holding it in memory whole.
+        """
+        if self._image is not None:
+            return self._image.sha1
+        if not isinstance(self._blob, LazyBlob):
+            return hashlib.sha1(self._blob).hexdigest()
+        sha1 = hashlib.sha1()
+        with closing(self._blob.open()) as stream:
+            for chunk in iter_chunks(stream):
+                sha1.update(chunk)
+        return sha1.hexdigest()
@@ -47,6 +47,11 @@ class BaseStoryPart(XmlPart):
         """
         return self._document_part.get_style_id(style_or_name, style_type)
 
+    @property
+    def resolved_styles(self):
+        """|ResolvedStyles| memo of the formatting the document styles resolve to."""
+        return self._document_part.resolved_styles
+
     def new_pic_inline(self, image_descriptor, width, height):
         """Return a newly-created `w:inline` element.
 
@@ -54,9 +59,22 @@ class BaseStoryPart(XmlPart):
         based on the values of *width* and *height*.
         """
         rId, image = self.get_or_add_image(image_descriptor)
-        cx, cy = image.scaled_dimensions(width, height)
-        shape_id, filename = self.next_id, image.filename
-        return CT_Inline.new_pic_inline(shape_id, rId, filename, cx, cy)
+        return self._new_pic_inline_for(rId, image, width, height)
+
+    def new_pic_inlines(self, image_descriptors, width=None, height=None, workers=None):
+        """Return list of new `w:inline` element for each of *image_descriptors*.
+
+        Each is created as by :meth:`new_pic_inline`, in order, but the images are
+        loaded on a pool of *workers* threads, see |Package|
+        :meth:`~.Package.get_or_add_image_parts`.
+        """
+        image_parts = self._package.get_or_add_image_parts(image_descriptors, workers)
+        return [
+            self._new_pic_inline_for(
+                self.relate_to(image_part, RT.IMAGE), image_part.image, width, height
+            )
+            for image_part in image_parts
+        ]
 
     @property
     def next_id(self):
@@ -65,12 +83,53 @@ class BaseStoryPart(XmlPart):
         The value is determined by incrementing the maximum existing id value. Gaps in
         the existing id sequence are not filled. The id attribute value is unique in the
         document, without regard to the element type it appears on.
+
+        Each value returned is recorded as used, so every access gives a new id, whether
+        this part or the caller puts it in the story. The story is scanned for the
+        maximum id only once, so this takes constant time however many shapes are
+        added. Ids in an element added to the story some other way, like a copy of
+        a shape keeping its ids, must be passed to `.reserve_ids` to keep them from
+        being reused.
+        """
+        shape_id = self._id_max = self._used_id_max + 1
+        return shape_id
+
+    def reserve_ids(self, element):
+        """Keep the id values used in *element* from being reused by `.next_id`.
+
+        Needed when *element* is removed from this story after being written out, as
+        when streaming a document, so later shapes don't duplicate its ids, and when
+        *element* is added to this story with ids it already has.
+        """
+        id_str_lst = element.xpath('descendant-or-self::*/@id')
+        self._id_max = max(self._used_id_max, self._scan_id_max(id_str_lst))
+
+    _id_max = None
+
+    def _new_pic_inline_for(self, rId, image, width, height):
+        """Return a new `w:inline` element for *image*, related to this part by *rId*.
+
+        The picture is scaled based on the values of *width* and *height* and gets the
+        next available id.
+        """
+        cx, cy = image.scaled_dimensions(width, height)
+        return CT_Inline.new_pic_inline(self.next_id, rId, image.filename, cx, cy)
+
+    @property
+    def _used_id_max(self):
+        """The largest id in use in this story, scanned for on first use."""
+        if self._id_max is None:
+            self._id_max = self._scan_id_max(self._element.xpath('//@id'))
+        return self._id_max
+
+    @staticmethod
+    def _scan_id_max(id_str_lst):
+        """Return the largest integer in *id_str_lst*, 0 if there isn't one.
+
+        Items of *id_str_lst* that are not all digits are ignored.
         """
-        id_str_lst = self._element.xpath('//@id')
         used_ids = [int(id_str) for id_str in id_str_lst if id_str.isdigit()]
-        if not used_ids:
-            return 1
-        return max(used_ids) + 1
+        return max(used_ids) if used_ids else 0
 
     @lazyproperty
     def _document_part(self):
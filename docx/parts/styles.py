@@ -14,7 +14,8 @@ from ..opc.constants import CONTENT_TYPE as CT
 from ..opc.packuri import PackURI
 from ..opc.part import XmlPart
 from ..oxml import parse_xml
-from ..styles.styles import Styles
+from ..shared import lazyproperty
+from ..styles.styles import ResolvedStyles, StyleIndex, Styles
 
 
 class StylesPart(XmlPart):
@@ -33,13 +34,29 @@ class StylesPart(XmlPart):
         element = parse_xml(cls._default_styles_xml())
         return cls(partname, content_type, element, package)
 
+    @lazyproperty
+    def resolved_styles(self):
+        """
+        The |ResolvedStyles| memo of the formatting the styles in this part
+        resolve to, kept for the life of the part.
+        """
+        return ResolvedStyles(self.element, self.style_index)
+
     @property
     def styles(self):
         """
         The |_Styles| instance containing the styles (<w:style> element
         proxies) for this styles part.
         """
-        return Styles(self.element)
+        return Styles(self.element, self)
+
+    @lazyproperty
+    def style_index(self):
+        """
+        The |StyleIndex| of the styles in this part, kept for the life of the
+        part so style lookups by name and id take constant time.
+        """
+        return StyleIndex(self.element)
 
     @classmethod
     def _default_styles_xml(cls):
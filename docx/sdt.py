@@ -0,0 +1,37 @@
+# encoding: utf-8
+
+"""|StructuredDocumentTag| and closely related objects"""
+
+from __future__ import absolute_import, division, print_function, unicode_literals
+
+from docx.shared import Parented
+
+
+class StructuredDocumentTag(Parented):
+    """Proxy for a ``<w:sdt>`` element, a structured document tag.
+
+    Also known as a content control, it wraps block items such as the entries of
+    a table of contents.
+    """
+
+    def __init__(self, sdt, parent):
+        super(StructuredDocumentTag, self).__init__(parent)
+        self._sdt = self._element = sdt
+
+    @property
+    def element(self):
+        """The ``<w:sdt>`` element proxied by this object."""
+        return self._sdt
+
+    def iter_block_items(self):
+        """Generate the block items in the content of this structured document tag.
+
+        Each is a |Paragraph|, |Table| or |StructuredDocumentTag| object, generated in
+        document order.
+        """
+        from docx.blkcntnr import BlockItemContainer
+
+        sdtContent = self._sdt.sdtContent
+        if sdtContent is None:
+            return iter(())
+        return BlockItemContainer(sdtContent, self).iter_block_items()
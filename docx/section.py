@@ -7,7 +7,10 @@ from __future__ import absolute_import, division, print_function, unicode_litera
 from docx.blkcntnr import BlockItemContainer
 from docx.compat import Sequence
 from docx.enum.section import WD_HEADER_FOOTER
+from docx.oxml.ns import qn
 from docx.shared import lazyproperty
+from docx.table import Table
+from docx.text.paragraph import Paragraph
 
 
 class Sections(Sequence):
@@ -24,17 +27,130 @@ class Sections(Sequence):
     def __getitem__(self, key):
         if isinstance(key, slice):
             return [
-                Section(sectPr, self._document_part)
-                for sectPr in self._document_elm.sectPr_lst[key]
+                Section(sectPr, self._document_part) for sectPr in self._sectPr_lst[key]
             ]
-        return Section(self._document_elm.sectPr_lst[key], self._document_part)
+        return Section(self._sectPr_lst[key], self._document_part)
 
     def __iter__(self):
-        for sectPr in self._document_elm.sectPr_lst:
+        for sectPr in self._sectPr_lst:
             yield Section(sectPr, self._document_part)
 
     def __len__(self):
-        return len(self._document_elm.sectPr_lst)
+        return len(self._sectPr_lst)
+
+    @property
+    def _sectPr_lst(self):
+        """The `w:sectPr` elements of the document, from its section index."""
+        return self._document_part.section_index.sectPr_lst
+
+
+class SectionIndex(object):
+    """Index of the sections of a document, built in one pass over its XML.
+
+    Maps each `w:sectPr` element to its position in the document, the `w:sectPr` of the
+    section before it and the body child it ends its section in, which bounds the block
+    items of the section. The document part keeps one, built on first use and discarded
+    when sections are added or removed, so that finding a section or the one before it
+    takes constant time rather than a search of the whole document.
+
+    The entries an operation relies on are checked against the body first, and the
+    index is rebuilt in place when a section break it holds has been removed from the
+    body, as by deleting the paragraph holding it. A `w:sectPr` added to the document
+    other than by adding a section, like a copy of a paragraph holding a section break,
+    is not noticed.
+    """
+
+    def __init__(self, document_elm):
+        super(SectionIndex, self).__init__()
+        self._document_elm = document_elm
+        self._build()
+
+    @property
+    def is_current(self):
+        """True if each indexed `w:sectPr` is still in the body child it was found in.
+
+        This takes time in proportion to the number of sections, not the size of the
+        document.
+        """
+        return all(self._is_current_at(idx) for idx in range(len(self._sectPr_lst)))
+
+    def iter_block_elements(self, sectPr):
+        """Generate each `w:p` and `w:tbl` body child in the section of *sectPr*.
+
+        These are the body children following the one holding the prior `w:sectPr` up to
+        and including the one holding *sectPr*, or up to the end of the body for the
+        last section, whose `w:sectPr` is the last child of the body.
+        """
+        if self._body is None:
+            return
+        idx = self._current_idx(sectPr)
+        prior_child = self._body_child_lst[idx - 1] if idx > 0 else None
+        last_child = self._body_child_lst[idx]
+        children = (
+            iter(self._body) if prior_child is None else prior_child.itersiblings()
+        )
+        for child in children:
+            if child.tag in (qn("w:p"), qn("w:tbl")):
+                yield child
+            if child is last_child:
+                break
+
+    def preceding_sectPr(self, sectPr):
+        """`w:sectPr` of the section before that of *sectPr* or None if it's the first.
+
+        A *sectPr* not in this index is looked for in the document XML.
+        """
+        if sectPr not in self._idx_by_sectPr:
+            return sectPr.preceding_sectPr
+        idx = self._current_idx(sectPr)
+        return self._sectPr_lst[idx - 1] if idx > 0 else None
+
+    @property
+    def sectPr_lst(self):
+        """List of each `w:sectPr` element in the document, in document order."""
+        if not self.is_current:
+            self._build()
+        return self._sectPr_lst
+
+    def _body_child_of(self, sectPr):
+        """The body child that is or contains *sectPr*, None if there isn't one."""
+        child = sectPr
+        for ancestor in sectPr.iterancestors():
+            if ancestor is self._body:
+                return child
+            child = ancestor
+        return None
+
+    def _build(self):
+        """Index the sections of the document afresh."""
+        document_elm = self._document_elm
+        self._body = document_elm.body
+        self._sectPr_lst = document_elm.xpath(".//w:sectPr")
+        self._idx_by_sectPr = {
+            sectPr: idx for idx, sectPr in enumerate(self._sectPr_lst)
+        }
+        self._body_child_lst = [self._body_child_of(s) for s in self._sectPr_lst]
+
+    def _current_idx(self, sectPr):
+        """Position of *sectPr*, after rebuilding if it or the one before it is stale.
+
+        Raises |KeyError| if *sectPr* is not a section break of the document.
+        """
+        idx = self._idx_by_sectPr[sectPr]
+        is_current = self._is_current_at(idx) and (
+            idx == 0 or self._is_current_at(idx - 1)
+        )
+        if not is_current:
+            self._build()
+            idx = self._idx_by_sectPr[sectPr]
+        return idx
+
+    def _is_current_at(self, idx):
+        """True if the `w:sectPr` at *idx* is in the body child it was indexed in."""
+        sectPr, child = self._sectPr_lst[idx], self._body_child_lst[idx]
+        if child is None or child.getparent() is not self._body:
+            return False
+        return sectPr is child or self._body_child_of(sectPr) is child
 
 
 class Section(object):
@@ -167,6 +283,19 @@ class Section(object):
     def header_distance(self, value):
         self._sectPr.header = value
 
+    def iter_block_items(self):
+        """Generate each |Paragraph| or |Table| in this section, in document order.
+
+        The paragraph holding the section break that ends a section is the last item of
+        that section.
+        """
+        section_index = self._document_part.section_index
+        for element in section_index.iter_block_elements(self._sectPr):
+            if element.tag == qn("w:tbl"):
+                yield Table(element, self._document_part)
+            else:
+                yield Paragraph(element, self._document_part)
+
     @property
     def left_margin(self):
         """
@@ -325,21 +454,22 @@ class _BaseHeaderFooter(BlockItemContainer):
         """Return HeaderPart or FooterPart object for this section.
 
         If this header/footer inherits its content, the part for the prior header/footer
-        is returned; this process continue recursively until a definition is found. If
-        the definition cannot be inherited (because the header/footer belongs to the
-        first section), a new definition is added for that first section and then
-        returned.
+        is returned; this process continues, section by section, until a definition is
+        found. If the definition cannot be inherited (because the header/footer belongs
+        to the first section), a new definition is added for that first section and then
+        returned. Prior sections are walked in a loop rather than by recursion, so a
+        document of any number of sections can inherit from its first.
         """
-        # ---note this method is called recursively to access inherited definitions---
+        headerfooter = self
         # ---case-1: definition is not inherited---
-        if self._has_definition:
-            return self._definition
-        # ---case-2: definition is inherited and belongs to second-or-later section---
-        prior_headerfooter = self._prior_headerfooter
-        if prior_headerfooter:
-            return prior_headerfooter._get_or_add_definition()
-        # ---case-3: definition is inherited, but belongs to first section---
-        return self._add_definition()
+        while not headerfooter._has_definition:
+            # ---case-2: definition is inherited, belongs to second-or-later section---
+            prior_headerfooter = headerfooter._prior_headerfooter
+            # ---case-3: definition is inherited, but belongs to first section---
+            if prior_headerfooter is None:
+                return headerfooter._add_definition()
+            headerfooter = prior_headerfooter
+        return headerfooter._definition
 
     @property
     def _has_definition(self):
@@ -391,7 +521,9 @@ class _Footer(_BaseHeaderFooter):
     @property
     def _prior_headerfooter(self):
         """|_Footer| proxy on prior sectPr element or None if this is first section."""
-        preceding_sectPr = self._sectPr.preceding_sectPr
+        preceding_sectPr = self._document_part.section_index.preceding_sectPr(
+            self._sectPr
+        )
         return (
             None
             if preceding_sectPr is None
@@ -435,7 +567,9 @@ class _Header(_BaseHeaderFooter):
     @property
     def _prior_headerfooter(self):
         """|_Header| proxy on prior sectPr element or None if this is first section."""
-        preceding_sectPr = self._sectPr.preceding_sectPr
+        preceding_sectPr = self._document_part.section_index.preceding_sectPr(
+            self._sectPr
+        )
         return (
             None
             if preceding_sectPr is None
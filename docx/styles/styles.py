@@ -4,8 +4,13 @@
 
 from __future__ import absolute_import, division, print_function, unicode_literals
 
+from copy import deepcopy
 from warnings import warn
 
+from docx.enum.style import WD_STYLE_TYPE
+from docx.oxml import OxmlElement
+from docx.oxml.ns import qn
+from docx.oxml.styles import layer_props
 from docx.shared import ElementProxy
 from docx.styles import BabelFish
 from docx.styles.latent import LatentStyles
@@ -26,10 +31,7 @@ class Styles(ElementProxy):
         Enables `in` operator on style name.
         """
         internal_name = BabelFish.ui2internal(name)
-        for style in self._element.style_lst:
-            if style.name_val == internal_name:
-                return True
-        return False
+        return self._style_index.get_by_name(internal_name) is not None
 
     def __getitem__(self, key):
         """
@@ -37,11 +39,12 @@ class Styles(ElementProxy):
         deprecated, triggers a warning, and will be removed in a near-future
         release.
         """
-        style_elm = self._element.get_by_name(BabelFish.ui2internal(key))
+        style_index = self._style_index
+        style_elm = style_index.get_by_name(BabelFish.ui2internal(key))
         if style_elm is not None:
             return StyleFactory(style_elm)
 
-        style_elm = self._element.get_by_id(key)
+        style_elm = style_index.get_by_id(key)
         if style_elm is not None:
             msg = (
                 'style lookup by style_id is deprecated. Use style name as '
@@ -70,6 +73,8 @@ class Styles(ElementProxy):
         style = self._element.add_style_of_type(
             style_name, style_type, builtin
         )
+        self._style_index.add(style)
+        self._resolved_styles.clear()
         return StyleFactory(style)
 
     def default(self, style_type):
@@ -77,7 +82,7 @@ class Styles(ElementProxy):
         Return the default style for *style_type* or |None| if no default is
         defined for that type (not common).
         """
-        style = self._element.default_for(style_type)
+        style = self._style_index.default_for(style_type)
         if style is None:
             return None
         return StyleFactory(style)
@@ -118,13 +123,22 @@ class Styles(ElementProxy):
         """
         return LatentStyles(self._element.get_or_add_latentStyles())
 
+    def reset_effective_formatting(self):
+        """
+        Discard the formatting resolved from these styles for the effective
+        formatting of paragraphs and runs, so changes made to the style
+        definitions since it was resolved are reflected in it. Adding a style
+        with :meth:`add_style` does this itself.
+        """
+        self._resolved_styles.clear()
+
     def _get_by_id(self, style_id, style_type):
         """
         Return the style of *style_type* matching *style_id*. Returns the
         default for *style_type* if *style_id* is not found or if the style
         having *style_id* is not of *style_type*.
         """
-        style = self._element.get_by_id(style_id)
+        style = self._style_index.get_by_id(style_id)
         if style is None or style.type != style_type:
             return self.default(style_type)
         return StyleFactory(style)
@@ -151,3 +165,251 @@ class Styles(ElementProxy):
         if style == self.default(style_type):
             return None
         return style.style_id
+
+    @property
+    def _style_index(self):
+        """
+        The |StyleIndex| kept by the styles part these styles belong to, or
+        a new one when they don't belong to a part.
+        """
+        if self._parent is None:
+            return StyleIndex(self._element)
+        return self._parent.style_index
+
+    @property
+    def _resolved_styles(self):
+        """
+        The |ResolvedStyles| kept by the styles part these styles belong to,
+        or a new one when they don't belong to a part.
+        """
+        if self._parent is None:
+            return ResolvedStyles(self._element, self._style_index)
+        return self._parent.resolved_styles
+
+
+class StyleIndex(object):
+    """
+    Index of the ``<w:style>`` elements of a styles part by name and by
+    style id, and of the default style of each style type, for lookups in
+    constant time rather than by a search of every style.
+
+    It is built in one pass over the styles on first use. Each entry is
+    checked against its element when it's used, so a style deleted or
+    renamed since is looked up afresh, and a style not in the index is
+    searched for in the XML and added when found. Styles added by
+    :meth:`.Styles.add_style` are added as they are created.
+    """
+
+    def __init__(self, styles_elm):
+        super(StyleIndex, self).__init__()
+        self._styles_elm = styles_elm
+        self._by_name = None
+        self._by_id = None
+        self._default_by_type = {}
+
+    def add(self, style):
+        """
+        Index *style*, a ``<w:style>`` element just added to the styles
+        part, under its name and style id unless another style has them.
+        """
+        self._index()
+        for index, key, key_of in (
+            (self._by_name, style.name_val, _name_of),
+            (self._by_id, style.styleId, _id_of),
+        ):
+            if not self._is_valid(index.get(key), key, key_of):
+                index[key] = style
+
+    def default_for(self, style_type):
+        """
+        Return the default ``<w:style>`` element of *style_type*, or |None|
+        if there isn't one.
+        """
+        style = self._default_by_type.get(style_type)
+        if (
+            style is None or style.getparent() is not self._styles_elm or
+            style.type != style_type or not style.default
+        ):
+            style = self._styles_elm.default_for(style_type)
+            self._default_by_type[style_type] = style
+        return style
+
+    def get_by_id(self, style_id):
+        """
+        Return the ``<w:style>`` element having *style_id*, or |None| if
+        not found.
+        """
+        self._index()
+        return self._lookup(
+            self._by_id, style_id, _id_of, self._styles_elm.get_by_id
+        )
+
+    def get_by_name(self, name):
+        """
+        Return the ``<w:style>`` element having *name*, or |None| if not
+        found.
+        """
+        self._index()
+        return self._lookup(
+            self._by_name, name, _name_of, self._styles_elm.get_by_name
+        )
+
+    def _index(self):
+        """
+        Index the styles by name and by style id if not done yet, the
+        first of any having the same name or id taking it, as a search
+        finds it.
+        """
+        if self._by_name is not None:
+            return
+        by_name, by_id = {}, {}
+        for style in self._styles_elm.style_lst:
+            by_name.setdefault(style.name_val, style)
+            by_id.setdefault(style.styleId, style)
+        self._by_name, self._by_id = by_name, by_id
+
+    def _is_valid(self, style, key, key_of):
+        """
+        |True| if *style* is still a style in the styles part having *key*
+        as given by *key_of*.
+        """
+        return (
+            style is not None and style.getparent() is self._styles_elm and
+            key_of(style) == key
+        )
+
+    def _lookup(self, index, key, key_of, find):
+        """
+        Return the style in *index* under *key* when it still has it,
+        otherwise the one *find* finds for *key* in the XML, which is then
+        indexed. |None| when there isn't one.
+        """
+        style = index.get(key)
+        if self._is_valid(style, key, key_of):
+            return style
+        style = find(key)
+        if style is None:
+            index.pop(key, None)
+        else:
+            index[key] = style
+        return style
+
+
+class ResolvedStyles(object):
+    """
+    Memo of the formatting the styles of a styles part resolve to, keyed by
+    style id, from which the effective formatting of a paragraph or run is
+    computed.
+
+    A style resolves to the properties of the styles in its ``basedOn``
+    chain, layered from the root style down. Each style is resolved when
+    first needed, as are the paragraph properties of each paragraph style
+    and the run properties of each pairing of paragraph and character style
+    over the document defaults. Changes made to the style definitions after
+    that are not noticed until :meth:`clear` is called.
+    """
+
+    def __init__(self, styles_elm, style_index):
+        super(ResolvedStyles, self).__init__()
+        self._styles_elm = styles_elm
+        self._style_index = style_index
+        self._props_by_style = {}
+        self._pPr_by_style = {}
+        self._rPr_by_styles = {}
+
+    def clear(self):
+        """
+        Discard everything resolved so far.
+        """
+        self._props_by_style.clear()
+        self._pPr_by_style.clear()
+        self._rPr_by_styles.clear()
+
+    def paragraph_properties(self, p):
+        """
+        Return a new ``<w:pPr>`` element holding the paragraph properties in
+        effect for *p*, a ``<w:p>`` element. These are the document defaults,
+        overlaid by the properties of its paragraph style and then by those
+        applied directly to it.
+        """
+        style_id = p.style
+        pPr = self._pPr_by_style.get(style_id)
+        if pPr is None:
+            style_pPr = self._resolve(style_id, WD_STYLE_TYPE.PARAGRAPH)[0]
+            pPr = OxmlElement('w:pPr')
+            layer_props(pPr, self._styles_elm.default_pPr)
+            layer_props(pPr, style_pPr)
+            self._pPr_by_style[style_id] = pPr
+        pPr = deepcopy(pPr)
+        layer_props(pPr, p.pPr)
+        return pPr
+
+    def run_properties(self, r):
+        """
+        Return a new ``<w:rPr>`` element holding the run properties in effect
+        for *r*, a ``<w:r>`` element. These are the document defaults,
+        overlaid by the run properties of the paragraph style of the
+        paragraph it is in, then by those of its character style, which
+        toggle rather than replace properties such as bold, and then by
+        those applied directly to it.
+        """
+        p = next(r.iterancestors(qn('w:p')), None)
+        key = (None if p is None else p.style, r.style)
+        rPr = self._rPr_by_styles.get(key)
+        if rPr is None:
+            paragraph_rPr = self._resolve(key[0], WD_STYLE_TYPE.PARAGRAPH)[1]
+            character_rPr = self._resolve(key[1], WD_STYLE_TYPE.CHARACTER)[1]
+            styles_rPr = deepcopy(paragraph_rPr)
+            layer_props(styles_rPr, character_rPr, toggle=True)
+            rPr = OxmlElement('w:rPr')
+            layer_props(rPr, self._styles_elm.default_rPr)
+            layer_props(rPr, styles_rPr)
+            self._rPr_by_styles[key] = rPr
+        rPr = deepcopy(rPr)
+        layer_props(rPr, r.rPr)
+        return rPr
+
+    def _chain(self, style_id, style_type):
+        """
+        Return the list of ``<w:style>`` elements in the ``basedOn`` chain
+        of the style of *style_type* having *style_id*, starting with that
+        style. The default style of *style_type* takes its place when
+        *style_id* is |None| or is not the id of a style of *style_type*.
+        A chain that loops back on itself ends before the repeated style.
+        """
+        style = None
+        if style_id is not None:
+            style = self._style_index.get_by_id(style_id)
+        if style is None or style.type != style_type:
+            style = self._style_index.default_for(style_type)
+        chain = []
+        while style is not None and style not in chain:
+            chain.append(style)
+            base_id = style.basedOn_val
+            style = None if base_id is None else self._style_index.get_by_id(
+                base_id
+            )
+        return chain
+
+    def _resolve(self, style_id, style_type):
+        """
+        Return a `(pPr, rPr)` pair of elements holding the paragraph and run
+        properties the style of *style_type* having *style_id* resolves to.
+        """
+        key = (style_id, style_type)
+        props = self._props_by_style.get(key)
+        if props is None:
+            pPr, rPr = OxmlElement('w:pPr'), OxmlElement('w:rPr')
+            for style in reversed(self._chain(style_id, style_type)):
+                layer_props(pPr, style.pPr)
+                layer_props(rPr, style.rPr)
+            props = self._props_by_style[key] = (pPr, rPr)
+        return props
+
+
+def _id_of(style):
+    return style.styleId
+
+
+def _name_of(style):
+    return style.name_val
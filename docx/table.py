@@ -6,7 +6,8 @@ The |Table| object and related proxy classes.
 
 from __future__ import absolute_import, print_function, unicode_literals
 
-from .. import parse_xml
+import weakref
+
 from .blkcntnr import BlockItemContainer
 from .enum.style import WD_STYLE_TYPE
 from .oxml.simpletypes import ST_Merge
@@ -32,6 +33,7 @@ class Table(Parented):
         for tr in self._tbl.tr_lst:
             tc = tr.add_tc()
             tc.width = width
+        self._reset_cells()
         return _Column(gridCol, self)
 
     def add_row(self):
@@ -39,12 +41,44 @@ class Table(Parented):
         Return a |_Row| instance, newly added bottom-most to the table.
         """
         tbl = self._tbl
+        cell_grid = self._current_cell_grid
         tr = tbl.add_tr()
         for gridCol in tbl.tblGrid.gridCol_lst:
             tc = tr.add_tc()
             tc.width = gridCol.w
+        if cell_grid is not None:
+            cell_grid.extend([tr], self)
         return _Row(tr, self)
 
+    def add_rows(self, n_or_data, template_row=None):
+        """
+        Return a list of |_Row| objects newly added bottom-most to the table
+        in a single operation. *n_or_data* is either the number of empty rows
+        to add or an iterable of rows, each a sequence of values to set as
+        the text of its cells in turn; |None| leaves a cell empty and other
+        values are converted with ``str()``.
+
+        Each row is a copy of *template_row*, by default the last row of the
+        table, with the same row and cell properties and with each cell
+        formatted like the first paragraph and run of the template cell, so
+        formatting applied to a prototype row carries over to all the rows.
+        Vertical merges are not copied. Raises |ValueError| if a row of
+        *n_or_data* has more values than the template row has cells. When
+        the table has no rows, the new rows are like those of
+        :meth:`add_row`.
+        """
+        tbl = self._tbl
+        if template_row is not None:
+            template_tr = template_row._tr
+        else:
+            tr_lst = tbl.tr_lst
+            template_tr = tr_lst[-1] if tr_lst else None
+        cell_grid = self._current_cell_grid
+        trs = tbl.add_trs(n_or_data, template_tr)
+        if cell_grid is not None:
+            cell_grid.extend(trs, self)
+        return [_Row(tr, self) for tr in trs]
+
     @property
     def alignment(self):
         """
@@ -78,8 +112,9 @@ class Table(Parented):
         Return |_Cell| instance correponding to table cell at *row_idx*,
         *col_idx* intersection, where (0, 0) is the top, left-most cell.
         """
-        cell_idx = col_idx + (row_idx * self._column_count)
-        return self._cells[cell_idx]
+        cell_grid = self._cell_grid_at(row_idx)
+        cell_idx = col_idx + (row_idx * cell_grid.col_count)
+        return cell_grid.cells[cell_idx]
 
     def column_cells(self, column_idx):
         """
@@ -101,10 +136,11 @@ class Table(Parented):
         """
         Sequence of cells in the row at *row_idx* in this table.
         """
-        column_count = self._column_count
+        cell_grid = self._cell_grid_at(row_idx)
+        column_count = cell_grid.col_count
         start = row_idx * column_count
         end = start + column_count
-        return self._cells[start:end]
+        return cell_grid.cells[start:end]
 
     @lazyproperty
     def rows(self):
@@ -164,32 +200,152 @@ class Table(Parented):
         """
         A sequence of |_Cell| objects, one for each cell of the layout grid.
         If the table contains a span, one or more |_Cell| object references
-        are repeated.
-        """
-        col_count = self._column_count
-        cells = []
-        for tc in self._tbl.iter_tcs():
-            for grid_span_idx in range(tc.grid_span):
-                if tc.vMerge == ST_Merge.CONTINUE:
-                    cells.append(cells[-col_count])
-                elif grid_span_idx > 0:
-                    cells.append(cells[-1])
-                else:
-                    cells.append(_Cell(tc, self))
-        return cells
+        are repeated. The grid is built on first use and kept in
+        `_cell_grids`, shared by every |Table| object on the same ``<w:tbl>``
+        element, so cell access by position doesn't resolve the spans of the
+        whole table again. It is extended when rows are added and discarded
+        when columns are added or cells merged. It is also rebuilt when the
+        rows of the ``<w:tbl>`` element are no longer the ones it was built
+        from, in the same places, as when rows are added, removed or moved in
+        the XML directly. Other direct changes to the XML, like cells added
+        to a row, are not noticed.
+        """
+        return self._cell_grid.cells
+
+    @property
+    def _cell_grid(self):
+        """
+        The |_CellGrid| of this table, built afresh if there isn't a current
+        one.
+        """
+        cell_grid = self._current_cell_grid
+        if cell_grid is None:
+            cell_grid = _cell_grids[self._tbl] = _CellGrid(self._tbl, self)
+        return cell_grid
+
+    def _cell_grid_at(self, row_idx):
+        """
+        The |_CellGrid| of this table, built afresh unless there is one
+        current for the row at *row_idx*. Only the rows the cells of that row
+        come from are checked, which is much cheaper than checking them all.
+        """
+        cell_grid = _cell_grids.get(self._tbl)
+        if cell_grid is None or not cell_grid.is_current_at(row_idx):
+            cell_grid = _cell_grids[self._tbl] = _CellGrid(self._tbl, self)
+        return cell_grid
 
     @property
     def _column_count(self):
         """
         The number of grid columns in this table.
         """
-        return self._tbl.col_count
+        return self._cell_grid.col_count
+
+    @property
+    def _current_cell_grid(self):
+        """
+        The |_CellGrid| kept for the ``<w:tbl>`` element if it is still in
+        step with it, otherwise |None|.
+        """
+        cell_grid = _cell_grids.get(self._tbl)
+        if cell_grid is None or not cell_grid.is_current:
+            return None
+        return cell_grid
+
+    def _reset_cells(self):
+        """
+        Discard the cell grid of this table after a change to its layout,
+        so it is built afresh on next use.
+        """
+        _cell_grids.pop(self._tbl, None)
 
     @property
     def _tblPr(self):
         return self._tbl.tblPr
 
 
+# the |_CellGrid| of each `w:tbl` element in use, shared by its |Table| objects
+_cell_grids = weakref.WeakKeyDictionary()
+
+
+class _CellGrid(object):
+    """
+    The layout grid of the cells of a ``<w:tbl>`` element, a |_Cell| object
+    for each grid cell in row-major order, along with the number of grid
+    columns. The |_Cell| objects have the |Table| object that built the grid
+    as their parent. The position among the children of the ``<w:tbl>``
+    element of the ``<w:tr>`` of each row is recorded, so the grid can tell
+    whether rows have been moved since.
+    """
+
+    def __init__(self, tbl, table):
+        super(_CellGrid, self).__init__()
+        self._tbl = tbl
+        self.col_count = tbl.col_count
+        self.cells = []
+        self._trs = []
+        self._tr_child_idxs = []
+        self._continues_above = []
+        self.extend(tbl.tr_lst, table)
+
+    def extend(self, trs, table):
+        """
+        Add the grid cells of *trs*, ``<w:tr>`` elements just added to the
+        end of the table, with *table* as their parent.
+        """
+        cells, col_count = self.cells, self.col_count
+        for tr in trs:
+            continues_above = False
+            for tc in tr.tc_lst:
+                for grid_span_idx in range(tc.grid_span):
+                    if tc.vMerge == ST_Merge.CONTINUE:
+                        cells.append(cells[-col_count])
+                        continues_above = True
+                    elif grid_span_idx > 0:
+                        cells.append(cells[-1])
+                    else:
+                        cells.append(_Cell(tc, table))
+            self._trs.append(tr)
+            self._continues_above.append(continues_above)
+        self._children = children = list(self._tbl)
+        child_idxs = {child: idx for idx, child in enumerate(children)}
+        self._tr_child_idxs.extend(
+            child_idxs[tr] for tr in self._trs[len(self._tr_child_idxs):]
+        )
+
+    @property
+    def is_current(self):
+        """
+        |True| if the children of the ``<w:tbl>`` element are the same
+        elements, in the same order, as when this grid was last brought up
+        to date.
+        """
+        return list(self._tbl) == self._children
+
+    def is_current_at(self, row_idx):
+        """
+        |True| if the rows the grid cells of the row at *row_idx* come from
+        are where they were when this grid was last brought up to date. That
+        is the row itself and, for a row having cells vertically merged with
+        those above, the rows above it up to the first row not so merged.
+        A row is where it was when it has the same position among all the
+        children of the ``<w:tbl>`` element, which is found in C. Changes to
+        rows after these don't matter.
+        """
+        tbl = self._tbl
+        if not 0 <= row_idx < len(self._trs):
+            return False
+        while True:
+            tr = self._trs[row_idx]
+            if tr.getparent() is not tbl:
+                return False
+            if tbl.index(tr) != self._tr_child_idxs[row_idx]:
+                return False
+            if row_idx == 0 or not self._continues_above[row_idx]:
+                return True
+            row_idx -= 1
+
+
 class _Cell(BlockItemContainer):
     """Table cell"""
 
@@ -231,6 +387,7 @@ class _Cell(BlockItemContainer):
         """
         tc, tc_2 = self._tc, other_cell._tc
         merged_tc = tc.merge(tc_2)
+        _cell_grids.pop(merged_tc._tbl, None)
         return _Cell(merged_tc, self._parent)
 
     @property
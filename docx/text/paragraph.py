@@ -105,6 +105,22 @@ class Paragraph(Parented):
         self._p.clear_content()
         return self
 
+    @property
+    def effective_format(self):
+        """
+        A |ParagraphFormat| object holding the paragraph formatting this
+        paragraph is rendered with, each property resolved through the
+        formatting applied directly to the paragraph, its style, the styles
+        that is based on and the document defaults. A property is |None|
+        only when none of these sets it. The object is a snapshot not
+        connected to the document, so assigning to its properties has no
+        effect on the paragraph. The formatting of the styles is resolved
+        once per document; see :meth:`.Styles.reset_effective_formatting`.
+        """
+        p = OxmlElement('w:p')
+        p.append(self.part.resolved_styles.paragraph_properties(self._p))
+        return ParagraphFormat(p)
+
     def insert_paragraph_before(self, text=None, style=None):
         """
         Return a newly created paragraph, inserted directly before this
@@ -158,9 +174,9 @@ class Paragraph(Parented):
     @property
     def text(self):
         """
-        String formed by concatenating the text of each run in the paragraph.
-        Tabs and line breaks in the XML are mapped to ``\\t`` and ``\\n``
-        characters respectively.
+        String formed by concatenating the text of each run in the paragraph,
+        including the runs in its hyperlinks. Tabs and line breaks in the XML
+        are mapped to ``\\t`` and ``\\n`` characters respectively.
 
         Assigning text to this property causes all existing paragraph content
         to be replaced with a single run containing the assigned text.
@@ -169,10 +185,7 @@ class Paragraph(Parented):
         Paragraph-level formatting, such as style, is preserved. All
         run-level formatting, such as bold or italic, is removed.
         """
-        text = ''
-        for run in self.runs:
-            text += run.text
-        return text
+        return self._p.text
 
     @text.setter
     def text(self, text):
@@ -9,6 +9,7 @@ from __future__ import absolute_import, print_function, unicode_literals
 from ..enum.style import WD_STYLE_TYPE
 from ..enum.text import WD_BREAK
 from .font import Font
+from ..oxml import OxmlElement
 from ..shape import InlineShape
 from ..shared import Parented
 
@@ -99,6 +100,22 @@ class Run(Parented):
         self._r.clear_content()
         return self
 
+    @property
+    def effective_font(self):
+        """
+        A |Font| object holding the character formatting this run is
+        rendered with, each property resolved through the formatting applied
+        directly to the run, its character style, the style of its paragraph,
+        the styles these are based on and the document defaults. A property
+        is |None| only when none of these sets it. The object is a snapshot
+        not connected to the document, so assigning to its properties has no
+        effect on the run. The formatting of the styles is resolved once per
+        document; see :meth:`.Styles.reset_effective_formatting`.
+        """
+        r = OxmlElement('w:r')
+        r.append(self.part.resolved_styles.run_properties(self._r))
+        return Font(r)
+
     @property
     def font(self):
         """
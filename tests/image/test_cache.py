@@ -0,0 +1,106 @@
+# encoding: utf-8
+
+"""Unit test suite for docx.image.cache module"""
+
+from __future__ import absolute_import, print_function, unicode_literals
+
+import os
+import shutil
+
+from docx.compat import BytesIO
+from docx.image.cache import ImageCache, image_cache
+from docx.image.image import Image
+
+from ..unitutil.file import test_file
+
+
+class DescribeImageCache(object):
+
+    def it_reuses_the_image_loaded_from_a_path(self):
+        cache = ImageCache()
+        path = test_file('python-icon.png')
+
+        image = cache.image(path)
+
+        assert isinstance(image, Image)
+        assert image.filename == 'python-icon.png'
+        assert cache.image(path) is image
+        assert (cache.hits, cache.misses) == (1, 1)
+        assert cache.size == len(image.blob)
+
+    def it_reloads_an_image_file_that_has_changed(self, tmpdir):
+        cache = ImageCache()
+        path = str(tmpdir.join('logo.png'))
+        shutil.copy(test_file('python-icon.png'), path)
+        image = cache.image(path)
+
+        shutil.copy(test_file('monty-truth.png'), path)
+        os.utime(path, (0, 0))
+
+        changed_image = cache.image(path)
+        assert changed_image is not image
+        assert changed_image.px_width == 150
+        assert (cache.hits, cache.misses) == (0, 2)
+
+    def it_reuses_the_image_loaded_from_a_stream_with_the_same_content(self):
+        cache = ImageCache()
+        with open(test_file('python-icon.png'), 'rb') as f:
+            blob = f.read()
+
+        image = cache.image(BytesIO(blob))
+
+        assert cache.image(BytesIO(blob)) is image
+        assert image.filename == 'image.png'
+        assert (cache.hits, cache.misses) == (1, 1)
+
+    def it_discards_the_least_recently_used_images_to_stay_in_size(self):
+        paths = [
+            test_file(name) for name in
+            ('python-icon.png', 'monty-truth.png', 'sonic.gif')
+        ]
+        sizes = [os.path.getsize(path) for path in paths]
+        cache = ImageCache(max_bytes=sizes[0] + sizes[1] + sizes[2] - 1)
+        for path in paths[:2]:
+            cache.image(path)
+        cache.image(paths[0])
+
+        cache.image(paths[2])
+
+        assert len(cache) == 2
+        assert cache.size == sizes[0] + sizes[2]
+        cache.image(paths[0])
+        assert (cache.hits, cache.misses) == (2, 3)
+
+    def it_discards_images_when_its_size_limit_is_lowered(self):
+        cache = ImageCache()
+        cache.image(test_file('python-icon.png'))
+        cache.image(test_file('monty-truth.png'))
+
+        cache.max_bytes = 65000
+
+        assert len(cache) == 1
+        assert cache.max_bytes == 65000
+        cache.max_bytes = 0
+        assert (len(cache), cache.size) == (0, 0)
+
+    def it_is_off_by_default_for_the_process_wide_cache(self):
+        path = test_file('python-icon.png')
+
+        assert image_cache.max_bytes == 0
+        assert image_cache.image(path) is not image_cache.image(path)
+        assert len(image_cache) == 0
+
+    def it_does_not_cache_an_image_larger_than_its_size_limit(self):
+        cache = ImageCache(max_bytes=0)
+        path = test_file('python-icon.png')
+
+        assert cache.image(path) is not cache.image(path)
+        assert len(cache) == 0
+
+    def it_can_clear_its_images_and_counters(self):
+        cache = ImageCache()
+        cache.image(test_file('python-icon.png'))
+
+        cache.clear()
+
+        assert (len(cache), cache.size, cache.hits, cache.misses) == (0, 0, 0, 0)
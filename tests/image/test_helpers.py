@@ -10,7 +10,9 @@ import pytest
 
 from docx.compat import BytesIO
 from docx.image.exceptions import UnexpectedEndOfFileError
-from docx.image.helpers import BIG_ENDIAN, LITTLE_ENDIAN, StreamReader
+from docx.image.helpers import (
+    BIG_ENDIAN, closing_buffer, LITTLE_ENDIAN, StreamReader
+)
 
 
 class DescribeStreamReader(object):
@@ -31,8 +33,46 @@ class DescribeStreamReader(object):
         long_ = stream_rdr.read_long(offset)
         assert long_ == expected_int
 
+    def it_can_read_a_short(self):
+        stream_rdr = StreamReader(BytesIO(b'\x00\x01\x02'), LITTLE_ENDIAN)
+        assert stream_rdr.read_short(1) == 0x0201
+        with pytest.raises(UnexpectedEndOfFileError):
+            stream_rdr.read_short(2)
+
+    def it_reads_values_from_the_bytes_of_the_stream(self, buffer_fixture):
+        stream, expected_bytes = buffer_fixture
+        stream_rdr = StreamReader(stream, BIG_ENDIAN, base_offset=2)
+        assert stream_rdr.buffer[:] == expected_bytes
+        assert stream_rdr.read_str(6, 0) == 'foobar'
+        assert stream_rdr.read_byte(6, 1) == 4
+
+    def it_closes_the_memory_map_of_a_file_when_done(self, tmpdir):
+        path = str(tmpdir.join('image.bin'))
+        with open(path, 'wb') as f:
+            f.write(b'\x01\x02foobar\x03\x04')
+
+        with open(path, 'rb') as stream:
+            with closing_buffer(stream):
+                stream_rdr = StreamReader(stream, BIG_ENDIAN)
+                buffer = stream_rdr.buffer
+                assert StreamReader(stream, LITTLE_ENDIAN).buffer is buffer
+                assert stream_rdr.read_str(6, 2) == 'foobar'
+            assert buffer.closed
+
     # fixtures -------------------------------------------------------
 
+    @pytest.fixture(params=['memory', 'file'])
+    def buffer_fixture(self, request, tmpdir):
+        bytes_ = b'\x01\x02foobar\x03\x04'
+        if request.param == 'memory':
+            return BytesIO(bytes_), bytes_
+        path = str(tmpdir.join('image.bin'))
+        with open(path, 'wb') as f:
+            f.write(bytes_)
+        stream = open(path, 'rb')
+        request.addfinalizer(stream.close)
+        return stream, bytes_
+
     @pytest.fixture(params=[
         (BIG_ENDIAN,    b'\xBE\x00\x00\x00\x2A\xEF', 1, 42),
         (LITTLE_ENDIAN, b'\xBE\xEF\x2A\x00\x00\x00', 2, 42),
@@ -4,6 +4,10 @@
 
 from __future__ import absolute_import, print_function, unicode_literals
 
+import gc
+import hashlib
+import os
+
 import pytest
 
 from docx.compat import BytesIO
@@ -45,13 +49,17 @@ class DescribeImage(object):
             from_path_fixture
         )
         image = Image.from_file(image_path)
-        _from_stream_.assert_called_once_with(stream_, blob, filename)
+        _from_stream_.assert_called_once_with(
+            stream_, blob, filename, hashlib.sha1(blob).hexdigest()
+        )
         assert image is image_
 
     def it_can_construct_from_an_image_file_like(self, from_filelike_fixture):
         image_stream, _from_stream_, blob, image_ = from_filelike_fixture
         image = Image.from_file(image_stream)
-        _from_stream_.assert_called_once_with(image_stream, blob, None)
+        _from_stream_.assert_called_once_with(
+            image_stream, blob, None, hashlib.sha1(blob).hexdigest()
+        )
         assert image is image_
 
     def it_can_construct_from_an_image_stream(self, from_stream_fixture):
@@ -62,7 +70,9 @@ class DescribeImage(object):
         image = Image._from_stream(stream_, blob_, filename_in)
 
         _ImageHeaderFactory_.assert_called_once_with(stream_)
-        Image__init_.assert_called_once_with(ANY, blob_, filename_out, image_header_)
+        Image__init_.assert_called_once_with(
+            ANY, blob_, filename_out, image_header_, None
+        )
         assert isinstance(image, Image)
 
     def it_provides_access_to_the_image_blob(self):
@@ -116,6 +126,40 @@ class DescribeImage(object):
         image = Image(blob, None, None)
         assert image.sha1 == '4921e7002ddfba690a937d54bda226a7b8bdeb68'
 
+    def it_uses_the_sha1_it_was_given_when_read_from_a_file(self):
+        image = Image(b'fO0Bar', None, None, 'foobar')
+        assert image.sha1 == 'foobar'
+
+    def it_can_spool_an_image_file_rather_than_read_it(self):
+        path = test_file('python-icon.png')
+        with open(path, 'rb') as f:
+            blob = f.read()
+
+        image = Image.from_file(path, spool=True)
+
+        assert image.file_blob.path == os.path.abspath(path)
+        assert image.blob == blob
+        assert image.sha1 == hashlib.sha1(blob).hexdigest()
+        assert image.filename == 'python-icon.png'
+        assert (image.px_width, image.px_height) == (24, 24)
+
+    def it_can_spool_an_image_stream_to_a_temporary_file(self):
+        with open(test_file('python-icon.png'), 'rb') as f:
+            blob = f.read()
+
+        image = Image.from_file(BytesIO(blob), spool=True)
+        path = image.file_blob.path
+
+        assert image.blob == blob
+        assert image.sha1 == hashlib.sha1(blob).hexdigest()
+        assert image.filename == 'image.png'
+        del image
+        gc.collect()
+        assert not os.path.exists(path)
+
+    def it_holds_no_file_blob_when_not_spooled(self):
+        assert Image(b'foobar', None, None).file_blob is None
+
     def it_correctly_characterizes_known_images(self, known_image_fixture):
         image_path, characteristics = known_image_fixture
         ext, content_type, px_width, px_height, horz_dpi, vert_dpi = (
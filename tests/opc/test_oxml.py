@@ -6,7 +6,8 @@ Test suite for opc.oxml module
 
 from docx.opc.constants import RELATIONSHIP_TARGET_MODE as RTM
 from docx.opc.oxml import (
-    CT_Default, CT_Override, CT_Relationship, CT_Relationships, CT_Types
+    CT_Default, CT_Override, CT_Relationship, CT_Relationships, CT_Types,
+    count_rel_refs, parse_xml
 )
 from docx.oxml.xmlchemy import serialize_for_reading
 
@@ -15,6 +16,21 @@ from .unitdata.rels import (
 )
 
 
+def it_counts_the_references_to_each_rId_in_part_xml():
+    part_elm = parse_xml(
+        '<w:p xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2'
+        '006/main" xmlns:r="http://schemas.openxmlformats.org/officeDocumen'
+        't/2006/relationships" xmlns:o="urn:schemas-microsoft-com:office:of'
+        'fice" xmlns:v="urn:schemas-microsoft-com:vml">'
+        '<w:hyperlink r:id="rId1"/><w:r><w:t w:id="rId9">rId1</w:t></w:r>'
+        '<w:hyperlink r:id="rId1"/><a:blip xmlns:a="a" r:embed="rId2" r:lin'
+        'k="rId3"/><v:imagedata o:relid="rId4"/></w:p>'
+    )
+    assert count_rel_refs(part_elm) == {
+        'rId1': 2, 'rId2': 1, 'rId3': 1, 'rId4': 1
+    }
+
+
 class DescribeCT_Default(object):
 
     def it_provides_read_access_to_xml_values(self):
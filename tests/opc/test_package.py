@@ -15,6 +15,7 @@ from docx.opc.parts.coreprops import CorePropertiesPart
 from docx.opc.pkgreader import PackageReader
 from docx.opc.rel import _Relationship, Relationships
 
+from ..unitutil.file import absjoin, test_file_dir
 from ..unitutil.mock import (
     call,
     class_mock,
@@ -28,6 +29,9 @@ from ..unitutil.mock import (
 )
 
 
+test_docx_path = absjoin(test_file_dir, 'test.docx')
+
+
 class DescribeOpcPackage(object):
 
     def it_can_open_a_pkg_file(self, PackageReader_, PartFactory_,
@@ -38,11 +42,35 @@ class DescribeOpcPackage(object):
         # exercise ---------------------
         pkg = OpcPackage.open(pkg_file)
         # verify -----------------------
-        PackageReader_.from_file.assert_called_once_with(pkg_file)
+        PackageReader_.from_file.assert_called_once_with(pkg_file, False)
         Unmarshaller_.unmarshal.assert_called_once_with(pkg_reader, pkg,
                                                         PartFactory_)
         assert isinstance(pkg, OpcPackage)
 
+    def it_closes_the_file_its_lazily_loaded_parts_are_read_from(self):
+        package = OpcPackage.open(test_docx_path, lazy=True)
+        phys_reader = package.main_document_part._blob.phys_reader
+
+        package.close()
+
+        with pytest.raises(ValueError):
+            phys_reader.blob_for(PackURI('/word/document.xml'))
+
+    def it_can_clone_itself(self):
+        package = OpcPackage.open(test_docx_path)
+
+        clone = package.clone()
+
+        parts, cloned_parts = package.parts, clone.parts
+        assert [p.partname for p in cloned_parts] == [
+            p.partname for p in parts
+        ]
+        assert not set(parts) & set(cloned_parts)
+        assert all(p.package is clone for p in cloned_parts)
+        assert [(r.rId, r.reltype, r.target_ref) for r in clone.iter_rels()] == [
+            (r.rId, r.reltype, r.target_ref) for r in package.iter_rels()
+        ]
+
     def it_initializes_its_rels_collection_on_first_reference(
             self, Relationships_):
         pkg = OpcPackage()
@@ -101,6 +129,25 @@ class DescribeOpcPackage(object):
         assert part2 in pkg.iter_parts()
         assert len([p for p in pkg.iter_parts()]) == 2
 
+    def it_can_prune_parts_nothing_refers_to(self):
+        part1, part2 = (Mock(name='part1'), Mock(name='part2'))
+        part1.rels = {
+            1: Mock(name='rel1', is_external=False, target_part=part2)
+        }
+        part2.rels = {}
+        part1.drop_unreferenced_rels.side_effect = part1.rels.clear
+        pkg = OpcPackage()
+        pkg._rels = {
+            1: Mock(name='rel2', is_external=False, target_part=part1)
+        }
+
+        removed_parts = pkg.prune_unreferenced_parts()
+
+        part1.drop_unreferenced_rels.assert_called_once_with()
+        part2.drop_unreferenced_rels.assert_called_once_with()
+        assert removed_parts == [part2]
+        assert pkg.parts == [part1]
+
     def it_can_find_the_next_available_vector_partname(
         self, next_partname_fixture, iter_parts_, PackURI_, packuri_
     ):
@@ -128,7 +175,7 @@ class DescribeOpcPackage(object):
         for part in parts_:
             part.before_marshal.assert_called_once_with()
         PackageWriter_.write.assert_called_once_with(
-            pkg_file_, pkg._rels, parts_
+            pkg_file_, pkg._rels, parts_, None, None
         )
 
     def it_provides_access_to_the_core_properties(self, core_props_fixture):
@@ -4,11 +4,15 @@
 
 from __future__ import absolute_import, division, print_function, unicode_literals
 
+from copy import deepcopy
+
 import pytest
 
+from docx.opc.constants import RELATIONSHIP_TYPE as RT
 from docx.opc.package import OpcPackage
 from docx.opc.packuri import PackURI
 from docx.opc.part import Part, PartFactory, XmlPart
+from docx.opc.phys_pkg import LazyBlob
 from docx.opc.rel import _Relationship, Relationships
 from docx.oxml.xmlchemy import BaseOxmlElement
 
@@ -62,6 +66,21 @@ class DescribePart(object):
         part, load_blob = blob_fixture
         assert part.blob is load_blob
 
+    def it_can_clone_itself_into_another_package(self, blob_, package_):
+        part = Part(PackURI('/part/name'), 'content/type', blob_, None)
+
+        clone = part.clone(package_)
+
+        assert type(clone) is Part
+        assert clone.partname == part.partname
+        assert clone.content_type == part.content_type
+        assert clone.blob is blob_
+        assert clone.package is package_
+
+    def it_reads_a_lazy_load_blob_on_demand(self, lazy_blob_):
+        part = Part(None, None, lazy_blob_, None)
+        assert part.blob is lazy_blob_.load.return_value
+
     # fixtures ---------------------------------------------
 
     @pytest.fixture
@@ -112,6 +131,10 @@ class DescribePart(object):
     def __init_(self, request):
         return initializer_mock(request, Part)
 
+    @pytest.fixture
+    def lazy_blob_(self, request):
+        return instance_mock(request, LazyBlob)
+
     @pytest.fixture
     def package_(self, request):
         return instance_mock(request, OpcPackage)
@@ -158,6 +181,16 @@ class DescribePartRelationshipManagementInterface(object):
         else:
             assert rId in part.rels
 
+    def it_keeps_a_relationship_referred_to_by_copied_xml(self, part):
+        part._element = element('w:p/w:r/w:drawing/a:blip{r:embed=rId42}')
+        part._rels = {'rId42': None}
+        blip = part._element.xpath('//a:blip')[0]
+        blip.getparent().append(deepcopy(blip))
+
+        part.drop_rel('rId42')
+
+        assert 'rId42' in part.rels
+
     def it_can_find_a_related_part_by_reltype(self, related_part_fixture):
         part, reltype_, related_part_ = related_part_fixture
         related_part = part.part_related_by(reltype_)
@@ -444,6 +477,59 @@ class DescribeXmlPart(object):
         )
         assert isinstance(part, XmlPart)
 
+    def it_defers_parsing_a_lazy_load_blob(
+        self, partname_, content_type_, lazy_blob_, package_, parse_xml_
+    ):
+        xml_part = XmlPart.load(partname_, content_type_, lazy_blob_, package_)
+        assert parse_xml_.call_count == 0
+
+        element = xml_part.element
+
+        lazy_blob_.load.assert_called_once_with()
+        parse_xml_.assert_called_once_with(lazy_blob_.load.return_value)
+        assert element is parse_xml_.return_value
+        assert xml_part.element is element
+        assert lazy_blob_.load.call_count == 1
+
+    def it_can_clone_itself_into_another_package(self, package_):
+        xml_part = XmlPart(
+            PackURI('/part/name.xml'), 'content/type', element('w:p/w:r'),
+            None
+        )
+
+        clone = xml_part.clone(package_)
+
+        assert type(clone) is XmlPart
+        assert clone.partname == xml_part.partname
+        assert clone.content_type == xml_part.content_type
+        assert clone.package is package_
+        assert clone.element is not xml_part.element
+        assert clone.element.xml == xml_part.element.xml
+
+    def it_drops_relationships_nothing_in_its_xml_refers_to(self):
+        xml_part = XmlPart(
+            PackURI('/word/document.xml'), 'content/type',
+            element('w:p/(r:a{r:id=rId1},r:b{r:embed=rId2})'), None
+        )
+        image_part = Part(PackURI('/word/media/image1.png'), 'image/png')
+        styles_part = Part(PackURI('/word/styles.xml'), 'content/type')
+        xml_part.load_rel(RT.HYPERLINK, 'http://a.b', 'rId1', True)
+        xml_part.load_rel(RT.IMAGE, image_part, 'rId2')
+        xml_part.load_rel(RT.IMAGE, image_part, 'rId3')
+        xml_part.load_rel(RT.HYPERLINK, 'http://c.d', 'rId4', True)
+        xml_part.load_rel(RT.STYLES, styles_part, 'rId5')
+
+        xml_part.drop_unreferenced_rels()
+
+        assert sorted(xml_part.rels) == ['rId1', 'rId2', 'rId5']
+
+    def it_leaves_a_part_unchanged_since_lazily_loaded_as_it_is(
+        self, partname_, content_type_, lazy_blob_, package_
+    ):
+        xml_part = XmlPart.load(partname_, content_type_, lazy_blob_, package_)
+        xml_part.drop_unreferenced_rels()
+        assert lazy_blob_.load.call_count == 0
+
     def it_can_serialize_to_xml(self, blob_fixture):
         xml_part, element_, serialize_part_xml_ = blob_fixture
         blob = xml_part.blob
@@ -483,6 +569,10 @@ class DescribeXmlPart(object):
     def __init_(self, request):
         return initializer_mock(request, XmlPart)
 
+    @pytest.fixture
+    def lazy_blob_(self, request):
+        return instance_mock(request, LazyBlob)
+
     @pytest.fixture
     def package_(self, request):
         return instance_mock(request, OpcPackage)
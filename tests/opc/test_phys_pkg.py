@@ -11,15 +11,25 @@ try:
 except ImportError:
     from StringIO import StringIO as BytesIO
 
+import gc
 import hashlib
+import os
 import pytest
 
-from zipfile import ZIP_DEFLATED, ZipFile
+from zipfile import ZIP_DEFLATED, ZIP_STORED, ZipFile
 
+from docx.opc.constants import CONTENT_TYPE as CT
 from docx.opc.exceptions import PackageNotFoundError
 from docx.opc.packuri import PACKAGE_URI, PackURI
 from docx.opc.phys_pkg import (
-    _DirPkgReader, PhysPkgReader, PhysPkgWriter, _ZipPkgReader, _ZipPkgWriter
+    CompressionPolicy,
+    _DirPkgReader,
+    FileBlob,
+    LazyBlob,
+    PhysPkgReader,
+    PhysPkgWriter,
+    _ZipPkgReader,
+    _ZipPkgWriter,
 )
 
 from ..unitutil.file import absjoin, test_file_dir
@@ -56,6 +66,11 @@ class DescribeDirPkgReader(object):
         sha1 = hashlib.sha1(rels_xml).hexdigest()
         assert sha1 == 'ebacdddb3e7843fdd54c2f00bc831551b26ac823'
 
+    def it_can_open_a_stream_for_a_pack_uri(self, dir_reader):
+        pack_uri = PackURI('/word/document.xml')
+        with dir_reader.stream_for(pack_uri) as stream:
+            assert stream.read() == dir_reader.blob_for(pack_uri)
+
     def it_returns_none_when_part_has_no_rels_xml(self, dir_reader):
         partname = PackURI('/ppt/viewProps.xml')
         rels_xml = dir_reader.rels_xml_for(partname)
@@ -72,6 +87,76 @@ class DescribeDirPkgReader(object):
         return _DirPkgReader(dir_pkg_path)
 
 
+class DescribeCompressionPolicy(object):
+
+    def it_chooses_compression_by_content_type(self):
+        compression = CompressionPolicy(
+            ZIP_DEFLATED, 6, {CT.JPEG: (ZIP_STORED, None)}
+        )
+        assert compression.compression_for(CT.JPEG) == (ZIP_STORED, None)
+        assert compression.compression_for(CT.XML) == (ZIP_DEFLATED, 6)
+        assert compression.compression_for(None) == (ZIP_DEFLATED, 6)
+
+
+class DescribeFileBlob(object):
+
+    def it_reads_the_file_when_loaded_or_opened(self, tmpdir):
+        path = str(tmpdir.join('image.png'))
+        with open(path, 'wb') as f:
+            f.write(b'foobar')
+        file_blob = FileBlob(path)
+
+        with file_blob.open() as stream:
+            assert stream.read() == b'foobar'
+        assert file_blob.load() == b'foobar'
+        assert file_blob.raw_member is None
+
+    def it_knows_whether_it_reads_from_a_package_file(self, tmpdir):
+        path = str(tmpdir.join('image.png'))
+        with open(path, 'wb') as f:
+            f.write(b'foobar')
+        file_blob = FileBlob(path)
+
+        assert file_blob.reads_from(path) is True
+        assert file_blob.reads_from(str(tmpdir.join('new.docx'))) is False
+        assert file_blob.reads_from(BytesIO()) is False
+
+    def it_removes_a_spool_file_when_no_longer_referenced(self, tmpdir):
+        path = str(tmpdir.join('spool'))
+        with open(path, 'wb') as f:
+            f.write(b'foobar')
+        file_blob = FileBlob(path, delete=True)
+        assert file_blob.load() == b'foobar'
+
+        del file_blob
+        gc.collect()
+
+        assert not os.path.exists(path)
+
+
+class DescribeLazyBlob(object):
+
+    def it_reads_the_member_blob_when_loaded(self):
+        phys_reader = _ZipPkgReader(zip_pkg_path)
+        lazy_blob = LazyBlob(phys_reader, PackURI('/word/document.xml'))
+
+        blob = lazy_blob.load()
+
+        phys_reader.close()
+        sha1 = hashlib.sha1(blob).hexdigest()
+        assert sha1 == 'b9b4a98bcac7c5a162825b60c3db7df11e02ac5f'
+
+    def it_can_open_the_member_as_a_stream(self):
+        phys_reader = _ZipPkgReader(zip_pkg_path)
+        lazy_blob = LazyBlob(phys_reader, PackURI('/word/document.xml'))
+
+        with lazy_blob.open() as stream:
+            blob = stream.read()
+
+        assert blob == lazy_blob.load()
+        phys_reader.close()
+
+
 class DescribePhysPkgReader(object):
 
     def it_raises_when_pkg_path_is_not_a_package(self):
@@ -103,6 +188,20 @@ class DescribeZipPkgReader(object):
         # verify -----------------------
         zipf.close.assert_called_once_with()
 
+    def it_can_reopen_its_package_file(self, tmpdir):
+        pkg_path = str(tmpdir.join('pkg.docx'))
+        with open(zip_pkg_path, 'rb') as src, open(pkg_path, 'wb') as dst:
+            dst.write(src.read())
+        phys_reader = _ZipPkgReader(pkg_path)
+        pack_uri = PackURI('/word/document.xml')
+        blob = phys_reader.blob_for(pack_uri)
+
+        phys_reader.close()
+        phys_reader.reopen()
+
+        assert phys_reader.blob_for(pack_uri) == blob
+        phys_reader.close()
+
     def it_can_retrieve_the_blob_for_a_pack_uri(self, phys_reader):
         pack_uri = PackURI('/word/document.xml')
         blob = phys_reader.blob_for(pack_uri)
@@ -118,6 +217,11 @@ class DescribeZipPkgReader(object):
         sha1 = hashlib.sha1(rels_xml).hexdigest()
         assert sha1 == '90965123ed2c79af07a6963e7cfb50a6e2638565'
 
+    def it_can_open_a_stream_for_a_pack_uri(self, phys_reader):
+        pack_uri = PackURI('/word/document.xml')
+        with phys_reader.stream_for(pack_uri) as stream:
+            assert stream.read() == phys_reader.blob_for(pack_uri)
+
     def it_returns_none_when_part_has_no_rels_xml(self, phys_reader):
         partname = PackURI('/ppt/viewProps.xml')
         rels_xml = phys_reader.rels_xml_for(partname)
@@ -174,6 +278,112 @@ class DescribeZipPkgWriter(object):
         retrieved_blob_sha1 = hashlib.sha1(retrieved_blob).hexdigest()
         assert retrieved_blob_sha1 == written_blob_sha1
 
+    def it_can_copy_a_member_without_recompressing_it(self, pkg_file):
+        phys_reader = _ZipPkgReader(zip_pkg_path)
+        src_uri = PackURI('/word/document.xml')
+        src_zinfo, src_raw_bytes = phys_reader.raw_member_for(src_uri)
+        pack_uri = PackURI('/word/renamed.xml')
+
+        pkg_writer = PhysPkgWriter(pkg_file)
+        pkg_writer.copy(pack_uri, LazyBlob(phys_reader, src_uri))
+        pkg_writer.write(PackURI('/part/name.xml'), b'<Foo/>')
+        pkg_writer.close()
+
+        zipf = ZipFile(pkg_file, 'r')
+        zinfo = zipf.getinfo(pack_uri.membername)
+        assert zipf.testzip() is None
+        assert zinfo.compress_size == src_zinfo.compress_size
+        assert zipf.read(pack_uri.membername) == phys_reader.blob_for(src_uri)
+        assert zipf.read('part/name.xml') == b'<Foo/>'
+        zipf.close()
+        phys_reader.close()
+
+    def it_streams_a_file_blob_into_a_member(self, pkg_file, tmpdir):
+        path = str(tmpdir.join('image.png'))
+        blob = b'foobar' * 100000
+        with open(path, 'wb') as f:
+            f.write(blob)
+        compression = CompressionPolicy.store_images()
+
+        pkg_writer = PhysPkgWriter(pkg_file, compression)
+        pkg_writer.write(PackURI('/part/name.xml'), b'<Foo/>')
+        pkg_writer.copy(PackURI('/media/image1.png'), FileBlob(path), CT.PNG)
+        pkg_writer.copy(PackURI('/media/image2.bin'), FileBlob(path))
+        pkg_writer.close()
+
+        zipf = ZipFile(pkg_file, 'r')
+        assert zipf.testzip() is None
+        assert zipf.getinfo('media/image1.png').compress_type == ZIP_STORED
+        assert zipf.getinfo('media/image2.bin').compress_type == ZIP_DEFLATED
+        assert zipf.read('media/image1.png') == blob
+        assert zipf.read('media/image2.bin') == blob
+        assert zipf.read('part/name.xml') == b'<Foo/>'
+        zipf.close()
+
+    def it_can_write_a_member_as_a_stream(self, pkg_file):
+        compression = CompressionPolicy.store_images()
+
+        pkg_writer = PhysPkgWriter(pkg_file, compression)
+        with pkg_writer.open(PackURI('/media/image1.png'), CT.PNG) as stream:
+            stream.write(b'foo')
+            stream.write(b'bar')
+        pkg_writer.write(PackURI('/part/name.xml'), b'<Foo/>')
+        pkg_writer.close()
+
+        zipf = ZipFile(pkg_file, 'r')
+        assert zipf.testzip() is None
+        assert zipf.getinfo('media/image1.png').compress_type == ZIP_STORED
+        assert zipf.read('media/image1.png') == b'foobar'
+        assert zipf.read('part/name.xml') == b'<Foo/>'
+        zipf.close()
+
+    def it_streams_a_member_at_its_compression_level(self, pkg_file):
+        blob = b''.join(b'<w:p>%d</w:p>' % n for n in range(20000))
+        compression = CompressionPolicy(compresslevel=1)
+        zinfo, _ = PhysPkgWriter(BytesIO(), compression).compress(
+            PackURI('/part/name.xml'), blob
+        )
+
+        pkg_writer = PhysPkgWriter(pkg_file, compression)
+        with pkg_writer.open(PackURI('/part/name.xml')) as stream:
+            stream.write(blob)
+        pkg_writer.close()
+
+        zipf = ZipFile(pkg_file, 'r')
+        streamed_zinfo = zipf.getinfo('part/name.xml')
+        assert streamed_zinfo.compress_size == zinfo.compress_size
+        assert zipf.read('part/name.xml') == blob
+        zipf.close()
+
+    def it_writes_the_same_bytes_for_the_same_members(self):
+        pack_uri, blob = PackURI('/part/name.xml'), b'<Foo/>'
+        pkg_files = BytesIO(), BytesIO()
+
+        for pkg_file in pkg_files:
+            pkg_writer = PhysPkgWriter(pkg_file)
+            pkg_writer.write(pack_uri, blob)
+            pkg_writer.close()
+
+        assert pkg_files[0].getvalue() == pkg_files[1].getvalue()
+
+    def it_compresses_each_member_as_directed_by_its_policy(self, pkg_file):
+        compression = CompressionPolicy.store_images(compresslevel=1)
+        blob = b'<Foo>' + b'bar' * 1000 + b'</Foo>'
+
+        pkg_writer = PhysPkgWriter(pkg_file, compression)
+        pkg_writer.write(PackURI('/media/image1.png'), blob, CT.PNG)
+        pkg_writer.write(PackURI('/part/name.xml'), blob, CT.XML)
+        pkg_writer.close()
+
+        zipf = ZipFile(pkg_file, 'r')
+        image_zinfo = zipf.getinfo('media/image1.png')
+        xml_zinfo = zipf.getinfo('part/name.xml')
+        assert image_zinfo.compress_type == ZIP_STORED
+        assert xml_zinfo.compress_type == ZIP_DEFLATED
+        assert xml_zinfo.compress_size < len(blob)
+        assert zipf.read('part/name.xml') == blob
+        zipf.close()
+
     # fixtures ---------------------------------------------
 
     @pytest.fixture
@@ -8,7 +8,7 @@ import pytest
 
 from docx.opc.constants import CONTENT_TYPE as CT, RELATIONSHIP_TARGET_MODE as RTM
 from docx.opc.packuri import PackURI
-from docx.opc.phys_pkg import _ZipPkgReader
+from docx.opc.phys_pkg import LazyBlob, _ZipPkgReader
 from docx.opc.pkgreader import (
     _ContentTypeMap,
     PackageReader,
@@ -49,12 +49,26 @@ class DescribePackageReader(object):
         from_xml.assert_called_once_with(phys_reader.content_types_xml)
         _srels_for.assert_called_once_with(phys_reader, '/')
         _load_serialized_parts.assert_called_once_with(
-            phys_reader, pkg_srels, content_types
+            phys_reader, pkg_srels, content_types, False
         )
         phys_reader.close.assert_called_once_with()
         _init_.assert_called_once_with(ANY, content_types, pkg_srels, sparts)
         assert isinstance(pkg_reader, PackageReader)
 
+    def it_leaves_the_phys_pkg_open_when_loading_lazily(
+        self, _init_, PhysPkgReader_, from_xml, _srels_for, _load_serialized_parts
+    ):
+        phys_reader = PhysPkgReader_.return_value
+        content_types = from_xml.return_value
+        pkg_srels = _srels_for.return_value
+
+        PackageReader.from_file(Mock(name='pkg_file'), lazy=True)
+
+        _load_serialized_parts.assert_called_once_with(
+            phys_reader, pkg_srels, content_types, True
+        )
+        assert phys_reader.close.call_count == 0
+
     def it_can_iterate_over_the_serialized_parts(self, iter_sparts_fixture):
         pkg_reader, expected_iter_spart_items = iter_sparts_fixture
         iter_spart_items = list(pkg_reader.iter_sparts())
@@ -162,6 +176,24 @@ class DescribePackageReader(object):
         ]
         assert generated_tuples == expected_tuples
 
+    def it_defers_reading_part_blobs_when_walking_lazily(self, _srels_for):
+        partname = PackURI('/part/name1.xml')
+        srel = Mock(
+            name='rId1', is_external=False, reltype='reltype1',
+            target_partname=partname
+        )
+        phys_reader = Mock(name='phys_reader')
+        _srels_for.return_value = []
+
+        ((_, blob, _, _),) = list(
+            PackageReader._walk_phys_parts(phys_reader, [srel], lazy=True)
+        )
+
+        assert isinstance(blob, LazyBlob)
+        assert phys_reader.blob_for.call_count == 0
+        assert blob.load() is phys_reader.blob_for.return_value
+        phys_reader.blob_for.assert_called_once_with(partname)
+
     def it_can_retrieve_srels_for_a_source_uri(
             self, _SerializedRelationships_):
         # mockery ----------------------
@@ -6,6 +6,10 @@ Test suite for opc.pkgwriter module
 
 import pytest
 
+from io import BytesIO
+from zipfile import ZipFile
+
+from docx.api import Document
 from docx.opc.constants import CONTENT_TYPE as CT
 from docx.opc.packuri import PackURI
 from docx.opc.part import Part
@@ -13,6 +17,7 @@ from docx.opc.phys_pkg import _ZipPkgWriter
 from docx.opc.pkgwriter import _ContentTypesItem, PackageWriter
 
 from .unitdata.types import a_Default, a_Types, an_Override
+from ..unitutil.file import test_file
 from ..unitutil.mock import (
     call, class_mock, instance_mock, MagicMock, method_mock, Mock, patch
 )
@@ -20,7 +25,9 @@ from ..unitutil.mock import (
 
 class DescribePackageWriter(object):
 
-    def it_can_write_a_package(self, PhysPkgWriter_, _write_methods):
+    def it_can_write_a_package(
+        self, PhysPkgWriter_, _write_methods, _is_lazy_load_source_
+    ):
         # mockery ----------------------
         pkg_file = Mock(name='pkg_file')
         pkg_rels = Mock(name='pkg_rels')
@@ -34,10 +41,99 @@ class DescribePackageWriter(object):
             call._write_pkg_rels(phys_writer, pkg_rels),
             call._write_parts(phys_writer, parts),
         ]
-        PhysPkgWriter_.assert_called_once_with(pkg_file)
+        PhysPkgWriter_.assert_called_once_with(pkg_file, None)
         assert _write_methods.mock_calls == expected_calls
         phys_writer.close.assert_called_once_with()
 
+    def it_writes_over_a_lazy_load_source_by_replacing_it(self, tmpdir):
+        pkg_path = str(tmpdir.join('source.docx'))
+        with open(pkg_path, 'wb') as f:
+            f.write(b'original')
+        lazy_blob_ = Mock(name='lazy_blob_')
+        lazy_blob_.reads_from.side_effect = lambda pkg_file: (
+            pkg_file == pkg_path
+        )
+        part_ = Mock(
+            name='part_', partname=PackURI('/foo.bin'),
+            content_type='application/foo', is_modified=False,
+            _blob=lazy_blob_, _rels=[]
+        )
+
+        def copy(self, pack_uri, lazy_blob, content_type=None):
+            self.write(pack_uri, b'copied')
+
+        with patch.object(_ZipPkgWriter, 'copy', copy):
+            PackageWriter.write(
+                pkg_path, Mock(name='pkg_rels', xml=b''), [part_]
+            )
+
+        assert tmpdir.listdir() == [tmpdir.join('source.docx')]
+        with ZipFile(pkg_path) as zipf:
+            assert zipf.read('foo.bin') == b'copied'
+        phys_reader = lazy_blob_.phys_reader
+        assert phys_reader.mock_calls == [call.close(), call.reopen()]
+
+    def it_writes_over_a_lazy_load_source_stream_by_rewriting_it(self):
+        with open(test_file('test.docx'), 'rb') as f:
+            stream = BytesIO(f.read())
+        document = Document(stream, lazy=True)
+        document.add_paragraph('Foobar')
+
+        document.save(stream)
+
+        stream.seek(0)
+        assert Document(stream).paragraphs[-1].text == 'Foobar'
+        assert len(document.styles) > 0
+
+    def it_writes_the_same_package_when_writing_in_parallel(self):
+        pkg_rels = Mock(name='pkg_rels', xml=b'<Relationships/>')
+        rels = MagicMock(name='rels', xml=b'<Relationships/>')
+        rels.__len__.return_value = 1
+        parts = [
+            Mock(
+                name='part%d' % n, partname=PackURI('/part/name%d.xml' % n),
+                content_type=CT.XML, blob=b'<Foo>%d</Foo>' % n,
+                is_modified=True, _rels=rels if n % 2 else []
+            ) for n in range(1, 9)
+        ]
+        serial_file, parallel_file = BytesIO(), BytesIO()
+
+        PackageWriter.write(serial_file, pkg_rels, parts)
+        PackageWriter.write(parallel_file, pkg_rels, parts, workers=4)
+
+        assert parallel_file.getvalue() == serial_file.getvalue()
+        with ZipFile(parallel_file) as zipf:
+            assert zipf.read('part/name8.xml') == b'<Foo>8</Foo>'
+
+    def it_can_write_a_package_while_streaming_a_part(self):
+        pkg_rels = Mock(name='pkg_rels', xml=b'<Relationships/>')
+        rels = MagicMock(name='rels', xml=b'<Relationships/>')
+        rels.__len__.return_value = 1
+        streamed_part, other_part = parts = [
+            Mock(
+                name='part%d' % n, partname=PackURI('/part/name%d.xml' % n),
+                content_type=CT.XML, blob=b'<Foo>%d</Foo>' % n,
+                is_modified=True, _rels=rels
+            ) for n in range(1, 3)
+        ]
+        package = Mock(name='package', rels=pkg_rels, parts=parts)
+        pkg_file = BytesIO()
+
+        with PackageWriter.streaming(pkg_file, package, streamed_part) as f:
+            f.write(b'<Bar>')
+            f.write(b'</Bar>')
+
+        with ZipFile(pkg_file) as zipf:
+            assert zipf.namelist() == [
+                'part/name1.xml', '[Content_Types].xml', '_rels/.rels',
+                'part/name2.xml', 'part/_rels/name2.xml.rels',
+                'part/_rels/name1.xml.rels',
+            ]
+            assert zipf.read('part/name1.xml') == b'<Bar></Bar>'
+            assert zipf.read('part/name2.xml') == b'<Foo>2</Foo>'
+        for part in parts:
+            part.before_marshal.assert_called_once_with()
+
     def it_can_write_a_content_types_stream(self, write_cti_fixture):
         _ContentTypesItem_, parts_, phys_pkg_writer_, blob_ = (
             write_cti_fixture
@@ -45,7 +141,7 @@ class DescribePackageWriter(object):
         PackageWriter._write_content_types_stream(phys_pkg_writer_, parts_)
         _ContentTypesItem_.from_parts.assert_called_once_with(parts_)
         phys_pkg_writer_.write.assert_called_once_with(
-            '/[Content_Types].xml', blob_
+            '/[Content_Types].xml', blob_, CT.XML
         )
 
     def it_can_write_a_pkg_rels_item(self):
@@ -55,8 +151,9 @@ class DescribePackageWriter(object):
         # exercise ---------------------
         PackageWriter._write_pkg_rels(phys_writer, pkg_rels)
         # verify -----------------------
-        phys_writer.write.assert_called_once_with('/_rels/.rels',
-                                                  pkg_rels.xml)
+        phys_writer.write.assert_called_once_with(
+            '/_rels/.rels', pkg_rels.xml, CT.OPC_RELATIONSHIPS
+        )
 
     def it_can_write_a_list_of_parts(self):
         # mockery ----------------------
@@ -69,12 +166,26 @@ class DescribePackageWriter(object):
         PackageWriter._write_parts(phys_writer, [part1, part2])
         # verify -----------------------
         expected_calls = [
-            call(part1.partname, part1.blob),
-            call(part1.partname.rels_uri, part1._rels.xml),
-            call(part2.partname, part2.blob),
+            call(part1.partname, part1.blob, part1.content_type),
+            call(
+                part1.partname.rels_uri, part1._rels.xml,
+                CT.OPC_RELATIONSHIPS
+            ),
+            call(part2.partname, part2.blob, part2.content_type),
         ]
         assert phys_writer.write.mock_calls == expected_calls
 
+    def it_copies_a_part_unmodified_since_lazy_load(self):
+        phys_writer = Mock(name='phys_writer')
+        part = Mock(name='part', is_modified=False, _rels=[])
+
+        PackageWriter._write_parts(phys_writer, [part])
+
+        phys_writer.copy.assert_called_once_with(
+            part.partname, part._blob, part.content_type
+        )
+        assert phys_writer.write.call_count == 0
+
     # fixtures ---------------------------------------------
 
     @pytest.fixture
@@ -93,6 +204,13 @@ class DescribePackageWriter(object):
         _ContentTypesItem_.from_parts.return_value = cti_
         return _ContentTypesItem_
 
+    @pytest.fixture
+    def _is_lazy_load_source_(self, request):
+        return method_mock(
+            request, PackageWriter, '_is_lazy_load_source', autospec=False,
+            return_value=False
+        )
+
     @pytest.fixture
     def parts_(self, request):
         return instance_mock(request, list)
@@ -138,6 +138,79 @@ class DescribeRelationships(object):
         next_rId = rels._next_rId
         assert next_rId == expected_next_rId
 
+    def it_reuses_the_rId_of_a_removed_relationship(self, reltype):
+        rels = Relationships(None)
+        for n in range(5):
+            rels.get_or_add_ext_rel(reltype, 'http://foo/%d' % n)
+
+        del rels['rId2']
+        del rels['rId4']
+
+        assert rels.get_or_add_ext_rel(reltype, 'http://bar/1') == 'rId2'
+        assert rels.get_or_add_ext_rel(reltype, 'http://bar/2') == 'rId4'
+        assert rels.get_or_add_ext_rel(reltype, 'http://bar/3') == 'rId6'
+
+    def it_keeps_its_indexes_up_to_date_as_rels_are_removed(
+            self, reltype, _target_part):
+        rels = Relationships(None)
+        rels.add_relationship(reltype, 'http://foo', 'rId1', True)
+        rels.add_relationship(reltype, 'http://foo', 'rId2', True)
+        rels.add_relationship('http://rel/part', _target_part, 'rId3')
+
+        del rels['rId1']
+        assert rels.get_or_add_ext_rel(reltype, 'http://foo') == 'rId2'
+        assert rels.part_with_reltype('http://rel/part') is _target_part
+
+        del rels['rId3']
+        assert 'rId3' not in rels.related_parts
+        with pytest.raises(KeyError):
+            rels.part_with_reltype('http://rel/part')
+
+    @pytest.mark.parametrize('remove', [
+        lambda rels: rels.pop('rId1'),
+        lambda rels: rels.popitem(),
+        lambda rels: rels.clear(),
+    ])
+    def it_keeps_its_indexes_up_to_date_when_rels_are_popped(
+            self, remove, _target_part):
+        rels = Relationships(None)
+        rels.add_relationship('http://rel/part', _target_part, 'rId1')
+
+        remove(rels)
+
+        assert rels.related_parts == {}
+        assert rels._next_rId == 'rId1'
+        with pytest.raises(KeyError):
+            rels.part_with_reltype('http://rel/part')
+
+    def it_indexes_rels_added_by_update_and_setdefault(
+            self, reltype, _target_part):
+        rels = Relationships(None)
+        other = Relationships(None)
+        rel = other.add_relationship('http://rel/part', _target_part, 'rId1')
+        ext_rel = other.add_relationship(reltype, 'http://foo', 'rId2', True)
+
+        rels.update(other)
+        assert rels.setdefault('rId2', None) is ext_rel
+        rels.pop('rId2')
+        assert rels.setdefault('rId3', ext_rel) is ext_rel
+
+        assert rels.part_with_reltype('http://rel/part') is _target_part
+        assert rels.related_parts == {'rId1': _target_part}
+        assert rels.get_or_add(rel.reltype, _target_part) is rel
+        rels.get_or_add_ext_rel(reltype, 'http://foo')
+        assert sorted(rels) == ['rId1', 'rId3']
+        assert rels.pop('rId9', None) is None
+
+    def it_raises_when_more_than_one_part_has_the_reltype(
+            self, reltype, _target_part):
+        rels = Relationships(None)
+        rels.add_relationship(reltype, _target_part, 'rId1')
+        rels.add_relationship(reltype, _target_part, 'rId2')
+
+        with pytest.raises(ValueError):
+            rels.part_with_reltype(reltype)
+
     # fixtures ---------------------------------------------
 
     @pytest.fixture
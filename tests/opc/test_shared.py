@@ -0,0 +1,59 @@
+# encoding: utf-8
+
+"""Unit test suite for docx.opc.shared module"""
+
+from __future__ import absolute_import, division, print_function, unicode_literals
+
+import sys
+
+from docx.opc.shared import walk_rel_graph
+
+from ..unitutil.mock import Mock
+
+
+class Describe_walk_rel_graph(object):
+
+    def it_walks_the_graph_depth_first(self):
+        # +------+     +---+     +---+
+        # | root |---> | A |---> | C |
+        # +------+     +---+     +---+
+        #    |  \        |  ^
+        #    |   v       v  |
+        #    |  ext    +---+
+        #    +-------> | B |
+        #              +---+
+        rels = {
+            'root': [_rel('A'), _rel(None), _rel('B')],
+            'A': [_rel('B'), _rel('C')],
+            'B': [_rel('A')],
+            'C': [],
+        }
+
+        walked = [
+            (rel.target, target)
+            for rel, target, _ in walk_rel_graph(
+                rels['root'], lambda rel: rel.target, rels.get
+            )
+        ]
+
+        assert walked == [
+            ('A', 'A'), ('B', 'B'), ('A', None), ('C', 'C'), (None, None),
+            ('B', None),
+        ]
+
+    def it_is_not_limited_by_the_recursion_depth(self):
+        depth = sys.getrecursionlimit() * 2
+        rels = dict((n, [_rel(n + 1)]) for n in range(depth))
+        rels[depth] = []
+
+        targets = [
+            target for _, target, _ in walk_rel_graph(
+                rels[0], lambda rel: rel.target, rels.get
+            )
+        ]
+
+        assert targets == list(range(1, depth + 1))
+
+
+def _rel(target):
+    return Mock(name='rel', target=target, is_external=target is None)
@@ -8,13 +8,19 @@ from __future__ import print_function, unicode_literals
 
 import pytest
 
+from io import BytesIO
+
 from lxml import etree
 
 from docx.oxml import (
-    OxmlElement, oxml_parser, parse_xml, register_element_cls
+    OxmlElement, iterparse_children, oxml_parser, parse_xml,
+    register_element_cls
 )
 from docx.oxml.ns import qn
 from docx.oxml.shared import BaseOxmlElement
+from docx.oxml.text.paragraph import CT_P
+
+from ..unitutil.cxml import xml
 
 
 class DescribeOxmlElement(object):
@@ -63,6 +69,27 @@ class DescribeOxmlParser(object):
         return pretty_xml_text, stripped_xml_text
 
 
+class DescribeIterparseChildren(object):
+
+    def it_generates_matching_children_of_the_parent(self):
+        stream = BytesIO(xml(
+            'w:document/w:body/(w:p/w:r/w:t"foo",w:tbl/w:tr/w:tc/w:p,'
+            'w:bookmarkStart,w:p/w:r/w:t"bar",w:sectPr)'
+        ).encode('utf-8'))
+        seen = []
+
+        for element in iterparse_children(stream, 'w:body', ('w:p', 'w:tbl')):
+            seen.append((element.tag, element.xpath('string()')))
+            assert element.getprevious() is None
+
+        assert seen == [(qn('w:p'), 'foo'), (qn('w:tbl'), ''), (qn('w:p'), 'bar')]
+
+    def it_uses_registered_element_classes(self):
+        stream = BytesIO(xml('w:document/w:body/w:p').encode('utf-8'))
+        elements = list(iterparse_children(stream, 'w:body', ('w:p',)))
+        assert isinstance(elements[0], CT_P)
+
+
 class DescribeParseXml(object):
 
     def it_accepts_bytes_and_assumes_utf8_encoding(self, xml_bytes):
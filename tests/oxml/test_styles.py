@@ -11,6 +11,7 @@ from __future__ import (
 import pytest
 
 from docx.enum.style import WD_STYLE_TYPE
+from docx.oxml.styles import layer_props
 
 from ..unitutil.cxml import element, xml
 
@@ -23,6 +24,26 @@ class DescribeCT_Styles(object):
         assert styles.xml == expected_xml
         assert style is styles[-1]
 
+    def it_can_get_a_style_by_id_or_name(self):
+        styles = element(
+            'w:styles/(w:style{w:styleId=Foo},w:style{w:styleId=Baz}/w:name{w:va'
+            'l=Baz})'
+        )
+        styles[0].name_val = 'Foo "Bar"'
+        assert styles.get_by_id('Baz') is styles[1]
+        assert styles.get_by_id('Bar') is None
+        assert styles.get_by_name('Foo "Bar"') is styles[0]
+        assert styles.get_by_name('Foo') is None
+
+    def it_knows_its_document_default_properties(self):
+        styles = element(
+            'w:styles/w:docDefaults/(w:rPrDefault/w:rPr/w:b,w:pPrDefault)'
+        )
+        rPr = styles[0][0][0]
+        assert styles.default_rPr is rPr
+        assert styles.default_pPr is None
+        assert element('w:styles').default_rPr is None
+
     # fixtures -------------------------------------------------------
 
     @pytest.fixture(params=[
@@ -38,3 +59,42 @@ class DescribeCT_Styles(object):
         styles = element(styles_cxml)
         expected_xml = xml(expected_cxml)
         return styles, name, style_type, builtin, expected_xml
+
+
+class Describe_layer_props(object):
+
+    def it_layers_properties_over_others(self, layer_fixture):
+        props, overrides, toggle, expected_xml = layer_fixture
+        layer_props(props, overrides, toggle)
+        assert props.xml == expected_xml
+
+    # fixtures -------------------------------------------------------
+
+    @pytest.fixture(params=[
+        ('w:rPr/w:b', None, False, 'w:rPr/w:b'),
+        ('w:rPr/(w:b,w:sz{w:val=20})', 'w:rPr/(w:rStyle{w:val=Foo},w:b{w:v'
+         'al=0},w:i)', False, 'w:rPr/(w:b{w:val=0},w:sz{w:val=20},w:i)'),
+        ('w:rPr/(w:b,w:i{w:val=0})', 'w:rPr/(w:b,w:i,w:caps)', True,
+         'w:rPr/(w:b{w:val=0},w:i,w:caps)'),
+        ('w:rPr/w:sz{w:val=20}', 'w:rPr/w:sz{w:val=28}', True,
+         'w:rPr/w:sz{w:val=28}'),
+        ('w:rPr/w:rFonts{w:ascii=Arial,w:hAnsi=Arial}',
+         'w:rPr/w:rFonts{w:ascii=Calibri}', False,
+         'w:rPr/w:rFonts{w:ascii=Calibri,w:hAnsi=Arial}'),
+        ('w:pPr/w:ind{w:left=720,w:hanging=360}',
+         'w:pPr/(w:pStyle{w:val=Foo},w:ind{w:firstLine=240})', False,
+         'w:pPr/w:ind{w:left=720,w:firstLine=240}'),
+        ('w:pPr/w:spacing{w:after=200,w:line=276,w:lineRule=auto}',
+         'w:pPr/w:spacing{w:line=240}', False,
+         'w:pPr/w:spacing{w:after=200,w:line=240}'),
+        ('w:pPr/w:tabs/(w:tab{w:val=left,w:pos=720},w:tab{w:val=left,w:pos'
+         '=2880})', 'w:pPr/w:tabs/(w:tab{w:val=clear,w:pos=720},w:tab{w:val'
+         '=right,w:pos=1440})', False, 'w:pPr/w:tabs/(w:tab{w:val=right,w:'
+         'pos=1440},w:tab{w:val=left,w:pos=2880})'),
+    ])
+    def layer_fixture(self, request):
+        props_cxml, overrides_cxml, toggle, expected_cxml = request.param
+        props = element(props_cxml)
+        overrides = None if overrides_cxml is None else element(overrides_cxml)
+        expected_xml = xml(expected_cxml)
+        return props, overrides, toggle, expected_xml
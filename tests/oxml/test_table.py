@@ -8,7 +8,8 @@ import pytest
 
 from docx.exceptions import InvalidSpanError
 from docx.oxml import parse_xml
-from docx.oxml.table import CT_Row, CT_Tc
+from docx.oxml.ns import qn
+from docx.oxml.table import CT_Row, CT_Tbl, CT_Tc
 
 from ..unitutil.cxml import element, xml
 from ..unitutil.file import snippet_seq
@@ -22,6 +23,25 @@ class DescribeCT_Row(object):
         tr._add_trPr()
         assert tr.xml == expected_xml
 
+    def it_can_copy_its_formatting_without_its_content(self):
+        tr = element(
+            'w:tr/(w:trPr/w:cantSplit,'
+            'w:tc/(w:tcPr/(w:tcW{w:w=1440},w:vMerge{w:val=restart}),'
+            'w:p/(w:pPr/w:jc{w:val=right},w:r/(w:rPr/w:b,w:t"foo"),w:r),'
+            'w:p),'
+            'w:tc/(w:tbl,w:p/w:r/w:t"bar"))'
+        )
+
+        copy = tr.copy_formatting()
+
+        assert copy.xml == xml(
+            'w:tr/(w:trPr/w:cantSplit,'
+            'w:tc/(w:tcPr/w:tcW{w:w=1440},'
+            'w:p/(w:pPr/w:jc{w:val=right},w:r/w:rPr/w:b)),'
+            'w:tc/w:p/w:r)'
+        )
+        assert tr.tc_lst[1].xpath('string(.)') == 'bar'
+
     def it_raises_on_tc_at_grid_col(self, tc_raise_fixture):
         tr, idx = tc_raise_fixture
         with pytest.raises(ValueError):
@@ -49,6 +69,123 @@ class DescribeCT_Row(object):
         return tr, col_idx
 
 
+class DescribeCT_Tbl(object):
+
+    def it_can_construct_a_new_tbl_from_rows(self):
+        rows = (values for values in (('a', 1), [None, ' b '], ['c\td']))
+
+        tbl = CT_Tbl.new_tbl_from_rows(rows, 1828800, header=('X', 'Y'))
+
+        assert tbl.col_count == 2
+        assert tbl.tblGrid.gridCol_lst[0].w == 914400
+        trs = tbl.tr_lst
+        assert [tr.trPr is not None for tr in trs] == [True, False, False, False]
+        assert trs[0].trPr[0].tag == qn('w:tblHeader')
+        assert [[tc.xpath('string(.)') for tc in tr.tc_lst] for tr in trs] == [
+            ['X', 'Y'], ['a', '1'], ['', ' b '], ['cd', '']
+        ]
+        assert trs[2].tc_lst[0].xml == trs[3].tc_lst[1].xml
+        assert trs[2].tc_lst[1].xpath('w:p/w:r/w:t/@xml:space') == ['preserve']
+        assert len(trs[3].tc_lst[0].xpath('w:p/w:r/w:tab')) == 1
+
+    def it_can_add_trs_like_a_template_tr(self):
+        tbl = element(
+            'w:tbl/(w:tblGrid/(w:gridCol,w:gridCol),'
+            'w:tr/(w:trPr/w:cantSplit,'
+            'w:tc/w:p/(w:pPr/w:jc{w:val=right},w:r/(w:rPr/w:b,w:t"a")),'
+            'w:tc/w:p/w:r/w:t"b"))'
+        )
+        template_tr = tbl.tr_lst[0]
+
+        trs = tbl.add_trs(iter([(1, None), ['c\td'], ()]), template_tr)
+
+        assert tbl.tr_lst == [template_tr] + trs
+        assert [tr.xml for tr in trs] == [
+            xml(
+                'w:tr/(w:trPr/w:cantSplit,'
+                'w:tc/w:p/(w:pPr/w:jc{w:val=right},w:r/(w:rPr/w:b,w:t"1")),'
+                'w:tc/w:p)'
+            ),
+            xml(
+                'w:tr/(w:trPr/w:cantSplit,'
+                'w:tc/w:p/(w:pPr/w:jc{w:val=right},w:r/(w:rPr/w:b,w:t"c",'
+                'w:tab,w:t"d")),w:tc/w:p)'
+            ),
+            xml(
+                'w:tr/(w:trPr/w:cantSplit,'
+                'w:tc/w:p/w:pPr/w:jc{w:val=right},w:tc/w:p)'
+            ),
+        ]
+
+    def it_can_add_a_number_of_empty_trs(self):
+        tbl = element(
+            'w:tbl/(w:tblGrid/(w:gridCol{w:w=1440},w:gridCol{w:w=720}))'
+        )
+
+        trs = tbl.add_trs(2)
+
+        assert tbl.tr_lst == trs
+        assert [tr.xml for tr in trs] == [xml(
+            'w:tr/(w:tc/(w:tcPr/w:tcW{w:type=dxa,w:w=1440},w:p),'
+            'w:tc/(w:tcPr/w:tcW{w:type=dxa,w:w=720},w:p))'
+        )] * 2
+
+    def it_raises_on_a_row_with_more_values_than_the_template_has_cells(self):
+        tbl = element('w:tbl/(w:tblGrid/w:gridCol,w:tr/w:tc/w:p)')
+
+        with pytest.raises(ValueError) as e:
+            tbl.add_trs([['a'], ['b', 'c']], tbl.tr_lst[0])
+        assert str(e.value) == 'row 1 has more than 1 cells'
+
+    def it_knows_the_position_of_its_rows_however_they_are_moved(self):
+        tbl = element(
+            'w:tbl/(w:tblGrid/w:gridCol,w:tr/w:tc/w:p,w:tr/w:tc/w:p,w:tr/w:tc'
+            '/w:p,w:tr/w:tc/w:p)'
+        )
+        tr_0, tr_1, tr_2, tr_3 = tbl.tr_lst
+        assert [tr.tr_idx for tr in tbl.tr_lst] == [0, 1, 2, 3]
+
+        tr_2.addnext(tr_0)
+
+        assert [tr.tr_idx for tr in tbl.tr_lst] == [0, 1, 2, 3]
+        assert [tr.tr_idx for tr in (tr_0, tr_1, tr_2, tr_3)] == [2, 0, 1, 3]
+        tc_0 = tr_0.tc_lst[0]
+        assert tc_0._tr_idx == 2
+        assert tc_0._tr_above is tr_2
+        assert tc_0._tr_below is tr_3
+
+    def it_raises_when_a_cell_is_not_in_a_table(self):
+        tc = element('w:tr/w:tc')[0]
+
+        with pytest.raises(IndexError):
+            tc._tbl
+
+    def it_takes_its_column_count_from_the_first_row_without_a_header(self):
+        tbl = CT_Tbl.new_tbl_from_rows([['a', 'b', 'c'], ['d']], 1828800)
+
+        assert tbl.col_count == 3
+        assert [len(tr.tc_lst) for tr in tbl.tr_lst] == [3, 3]
+        assert tbl.tr_lst[0].trPr is None
+
+    def it_raises_on_no_rows_and_no_header(self):
+        with pytest.raises(ValueError) as e:
+            CT_Tbl.new_tbl_from_rows(iter(()), 1828800)
+        assert str(e.value) == (
+            'no header and no rows to take column count from'
+        )
+
+    def it_can_construct_a_header_only_tbl_from_no_rows(self):
+        tbl = CT_Tbl.new_tbl_from_rows(iter(()), 1828800, header=('X', 'Y'))
+
+        assert tbl.col_count == 2
+        assert len(tbl.tr_lst) == 1
+
+    def it_raises_on_a_row_longer_than_the_first(self):
+        with pytest.raises(ValueError) as e:
+            CT_Tbl.new_tbl_from_rows([['a'], ['b'], ['c', 'd']], 1828800)
+        assert str(e.value) == 'row 2 has more than 1 cells'
+
+
 class DescribeCT_Tc(object):
 
     def it_can_merge_to_another_tc(
@@ -0,0 +1,50 @@
+# encoding: utf-8
+
+"""
+Test suite for the docx.oxml.text.paragraph module.
+"""
+
+from __future__ import (
+    absolute_import, division, print_function, unicode_literals
+)
+
+import pytest
+
+from docx.oxml.ns import qn
+from docx.oxml.text.paragraph import iter_paragraph_text
+
+from ...unitutil.cxml import element
+
+
+class DescribeIterParagraphText(object):
+
+    def it_generates_the_text_of_each_block_level_paragraph(
+            self, text_fixture):
+        story, expected_text = text_fixture
+        assert list(iter_paragraph_text(story)) == expected_text
+
+    def it_gives_the_same_text_as_each_paragraph(self):
+        story = element(
+            'w:body/(w:p/(w:r/(w:t"a",w:tab,w:t"b"),w:hyperlink/w:r/w:t"c"),'
+            'w:tbl/w:tr/w:tc/w:p/w:r/(w:t"d",w:br,w:t"e",w:cr))'
+        )
+        paragraph_text = [p.text for p in story.iter(qn('w:p'))]
+        assert list(iter_paragraph_text(story)) == paragraph_text
+
+    # fixtures -------------------------------------------------------
+
+    @pytest.fixture(params=[
+        ('w:body', []),
+        ('w:body/w:p', ['']),
+        ('w:body/(w:p/w:r/w:t"foo",w:p,w:p/w:r/w:t"bar")',
+         ['foo', '', 'bar']),
+        ('w:body/(w:p/w:r/w:t"foo",w:tbl/w:tr/(w:tc/w:p/w:r/w:t"bar",'
+         'w:tc/(w:p/w:r/w:t"baz",w:p)),w:p/w:r/w:t"qux")',
+         ['foo', 'bar', 'baz', '', 'qux']),
+        ('w:body/w:sdt/w:sdtContent/w:p/w:hyperlink/w:r/w:t"foo"', ['foo']),
+        ('w:hdr/w:p/w:r/(w:t"foo",w:drawing/w:txbxContent/w:p/w:r/w:t"bar")',
+         ['foo']),
+    ])
+    def text_fixture(self, request):
+        story_cxml, expected_text = request.param
+        return element(story_cxml), expected_text
@@ -6,20 +6,29 @@ from __future__ import absolute_import, division, print_function, unicode_litera
 
 import pytest
 
+from io import BytesIO
+
 from docx.enum.style import WD_STYLE_TYPE
 from docx.opc.constants import RELATIONSHIP_TYPE as RT
 from docx.opc.coreprops import CoreProperties
+from docx.opc.packuri import PackURI
+from docx.opc.phys_pkg import LazyBlob
 from docx.package import Package
 from docx.parts.document import DocumentPart
 from docx.parts.hdrftr import FooterPart, HeaderPart
 from docx.parts.numbering import NumberingPart
 from docx.parts.settings import SettingsPart
 from docx.parts.styles import StylesPart
+from docx.sdt import StructuredDocumentTag
+from docx.section import SectionIndex
 from docx.settings import Settings
 from docx.styles.style import BaseStyle
 from docx.styles.styles import Styles
+from docx.table import Table
+from docx.text.paragraph import Paragraph
 
 from ..oxml.parts.unitdata.document import a_body, a_document
+from ..unitutil.cxml import element, xml
 from ..unitutil.mock import class_mock, instance_mock, method_mock, property_mock
 
 
@@ -83,7 +92,20 @@ class DescribeDocumentPart(object):
     def it_can_save_the_package_to_a_file(self, save_fixture):
         document, file_ = save_fixture
         document.save(file_)
-        document._package.save.assert_called_once_with(file_)
+        document._package.save.assert_called_once_with(file_, None, None)
+
+    def it_keeps_an_index_of_its_sections_until_reset(self):
+        document_part = DocumentPart(
+            None, None, element("w:document/w:body/(w:p/w:pPr/w:sectPr,w:sectPr)"), None
+        )
+
+        section_index = document_part.section_index
+
+        assert isinstance(section_index, SectionIndex)
+        assert len(section_index.sectPr_lst) == 2
+        assert document_part.section_index is section_index
+        document_part.reset_section_index()
+        assert document_part.section_index is not section_index
 
     def it_provides_access_to_the_document_settings(self, settings_fixture):
         document_part, settings_ = settings_fixture
@@ -95,6 +117,16 @@ class DescribeDocumentPart(object):
         styles = document_part.styles
         assert styles is styles_
 
+    def it_provides_access_to_the_resolved_styles(
+        self, _styles_part_prop_, styles_part_
+    ):
+        _styles_part_prop_.return_value = styles_part_
+        document_part = DocumentPart(None, None, None, None)
+
+        resolved_styles = document_part.resolved_styles
+
+        assert resolved_styles is styles_part_.resolved_styles
+
     def it_provides_access_to_its_core_properties(self, core_props_fixture):
         document_part, core_properties_ = core_props_fixture
         core_properties = document_part.core_properties
@@ -107,6 +139,50 @@ class DescribeDocumentPart(object):
         InlineShapes_.assert_called_once_with(body_elm, document)
         assert inline_shapes is InlineShapes_.return_value
 
+    def it_generates_the_block_items_of_its_body(self):
+        document_elm = element("w:document/w:body/(w:p,w:tbl,w:sdt,w:p,w:sectPr)")
+        document_part = DocumentPart(None, None, document_elm, None)
+
+        block_items = list(document_part.iter_block_items())
+
+        assert [type(item) for item in block_items] == [
+            Paragraph, Table, StructuredDocumentTag, Paragraph
+        ]
+        assert all(item.part is document_part for item in block_items)
+
+    def it_parses_a_lazily_loaded_body_as_it_generates_its_items(self, lazy_blob_):
+        lazy_blob_.open.return_value = stream = BytesIO(
+            xml(
+                'w:document/w:body/(w:p/w:r/w:t"foo",w:tbl,'
+                'w:sdt/w:sdtContent/w:p/w:r/w:t"bar",w:sectPr)'
+            ).encode("utf-8")
+        )
+        document_part = DocumentPart.load(None, None, lazy_blob_, None)
+
+        block_items = [
+            (type(item), item._element.xpath("string()"))
+            for item in document_part.iter_block_items()
+        ]
+
+        assert block_items == [
+            (Paragraph, "foo"), (Table, ""), (StructuredDocumentTag, "bar")
+        ]
+        assert stream.closed
+        assert document_part._parsed_element is None
+
+    def it_generates_its_header_and_footer_parts(
+        self, header_part_, footer_part_, styles_part_
+    ):
+        document_part = DocumentPart(PackURI("/word/document.xml"), None, None, None)
+        document_part.load_rel(RT.HEADER, header_part_, "rId1")
+        document_part.load_rel(RT.STYLES, styles_part_, "rId2")
+        document_part.load_rel(RT.FOOTER, footer_part_, "rId3")
+        document_part.load_rel(RT.HEADER, "http://foo/bar", "rId4", is_external=True)
+
+        hdrftr_parts = list(document_part.iter_hdrftr_parts())
+
+        assert hdrftr_parts == [header_part_, footer_part_]
+
     def it_provides_access_to_the_numbering_part(
         self, part_related_by_, numbering_part_
     ):
@@ -268,6 +344,10 @@ class DescribeDocumentPart(object):
     def InlineShapes_(self, request):
         return class_mock(request, 'docx.parts.document.InlineShapes')
 
+    @pytest.fixture
+    def lazy_blob_(self, request):
+        return instance_mock(request, LazyBlob)
+
     @pytest.fixture
     def NumberingPart_(self, request):
         return class_mock(request, 'docx.parts.document.NumberingPart')
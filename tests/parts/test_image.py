@@ -6,10 +6,13 @@ from __future__ import absolute_import, division, print_function, unicode_litera
 
 import pytest
 
+from io import BytesIO
+
 from docx.image.image import Image
 from docx.opc.constants import CONTENT_TYPE as CT, RELATIONSHIP_TYPE as RT
 from docx.opc.packuri import PackURI
 from docx.opc.part import PartFactory
+from docx.opc.phys_pkg import LazyBlob
 from docx.package import Package
 from docx.parts.image import ImagePart
 
@@ -34,6 +37,8 @@ class DescribeImagePart(object):
         assert part is image_part_
 
     def it_can_construct_from_an_Image_instance(self, image_, partname_, _init_):
+        image_.file_blob = None
+
         image_part = ImagePart.from_image(image_, partname_)
 
         _init_.assert_called_once_with(
@@ -41,6 +46,13 @@ class DescribeImagePart(object):
         )
         assert isinstance(image_part, ImagePart)
 
+    def it_refers_to_the_file_of_a_spooled_image(self, image_, partname_, _init_):
+        ImagePart.from_image(image_, partname_)
+
+        _init_.assert_called_once_with(
+            ANY, partname_, image_.content_type, image_.file_blob, image_
+        )
+
     def it_knows_its_default_dimensions_in_EMU(self, dimensions_fixture):
         image_part, cx, cy = dimensions_fixture
         assert image_part.default_cx == cx
@@ -55,6 +67,16 @@ class DescribeImagePart(object):
         image_part = ImagePart(None, None, blob)
         assert image_part.sha1 == '4921e7002ddfba690a937d54bda226a7b8bdeb68'
 
+    def it_hashes_a_lazily_loaded_image_without_loading_it(self, request):
+        lazy_blob_ = instance_mock(request, LazyBlob)
+        lazy_blob_.open.return_value = BytesIO(b'fO0Bar')
+        image_part = ImagePart(None, None, lazy_blob_)
+
+        assert image_part.sha1 == '4921e7002ddfba690a937d54bda226a7b8bdeb68'
+        assert image_part.sha1 == '4921e7002ddfba690a937d54bda226a7b8bdeb68'
+        lazy_blob_.open.assert_called_once_with()
+        lazy_blob_.load.assert_not_called()
+
     # fixtures -------------------------------------------------------
 
     @pytest.fixture
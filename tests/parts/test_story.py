@@ -4,6 +4,8 @@
 
 from __future__ import absolute_import, division, print_function, unicode_literals
 
+from copy import deepcopy
+
 import pytest
 
 from docx.enum.style import WD_STYLE_TYPE
@@ -62,6 +64,16 @@ class DescribeBaseStoryPart(object):
         document_part_.get_style_id.assert_called_once_with(style_, style_type)
         assert style_id == "BodyText"
 
+    def it_provides_access_to_the_resolved_styles(
+        self, _document_part_prop_, document_part_
+    ):
+        _document_part_prop_.return_value = document_part_
+        story_part = BaseStoryPart(None, None, None, None)
+
+        resolved_styles = story_part.resolved_styles
+
+        assert resolved_styles is document_part_.resolved_styles
+
     def it_can_create_a_new_pic_inline(self, get_or_add_image_, image_, next_id_prop_):
         get_or_add_image_.return_value = "rId42", image_
         image_.scaled_dimensions.return_value = 444, 888
@@ -76,6 +88,29 @@ class DescribeBaseStoryPart(object):
         image_.scaled_dimensions.assert_called_once_with(100, 200)
         assert inline.xml == expected_xml
 
+    def it_can_create_new_pic_inlines_in_bulk(
+        self, package_, image_part_, image_, relate_to_
+    ):
+        package_.get_or_add_image_parts.return_value = [image_part_, image_part_]
+        relate_to_.return_value = "rId42"
+        image_part_.image = image_
+        image_.scaled_dimensions.return_value = 444, 888
+        image_.filename = "bar.png"
+        story_element = element("w:document/w:body/w:p/w:r/wp:docPr{id=23}")
+        story_part = BaseStoryPart(None, None, story_element, package_)
+
+        inlines = story_part.new_pic_inlines(
+            ["foo/bar.png", "foo/bar.png"], width=100, height=200, workers=4
+        )
+
+        package_.get_or_add_image_parts.assert_called_once_with(
+            ["foo/bar.png", "foo/bar.png"], 4
+        )
+        assert relate_to_.call_count == 2
+        image_.scaled_dimensions.assert_called_with(100, 200)
+        assert inlines[0].xml == snippet_text("inline")
+        assert [inline.docPr.id for inline in inlines] == [24, 25]
+
     def it_knows_the_next_available_xml_id(self, next_id_fixture):
         story_element, expected_value = next_id_fixture
         story_part = BaseStoryPart(None, None, story_element, None)
@@ -84,6 +119,51 @@ class DescribeBaseStoryPart(object):
 
         assert next_id == expected_value
 
+    def it_keeps_track_of_the_ids_it_gives_out(self, get_or_add_image_, image_):
+        get_or_add_image_.return_value = "rId42", image_
+        image_.scaled_dimensions.return_value = 444, 888
+        image_.filename = "bar.png"
+        story_element = element("w:document/w:body/w:p/w:r/wp:docPr{id=6}")
+        story_part = BaseStoryPart(None, None, story_element, None)
+
+        inlines = [story_part.new_pic_inline("bar.png", None, None) for _ in "abc"]
+        story_part.reserve_ids(element("w:p/w:r/wp:docPr{id=12}"))
+
+        assert [inline.docPr.id for inline in inlines] == [7, 8, 9]
+        assert story_part.next_id == 13
+
+    def it_does_not_give_out_the_same_id_twice(self):
+        story_part = BaseStoryPart(None, None, element("w:document/w:p{id=2}"), None)
+
+        assert [story_part.next_id for _ in "abc"] == [3, 4, 5]
+
+    def it_does_not_reuse_an_id_given_to_a_copied_shape(
+        self, get_or_add_image_, image_
+    ):
+        get_or_add_image_.return_value = "rId42", image_
+        image_.scaled_dimensions.return_value = 444, 888
+        image_.filename = "bar.png"
+        story_element = element("w:document/w:body/w:p/w:r/wp:docPr{id=1}")
+        story_part = BaseStoryPart(None, None, story_element, None)
+        p = story_element[0][0]
+        p_copy = deepcopy(p)
+        p.addnext(p_copy)
+
+        p_copy.xpath(".//wp:docPr")[0].id = story_part.next_id
+        inline = story_part.new_pic_inline("bar.png", None, None)
+
+        assert [docPr.id for docPr in story_element.xpath("//wp:docPr")] == [1, 2]
+        assert inline.docPr.id == 3
+
+    def it_does_not_reuse_the_ids_it_has_reserved(self):
+        story_part = BaseStoryPart(None, None, element("w:document/w:p{id=2}"), None)
+        removed = element("w:tbl{id=3}/w:tr/w:tc/w:p{id=7}")
+
+        story_part.reserve_ids(removed)
+        story_part.reserve_ids(element("w:p{id=5}"))
+
+        assert story_part.next_id == 8
+
     def it_knows_the_main_document_part_to_help(self, package_, document_part_):
         package_.main_document_part = document_part_
         story_part = BaseStoryPart(None, None, None, package_)
@@ -12,7 +12,9 @@ from docx.opc.constants import CONTENT_TYPE as CT
 from docx.opc.package import OpcPackage
 from docx.oxml.styles import CT_Styles
 from docx.parts.styles import StylesPart
-from docx.styles.styles import Styles
+from docx.styles.styles import ResolvedStyles, StyleIndex, Styles
+
+from ..unitutil.cxml import element
 
 from ..unitutil.mock import class_mock, instance_mock
 
@@ -22,9 +24,28 @@ class DescribeStylesPart(object):
     def it_provides_access_to_its_styles(self, styles_fixture):
         styles_part, Styles_, styles_ = styles_fixture
         styles = styles_part.styles
-        Styles_.assert_called_once_with(styles_part.element)
+        Styles_.assert_called_once_with(styles_part.element, styles_part)
         assert styles is styles_
 
+    def it_keeps_an_index_of_its_styles(self):
+        styles_part = StylesPart(None, None, element('w:styles'), None)
+
+        style_index = styles_part.style_index
+
+        assert isinstance(style_index, StyleIndex)
+        assert styles_part.style_index is style_index
+        assert styles_part.styles._style_index is style_index
+
+    def it_keeps_the_formatting_its_styles_resolve_to(self):
+        styles_part = StylesPart(None, None, element('w:styles'), None)
+
+        resolved_styles = styles_part.resolved_styles
+
+        assert isinstance(resolved_styles, ResolvedStyles)
+        assert resolved_styles._style_index is styles_part.style_index
+        assert styles_part.resolved_styles is resolved_styles
+        assert styles_part.styles._resolved_styles is resolved_styles
+
     def it_can_construct_a_default_styles_part_to_help(self):
         package = OpcPackage()
         styles_part = StylesPart.default(package)
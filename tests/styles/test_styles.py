@@ -10,11 +10,11 @@ from docx.enum.style import WD_STYLE_TYPE
 from docx.oxml.styles import CT_Style, CT_Styles
 from docx.styles.latent import LatentStyles
 from docx.styles.style import BaseStyle
-from docx.styles.styles import Styles
+from docx.styles.styles import ResolvedStyles, StyleIndex, Styles
 
-from ..unitutil.cxml import element
+from ..unitutil.cxml import element, xml
 from ..unitutil.mock import (
-    call, class_mock, function_mock, instance_mock, method_mock
+    call, class_mock, function_mock, instance_mock, method_mock, property_mock
 )
 
 
@@ -174,6 +174,17 @@ class DescribeStyles(object):
         LatentStyles_.assert_called_once_with(styles._element.latentStyles)
         assert latent_styles is latent_styles_
 
+    def it_can_reset_the_effective_formatting(self, request):
+        resolved_styles_ = instance_mock(request, ResolvedStyles)
+        property_mock(
+            request, Styles, "_resolved_styles", return_value=resolved_styles_
+        )
+        styles = Styles(element("w:styles"))
+
+        styles.reset_effective_formatting()
+
+        resolved_styles_.clear.assert_called_once_with()
+
     # fixture --------------------------------------------------------
 
     @pytest.fixture(params=[
@@ -185,6 +196,8 @@ class DescribeStyles(object):
         name, name_, style_type, builtin = request.param
         styles = Styles(styles_elm_)
         _getitem_.return_value = None
+        styles_elm_.style_lst = []
+        styles_elm_.get_by_name.return_value = None
         styles_elm_.add_style_of_type.return_value = style_elm_
         StyleFactory_.return_value = style_
         return (
@@ -379,3 +392,138 @@ class DescribeStyles(object):
     @pytest.fixture
     def styles_elm_(self, request):
         return instance_mock(request, CT_Styles)
+
+
+class DescribeStyleIndex(object):
+
+    def it_finds_styles_by_name_and_by_id(self):
+        styles_elm = element(
+            "w:styles/(w:style{w:styleId=Foo}/w:name{w:val=foo},"
+            "w:style{w:styleId=Bar}/w:name{w:val=bar},"
+            "w:style{w:styleId=Foo}/w:name{w:val=foo})"
+        )
+        style_index = StyleIndex(styles_elm)
+
+        assert style_index.get_by_name("bar") is styles_elm[1]
+        assert style_index.get_by_name("foo") is styles_elm[0]
+        assert style_index.get_by_id("Foo") is styles_elm[0]
+        assert style_index.get_by_id("Baz") is None
+
+    def it_looks_again_for_a_style_renamed_or_deleted(self):
+        styles_elm = element(
+            "w:styles/(w:style{w:styleId=Foo}/w:name{w:val=foo},"
+            "w:style{w:styleId=Bar}/w:name{w:val=bar})"
+        )
+        foo, bar = styles_elm[0], styles_elm[1]
+        style_index = StyleIndex(styles_elm)
+        assert style_index.get_by_name("foo") is foo
+
+        foo.name_val = "baz"
+        bar.delete()
+
+        assert style_index.get_by_name("foo") is None
+        assert style_index.get_by_name("baz") is foo
+        assert style_index.get_by_id("Bar") is None
+
+    def it_indexes_a_style_added_to_the_styles(self):
+        styles_elm = element("w:styles/w:style{w:styleId=Foo}/w:name{w:val=foo}")
+        style_index = StyleIndex(styles_elm)
+        style_index.get_by_name("foo")
+
+        style = styles_elm.add_style_of_type("bar", WD_STYLE_TYPE.PARAGRAPH, False)
+        style_index.add(style)
+
+        assert style_index.get_by_name("bar") is style
+        assert style_index.get_by_id("bar") is style
+
+    def it_keeps_the_default_style_of_each_type(self):
+        styles_elm = element(
+            "w:styles/(w:style{w:type=paragraph,w:default=1},"
+            "w:style{w:type=character})"
+        )
+        style_index = StyleIndex(styles_elm)
+
+        assert style_index.default_for(WD_STYLE_TYPE.PARAGRAPH) is styles_elm[0]
+        assert style_index.default_for(WD_STYLE_TYPE.CHARACTER) is None
+        styles_elm[0].default = False
+        styles_elm[1].default = True
+        assert style_index.default_for(WD_STYLE_TYPE.PARAGRAPH) is None
+        assert style_index.default_for(WD_STYLE_TYPE.CHARACTER) is styles_elm[1]
+
+
+class DescribeResolvedStyles(object):
+
+    def it_resolves_the_paragraph_properties_of_a_paragraph(self):
+        styles_elm = element(
+            "w:styles/(w:docDefaults/w:pPrDefault/w:pPr/(w:jc{w:val=left},w:s"
+            "pacing{w:after=200}),w:style{w:type=paragraph,w:styleId=Base}/w:pP"
+            "r/w:keepNext,w:style{w:type=paragraph,w:styleId=Foo}/(w:basedOn{w"
+            ":val=Base},w:pPr/w:spacing{w:before=120}))"
+        )
+        p = element("w:p/w:pPr/(w:pStyle{w:val=Foo},w:jc{w:val=center})")
+        resolved_styles = ResolvedStyles(styles_elm, StyleIndex(styles_elm))
+
+        pPr = resolved_styles.paragraph_properties(p)
+
+        assert pPr.xml == xml(
+            "w:pPr/(w:jc{w:val=center},w:spacing{w:after=200,w:before=120},w"
+            ":keepNext)"
+        )
+        assert p.pPr.xml == xml("w:pPr/(w:pStyle{w:val=Foo},w:jc{w:val=center})")
+
+    def it_resolves_the_run_properties_of_a_run(self):
+        styles_elm = element(
+            "w:styles/(w:docDefaults/w:rPrDefault/w:rPr/(w:sz{w:val=22},w:i),w"
+            ":style{w:type=paragraph,w:default=1,w:styleId=Normal}/w:rPr/w:b,w:"
+            "style{w:type=character,w:styleId=Strong}/w:rPr/(w:b,w:i))"
+        )
+        p = element(
+            "w:p/(w:r/w:rPr/w:rStyle{w:val=Strong},w:r/w:rPr/w:sz{w:val=28})"
+        )
+        resolved_styles = ResolvedStyles(styles_elm, StyleIndex(styles_elm))
+
+        strong_rPr = resolved_styles.run_properties(p[0])
+        plain_rPr = resolved_styles.run_properties(p[1])
+
+        assert strong_rPr.xml == xml("w:rPr/(w:sz{w:val=22},w:i,w:b{w:val=0})")
+        assert plain_rPr.xml == xml("w:rPr/(w:sz{w:val=28},w:i,w:b)")
+
+    def it_falls_back_to_the_default_style_of_the_type(self):
+        styles_elm = element(
+            "w:styles/(w:style{w:type=paragraph,w:default=1,w:styleId=Normal}/"
+            "w:pPr/w:keepNext,w:style{w:type=character,w:styleId=Foo}/w:pPr/w:"
+            "keepLines)"
+        )
+        resolved_styles = ResolvedStyles(styles_elm, StyleIndex(styles_elm))
+
+        for p_cxml in ("w:p", "w:p/w:pPr/w:pStyle{w:val=Foo}",
+                       "w:p/w:pPr/w:pStyle{w:val=Bar}"):
+            pPr = resolved_styles.paragraph_properties(element(p_cxml))
+            assert pPr.xml == xml("w:pPr/w:keepNext")
+
+    def it_stops_at_a_basedOn_loop(self):
+        styles_elm = element(
+            "w:styles/(w:style{w:type=paragraph,w:styleId=Foo}/(w:basedOn{w:v"
+            "al=Bar},w:pPr/w:keepNext),w:style{w:type=paragraph,w:styleId=Bar}"
+            "/(w:basedOn{w:val=Foo},w:pPr/w:keepLines))"
+        )
+        p = element("w:p/w:pPr/w:pStyle{w:val=Foo}")
+        resolved_styles = ResolvedStyles(styles_elm, StyleIndex(styles_elm))
+
+        pPr = resolved_styles.paragraph_properties(p)
+
+        assert pPr.xml == xml("w:pPr/(w:keepLines,w:keepNext)")
+
+    def it_keeps_what_it_resolves_until_cleared(self):
+        styles_elm = element(
+            "w:styles/w:style{w:type=paragraph,w:styleId=Foo}/w:rPr/w:b"
+        )
+        r = element("w:p/(w:pPr/w:pStyle{w:val=Foo},w:r)")[1]
+        resolved_styles = ResolvedStyles(styles_elm, StyleIndex(styles_elm))
+        assert resolved_styles.run_properties(r).xml == xml("w:rPr/w:b")
+
+        styles_elm[0].rPr.append(element("w:i"))
+        assert resolved_styles.run_properties(r).xml == xml("w:rPr/w:b")
+
+        resolved_styles.clear()
+        assert resolved_styles.run_properties(r).xml == xml("w:rPr/(w:b,w:i)")
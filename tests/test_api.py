@@ -12,10 +12,14 @@ import pytest
 
 import docx
 
-from docx.api import Document
+from docx.api import Document, iter_block_items, TemplateRegistry
 from docx.opc.constants import CONTENT_TYPE as CT
+from docx.text.paragraph import Paragraph
 
-from .unitutil.mock import function_mock, instance_mock, class_mock
+from .unitutil.file import test_file
+from .unitutil.mock import (
+    class_mock, function_mock, instance_mock, Mock, var_mock
+)
 
 
 class DescribeDocument(object):
@@ -23,13 +27,32 @@ class DescribeDocument(object):
     def it_opens_a_docx_file(self, open_fixture):
         docx, Package_, document_ = open_fixture
         document = Document(docx)
-        Package_.open.assert_called_once_with(docx)
+        Package_.open.assert_called_once_with(docx, False)
         assert document is document_
 
-    def it_opens_the_default_docx_if_none_specified(self, default_fixture):
-        docx, Package_, document_ = default_fixture
+    def it_copies_the_default_template_if_none_specified(
+        self, _default_docx_path_, templates_, document_
+    ):
+        _default_docx_path_.return_value = 'barfoo.docx'
+        templates_.document.return_value = document_
+
         document = Document()
-        Package_.open.assert_called_once_with(docx)
+
+        templates_.document.assert_called_once_with('barfoo.docx')
+        assert document is document_
+
+    def it_opens_the_default_template_lazily_when_asked(
+        self, _default_docx_path_, templates_, Package_, document_
+    ):
+        _default_docx_path_.return_value = 'barfoo.docx'
+        document_part = Package_.open.return_value.main_document_part
+        document_part.document = document_
+        document_part.content_type = CT.WML_DOCUMENT_MAIN
+
+        document = Document(lazy=True)
+
+        Package_.open.assert_called_once_with('barfoo.docx', True)
+        assert templates_.document.call_count == 0
         assert document is document_
 
     def it_raises_on_not_a_Word_file(self, raise_fixture):
@@ -39,15 +62,6 @@ class DescribeDocument(object):
 
     # fixtures -------------------------------------------------------
 
-    @pytest.fixture
-    def default_fixture(self, _default_docx_path_, Package_, document_):
-        docx = 'barfoo.docx'
-        _default_docx_path_.return_value = docx
-        document_part = Package_.open.return_value.main_document_part
-        document_part.document = document_
-        document_part.content_type = CT.WML_DOCUMENT_MAIN
-        return docx, Package_, document_
-
     @pytest.fixture
     def open_fixture(self, Package_, document_):
         docx = 'foobar.docx'
@@ -75,3 +89,105 @@ class DescribeDocument(object):
     @pytest.fixture
     def Package_(self, request):
         return class_mock(request, 'docx.api.Package')
+
+    @pytest.fixture
+    def templates_(self, request):
+        return var_mock(request, 'docx.api.templates')
+
+
+class DescribeIterBlockItems(object):
+
+    def it_reads_the_block_items_of_a_lazily_opened_docx(self, Package_):
+        package = Package_.open.return_value
+        document_part = package.main_document_part
+        document_part.content_type = CT.WML_DOCUMENT_MAIN
+        document_part.iter_block_items.return_value = iter([1, 2])
+
+        block_items = list(iter_block_items('foobar.docx'))
+
+        Package_.open.assert_called_once_with('foobar.docx', lazy=True)
+        assert block_items == [1, 2]
+        package.close.assert_called_once_with()
+
+    def it_closes_the_docx_when_the_generator_is_closed(self, Package_):
+        package = Package_.open.return_value
+        document_part = package.main_document_part
+        document_part.content_type = CT.WML_DOCUMENT_MAIN
+        document_part.iter_block_items.return_value = iter([1, 2])
+        block_items = iter_block_items('foobar.docx')
+        next(block_items)
+
+        block_items.close()
+
+        package.close.assert_called_once_with()
+
+    def it_generates_the_same_paragraphs_as_the_document_has(self):
+        path = test_file('having-images.docx')
+        paragraphs = Document(path).paragraphs
+
+        block_items = [
+            (type(item), item.text, item.style.name)
+            for item in iter_block_items(path)
+        ]
+
+        assert block_items == [
+            (Paragraph, p.text, p.style.name) for p in paragraphs
+        ]
+
+    # fixture components ---------------------------------------------
+
+    @pytest.fixture
+    def Package_(self, request):
+        return class_mock(request, 'docx.api.Package')
+
+
+class DescribeTemplateRegistry(object):
+
+    def it_opens_a_template_once_and_copies_it_for_each_document(
+        self, Package_
+    ):
+        template_package = Package_.open.return_value
+        clones = [Mock(name='clone_1'), Mock(name='clone_2')]
+        template_package.clone.side_effect = clones
+        for clone in clones:
+            clone.main_document_part.content_type = CT.WML_DOCUMENT_MAIN
+        registry = TemplateRegistry()
+
+        documents = [registry.document('foo.docx') for _ in range(2)]
+
+        Package_.open.assert_called_once_with('foo.docx')
+        assert documents == [
+            clone.main_document_part.document for clone in clones
+        ]
+
+    def it_copies_a_template_without_holding_the_lock(self, Package_):
+        registry = TemplateRegistry()
+        clone = Mock(name='clone')
+        clone.main_document_part.content_type = CT.WML_DOCUMENT_MAIN
+        locked_while_cloning = []
+
+        def clone_template():
+            locked_while_cloning.append(registry._lock.locked())
+            return clone
+        Package_.open.return_value.clone.side_effect = clone_template
+
+        registry.document('foo.docx')
+
+        assert locked_while_cloning == [False]
+
+    def it_makes_independent_documents_from_a_template(self):
+        registry = TemplateRegistry()
+        document = registry.document(docx.api._default_docx_path())
+        document.add_paragraph('foobar')
+
+        other_document = registry.document(docx.api._default_docx_path())
+
+        assert document.paragraphs[-1].text == 'foobar'
+        assert len(other_document.paragraphs) == 0
+        assert other_document.part.package is not document.part.package
+
+    # fixture components ---------------------------------------------
+
+    @pytest.fixture
+    def Package_(self, request):
+        return class_mock(request, 'docx.api.Package')
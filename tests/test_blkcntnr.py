@@ -7,13 +7,15 @@ from __future__ import absolute_import, division, print_function, unicode_litera
 import pytest
 
 from docx.blkcntnr import BlockItemContainer
+from docx.oxml.ns import qn
+from docx.sdt import StructuredDocumentTag
 from docx.shared import Inches
 from docx.table import Table
 from docx.text.paragraph import Paragraph
 
 from .unitutil.cxml import element, xml
 from .unitutil.file import snippet_seq
-from .unitutil.mock import call, instance_mock, method_mock
+from .unitutil.mock import call, instance_mock, method_mock, property_mock
 
 
 class DescribeBlockItemContainer(object):
@@ -30,6 +32,22 @@ class DescribeBlockItemContainer(object):
         assert paragraph.style == style
         assert paragraph is paragraph_
 
+    def it_can_add_pictures_in_bulk(self, request):
+        part_prop_ = property_mock(request, BlockItemContainer, 'part')
+        inlines = [element('wp:inline/wp:docPr{id=%d}' % n) for n in (1, 2)]
+        part_prop_.return_value.new_pic_inlines.return_value = inlines
+        blkcntnr = BlockItemContainer(element('w:body'), None)
+
+        shapes = blkcntnr.add_pictures(['a.png', 'b.png'], 100, 200, 3)
+
+        part_prop_.return_value.new_pic_inlines.assert_called_once_with(
+            ['a.png', 'b.png'], 100, 200, 3
+        )
+        body = blkcntnr._element
+        assert body.xpath('./w:p/w:r/w:drawing/wp:inline') == inlines
+        assert len(body) == 2
+        assert [shape._inline for shape in shapes] == inlines
+
     def it_can_add_a_table(self, add_table_fixture):
         blkcntnr, rows, cols, width, expected_xml = add_table_fixture
         table = blkcntnr.add_table(rows, cols, width)
@@ -37,6 +55,36 @@ class DescribeBlockItemContainer(object):
         assert table._element.xml == expected_xml
         assert table._parent is blkcntnr
 
+    def it_can_add_a_table_from_rows(self, table_style_prop_):
+        blkcntnr = BlockItemContainer(element('w:body/w:p'), None)
+
+        table = blkcntnr.add_table_from_rows(
+            iter([(1, 2), (3, 4)]), Inches(2), 'Grid', header=('a', 'b')
+        )
+
+        assert isinstance(table, Table)
+        assert table._parent is blkcntnr
+        assert blkcntnr._element[-1] is table._tbl
+        assert [[c.text for c in row.cells] for row in table.rows] == [
+            ['a', 'b'], ['1', '2'], ['3', '4']
+        ]
+        table_style_prop_.assert_called_once_with('Grid')
+
+    def it_can_iterate_its_block_items_in_document_order(self):
+        blkcntnr = BlockItemContainer(
+            element('w:body/(w:p,w:tbl,w:bookmarkStart,w:sdt,w:p,w:sectPr)'), None
+        )
+
+        block_items = list(blkcntnr.iter_block_items())
+
+        assert [type(item) for item in block_items] == [
+            Paragraph, Table, StructuredDocumentTag, Paragraph
+        ]
+        assert [item._element.tag for item in block_items] == [
+            qn('w:p'), qn('w:tbl'), qn('w:sdt'), qn('w:p')
+        ]
+        assert all(item._parent is blkcntnr for item in block_items)
+
     def it_provides_access_to_the_paragraphs_it_contains(
             self, paragraphs_fixture):
         # test len(), iterable, and indexed access
@@ -97,6 +145,10 @@ class DescribeBlockItemContainer(object):
         expected_xml = snippet_seq('new-tbl')[0]
         return blkcntnr, rows, cols, width, expected_xml
 
+    @pytest.fixture
+    def table_style_prop_(self, request):
+        return property_mock(request, Table, 'style')
+
     @pytest.fixture(params=[
         ('w:body',                 0),
         ('w:body/w:p',             1),
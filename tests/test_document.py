@@ -4,13 +4,21 @@
 
 from __future__ import absolute_import, division, print_function, unicode_literals
 
+import os
 import pytest
 
+from io import BytesIO
+
+import docx
+
 from docx.document import _Body, Document
 from docx.enum.section import WD_SECTION
 from docx.enum.text import WD_BREAK
 from docx.opc.coreprops import CoreProperties
+from docx.oxml.ns import qn
+from docx.package import ImageParts
 from docx.parts.document import DocumentPart
+from docx.parts.hdrftr import HeaderPart
 from docx.section import Section, Sections
 from docx.settings import Settings
 from docx.shape import InlineShape, InlineShapes
@@ -21,6 +29,7 @@ from docx.text.paragraph import Paragraph
 from docx.text.run import Run
 
 from .unitutil.cxml import element, xml
+from .unitutil.file import test_file
 from .unitutil.mock import class_mock, instance_mock, method_mock, property_mock
 
 
@@ -67,6 +76,29 @@ class DescribeDocument(object):
         run_.add_picture.assert_called_once_with(path, width, height)
         assert picture is picture_
 
+    def it_can_add_pictures_in_bulk(self):
+        document = docx.Document()
+        paths = [
+            test_file('monty-truth.png'), test_file('python-icon.jpeg'),
+            test_file('monty-truth.png'),
+        ]
+
+        pictures = document.add_pictures(paths, width=Length(914400), workers=2)
+
+        assert [p._inline.docPr.id for p in pictures] == [1, 2, 3]
+        assert [p.width for p in pictures] == [914400] * 3
+        assert [p._inline.docPr.name for p in pictures] == [
+            'Picture 1', 'Picture 2', 'Picture 3'
+        ]
+        image_parts = list(document.part.package.image_parts)
+        assert [part.partname for part in image_parts] == [
+            '/word/media/image1.png', '/word/media/image2.jpeg'
+        ]
+        rIds = [p._inline.graphic.graphicData.pic.blipFill.blip.embed
+                for p in pictures]
+        assert rIds[0] == rIds[2] != rIds[1]
+        assert len(document.paragraphs) == 3
+
     def it_can_add_a_section(
         self, add_section_fixture, Section_, section_, document_part_
     ):
@@ -78,6 +110,7 @@ class DescribeDocument(object):
 
         assert document.element.xml == expected_xml
         sectPr = document.element.xpath('w:body/w:sectPr')[0]
+        document_part_.reset_section_index.assert_called_once_with()
         Section_.assert_called_once_with(sectPr, document_part_)
         assert section is section_
 
@@ -88,10 +121,31 @@ class DescribeDocument(object):
         assert table == table_
         assert table.style == style
 
+    def it_can_add_a_table_from_rows(self, _block_width_prop_, body_prop_, table_):
+        document = Document(None, None)
+        rows, style, header = [(1, 2)], 'Table Grid', ('a', 'b')
+        _block_width_prop_.return_value = width = 42
+        body_prop_.return_value.add_table_from_rows.return_value = table_
+
+        table = document.add_table_from_rows(rows, style, header)
+
+        body_prop_.return_value.add_table_from_rows.assert_called_once_with(
+            rows, width, style, header
+        )
+        assert table is table_
+
     def it_can_save_the_document_to_a_file(self, save_fixture):
         document, file_ = save_fixture
         document.save(file_)
-        document._part.save.assert_called_once_with(file_)
+        document._part.save.assert_called_once_with(file_, None, None)
+
+    def it_can_stream_the_document_to_a_file(self, document_part_, DocumentStream_):
+        document = Document(None, document_part_)
+
+        stream = document.stream('foobar.docx')
+
+        DocumentStream_.assert_called_once_with(document, 'foobar.docx', None)
+        assert stream is DocumentStream_.return_value
 
     def it_provides_access_to_its_core_properties(self, core_props_fixture):
         document, core_properties_ = core_props_fixture
@@ -102,6 +156,25 @@ class DescribeDocument(object):
         document, inline_shapes_ = inline_shapes_fixture
         assert document.inline_shapes is inline_shapes_
 
+    def it_can_iterate_its_block_items(self, body_prop_):
+        document = Document(None, None)
+        body_prop_.return_value.iter_block_items.return_value = iter(())
+
+        block_items = document.iter_block_items()
+
+        assert block_items is body_prop_.return_value.iter_block_items.return_value
+
+    def it_can_iterate_the_text_of_its_paragraphs(self, document_part_, header_part_):
+        document = Document(
+            element('w:document/w:body/(w:p/w:r/w:t"foo",w:tbl/w:tr/w:tc/w:p)'),
+            document_part_,
+        )
+        document_part_.iter_hdrftr_parts.return_value = iter([header_part_])
+        header_part_.element = element('w:hdr/w:p/w:hyperlink/w:r/w:t"bar"')
+
+        assert list(document.iter_text(headers_and_footers=False)) == ["foo", ""]
+        assert list(document.iter_text()) == ["foo", "", "bar"]
+
     def it_provides_access_to_its_paragraphs(self, paragraphs_fixture):
         document, paragraphs_ = paragraphs_fixture
         paragraphs = document.paragraphs
@@ -121,6 +194,17 @@ class DescribeDocument(object):
         document, settings_ = settings_fixture
         assert document.settings is settings_
 
+    def it_can_change_whether_it_spools_images(self, document_part_):
+        image_parts = ImageParts()
+        document_part_.package.image_parts = image_parts
+        document = Document(None, document_part_)
+        assert document.spool_images is False
+
+        document.spool_images = True
+
+        assert image_parts.spool_images is True
+        assert document.spool_images is True
+
     def it_provides_access_to_its_styles(self, styles_fixture):
         document, styles_ = styles_fixture
         assert document.styles is styles_
@@ -336,6 +420,14 @@ class DescribeDocument(object):
     def sections_prop_(self, request):
         return property_mock(request, Document, 'sections')
 
+    @pytest.fixture
+    def header_part_(self, request):
+        return instance_mock(request, HeaderPart)
+
+    @pytest.fixture
+    def DocumentStream_(self, request):
+        return class_mock(request, 'docx.document.DocumentStream')
+
     @pytest.fixture
     def settings_(self, request):
         return instance_mock(request, Settings)
@@ -353,12 +445,73 @@ class DescribeDocument(object):
         return instance_mock(request, list)
 
 
+class DescribeDocumentStream(object):
+
+    def it_writes_block_items_to_the_file_as_they_are_added(self):
+        document = docx.Document()
+        document.add_paragraph('Foo')
+        pkg_file = BytesIO()
+
+        with document.stream(pkg_file) as stream:
+            paragraph = stream.add_paragraph('Bar')
+            paragraph.add_run(' baz')
+            stream.add_table(2, 3).cell(1, 2).text = 'Qux'
+            stream.add_table_from_rows([('Quux',)])
+            body_children = [child.tag for child in document.element.body]
+            stream.add_section(WD_SECTION.ODD_PAGE)
+            stream.add_page_break()
+
+        assert body_children == [qn('w:tbl'), qn('w:sectPr')]
+        assert [child.tag for child in document.element.body] == [qn('w:sectPr')]
+        streamed = docx.Document(pkg_file)
+        paragraphs = streamed.paragraphs
+        assert [p.text for p in paragraphs[:2]] == ['Foo', 'Bar baz']
+        assert streamed.tables[0].cell(1, 2).text == 'Qux'
+        assert streamed.tables[1].cell(0, 0).text == 'Quux'
+        assert len(paragraphs) == 4
+        assert streamed.sections[-1].start_type == WD_SECTION.ODD_PAGE
+
+    def it_does_not_reuse_the_ids_of_streamed_shapes(self):
+        document = docx.Document()
+        pkg_file = BytesIO()
+
+        with document.stream(pkg_file) as stream:
+            stream.add_picture(test_file('monty-truth.png'))
+            stream.add_picture(test_file('monty-truth.png'))
+
+        inline_shapes = docx.Document(pkg_file).inline_shapes
+        assert [s._inline.docPr.id for s in inline_shapes] == [1, 2]
+
+    def it_removes_the_partly_written_file_when_the_block_raises(
+            self, tmpdir):
+        document = docx.Document()
+        path = str(tmpdir.join('streamed.docx'))
+
+        with pytest.raises(KeyError):
+            with document.stream(path) as stream:
+                stream.add_paragraph('Foo')
+                stream.add_paragraph('Bar')
+                raise KeyError('baz')
+
+        assert not os.path.exists(path)
+
+    def it_raises_when_content_is_added_after_closing(self):
+        document = docx.Document()
+        stream = document.stream(BytesIO())
+        stream.close()
+
+        with pytest.raises(ValueError):
+            stream.add_paragraph('Foo')
+
+
 class Describe_Body(object):
 
-    def it_can_clear_itself_of_all_content_it_holds(self, clear_fixture):
+    def it_can_clear_itself_of_all_content_it_holds(
+            self, clear_fixture, document_part_):
         body, expected_xml = clear_fixture
         _body = body.clear_content()
         assert body._body.xml == expected_xml
+        document_part_.reset_section_index.assert_called_once_with()
         assert _body is body
 
     # fixtures -------------------------------------------------------
@@ -369,8 +522,15 @@ class Describe_Body(object):
         ('w:body/w:sectPr',        'w:body/w:sectPr'),
         ('w:body/(w:p, w:sectPr)', 'w:body/w:sectPr'),
     ])
-    def clear_fixture(self, request):
+    def clear_fixture(self, request, document_part_):
         before_cxml, after_cxml = request.param
-        body = _Body(element(before_cxml), None)
+        document_ = instance_mock(request, Document, part=document_part_)
+        body = _Body(element(before_cxml), document_)
         expected_xml = xml(after_cxml)
         return body, expected_xml
+
+    # fixture components ---------------------------------------------
+
+    @pytest.fixture
+    def document_part_(self, request):
+        return instance_mock(request, DocumentPart)
@@ -6,13 +6,17 @@ from __future__ import absolute_import, division, print_function, unicode_litera
 
 import pytest
 
+from docx.image.cache import ImageCache
 from docx.image.image import Image
+from docx.opc.package import OpcPackage
 from docx.opc.packuri import PackURI
 from docx.package import ImageParts, Package
 from docx.parts.image import ImagePart
 
 from .unitutil.file import docx_path
-from .unitutil.mock import class_mock, instance_mock, method_mock, property_mock
+from .unitutil.mock import (
+    class_mock, instance_mock, method_mock, property_mock, var_mock
+)
 
 
 class DescribePackage(object):
@@ -36,6 +40,45 @@ class DescribePackage(object):
         for image_part in image_parts:
             assert isinstance(image_part, ImagePart)
 
+    def it_drops_pruned_image_parts_from_its_image_parts(
+        self, request, image_parts_prop_, image_parts_, image_part_
+    ):
+        removed_parts = [image_part_]
+        prune_unreferenced_parts_ = method_mock(
+            request, OpcPackage, "prune_unreferenced_parts", return_value=removed_parts
+        )
+        image_parts_prop_.return_value = image_parts_
+        package = Package()
+
+        assert package.prune_unreferenced_parts() is removed_parts
+
+        prune_unreferenced_parts_.assert_called_once_with(package)
+        image_parts_.drop.assert_called_once_with(removed_parts)
+
+    def it_keeps_the_parts_still_referred_to_when_pruning(self):
+        package = Package.open(docx_path("having-images"))
+        parts = package.parts
+
+        assert package.prune_unreferenced_parts() == []
+        assert package.parts == parts
+        assert len(package.image_parts) == 3
+
+    def it_prunes_image_parts_no_longer_referred_to(self):
+        package = Package.open(docx_path("having-images"))
+        document_elm = package.main_document_part.element
+        for blip in document_elm.xpath("//a:blip"):
+            blip.getparent().remove(blip)
+
+        removed_parts = package.prune_unreferenced_parts()
+
+        # ---image3.png is also used in the header, which is left as it is---
+        assert sorted(part.partname for part in removed_parts) == [
+            "/word/media/image1.png", "/word/media/image2.png"
+        ]
+        assert [part.partname for part in package.image_parts] == [
+            "/word/media/image3.png"
+        ]
+
     # fixture components ---------------------------------------------
 
     @pytest.fixture
@@ -54,23 +97,23 @@ class DescribePackage(object):
 class DescribeImageParts(object):
 
     def it_can_get_a_matching_image_part(
-        self, Image_, image_, _get_by_sha1_, image_part_
+        self, image_cache_, image_, _get_by_sha1_, image_part_
     ):
-        Image_.from_file.return_value = image_
+        image_cache_.image.return_value = image_
         image_.sha1 = "f005ba11"
         _get_by_sha1_.return_value = image_part_
         image_parts = ImageParts()
 
         image_part = image_parts.get_or_add_image_part("image.jpg")
 
-        Image_.from_file.assert_called_once_with("image.jpg")
+        image_cache_.image.assert_called_once_with("image.jpg")
         _get_by_sha1_.assert_called_once_with(image_parts, "f005ba11")
         assert image_part is image_part_
 
     def but_it_adds_a_new_image_part_when_match_fails(
-        self, Image_, image_, _get_by_sha1_, _add_image_part_, image_part_
+        self, image_cache_, image_, _get_by_sha1_, _add_image_part_, image_part_
     ):
-        Image_.from_file.return_value = image_
+        image_cache_.image.return_value = image_
         image_.sha1 = "fa1afe1"
         _get_by_sha1_.return_value = None
         _add_image_part_.return_value = image_part_
@@ -78,15 +121,116 @@ class DescribeImageParts(object):
 
         image_part = image_parts.get_or_add_image_part("image.png")
 
-        Image_.from_file.assert_called_once_with("image.png")
+        image_cache_.image.assert_called_once_with("image.png")
         _get_by_sha1_.assert_called_once_with(image_parts, "fa1afe1")
         _add_image_part_.assert_called_once_with(image_parts, image_)
         assert image_part is image_part_
 
+    def and_it_spools_the_image_to_disk_when_asked_to(
+        self, image_cache_, Image_, image_, _add_image_part_, image_part_
+    ):
+        Image_.from_file.return_value = image_
+        image_.sha1 = "fa1afe1"
+        _add_image_part_.return_value = image_part_
+        image_parts = ImageParts()
+        image_parts.spool_images = True
+
+        image_part = image_parts.get_or_add_image_part("image.png")
+
+        Image_.from_file.assert_called_once_with("image.png", spool=True)
+        assert image_cache_.image.call_count == 0
+        _add_image_part_.assert_called_once_with(image_parts, image_)
+        assert image_part is image_part_
+
+    @pytest.mark.parametrize("workers", [None, 1, 3])
+    def it_can_get_or_add_image_parts_in_bulk(self, request, workers):
+        _load_image_ = method_mock(
+            request, ImageParts, "_load_image", side_effect=lambda self, d: "img-" + d
+        )
+        _get_or_add_image_part_for_ = method_mock(
+            request,
+            ImageParts,
+            "_get_or_add_image_part_for",
+            side_effect=lambda self, image: "part-" + image,
+        )
+        image_parts = ImageParts()
+
+        image_parts_ = image_parts.get_or_add_image_parts(
+            iter(["a.png", "b.jpg", "a.png"]), workers
+        )
+
+        assert sorted(c.args[1] for c in _load_image_.call_args_list) == [
+            "a.png", "a.png", "b.jpg"
+        ]
+        assert _get_or_add_image_part_for_.call_args_list == [
+            ((image_parts, "img-a.png"),),
+            ((image_parts, "img-b.jpg"),),
+            ((image_parts, "img-a.png"),),
+        ]
+        assert image_parts_ == ["part-img-a.png", "part-img-b.jpg", "part-img-a.png"]
+
     def it_knows_the_next_available_image_partname(self, next_partname_fixture):
         image_parts, ext, expected_partname = next_partname_fixture
         assert image_parts._next_image_partname(ext) == expected_partname
 
+    def it_reuses_partname_numbers_as_parts_are_added(self, request):
+        image_parts = ImageParts()
+        for n in (1, 3):
+            image_parts.append(instance_mock(
+                request, ImagePart, partname=PackURI('/word/media/image%d.png' % n)
+            ))
+
+        partnames = []
+        for _ in range(3):
+            partname = image_parts._next_image_partname('jpg')
+            partnames.append(partname)
+            image_parts.append(instance_mock(request, ImagePart, partname=partname))
+
+        assert partnames == [
+            '/word/media/image2.jpg', '/word/media/image4.jpg', '/word/media/image5.jpg'
+        ]
+
+    def it_indexes_its_image_parts_by_sha1(self, request):
+        def image_part_(n, sha1):
+            return instance_mock(
+                request, ImagePart, partname=PackURI('/word/media/image%d.png' % n),
+                sha1=sha1,
+            )
+
+        image_parts = ImageParts()
+        part_1, part_2, part_3 = (
+            image_part_(1, "f00"), image_part_(2, "ba7"), image_part_(3, "f00")
+        )
+        image_parts.append(part_1)
+        image_parts.append(part_2)
+
+        assert image_parts._get_by_sha1("ba7") is part_2
+        image_parts.append(part_3)
+        assert image_parts._get_by_sha1("f00") is part_1
+        assert image_parts._get_by_sha1("ba2") is None
+        assert part_3 in image_parts
+
+    def it_can_drop_image_parts(self, request):
+        image_parts = ImageParts()
+        parts = [
+            instance_mock(
+                request, ImagePart, partname=PackURI("/word/media/image%d.png" % n),
+                sha1="sha%d" % n,
+            )
+            for n in (1, 2, 3)
+        ]
+        for part in parts:
+            image_parts.append(part)
+        assert image_parts._get_by_sha1("sha2") is parts[1]
+
+        image_parts.drop([parts[1], instance_mock(request, ImagePart)])
+
+        assert list(image_parts) == [parts[0], parts[2]]
+        assert parts[1] not in image_parts
+        assert image_parts._get_by_sha1("sha2") is None
+        assert image_parts._get_by_sha1("sha3") is parts[2]
+        assert image_parts._next_image_partname("png") == "/word/media/image2.png"
+
     def it_can_really_add_a_new_image_part(
         self, _next_image_partname_, partname_, image_, ImagePart_, image_part_
     ):
@@ -132,13 +276,17 @@ class DescribeImageParts(object):
         return method_mock(request, ImageParts, '_get_by_sha1')
 
     @pytest.fixture
-    def Image_(self, request):
-        return class_mock(request, 'docx.package.Image')
+    def image_cache_(self, request):
+        return var_mock(request, 'docx.package.image_cache', spec_set=ImageCache)
 
     @pytest.fixture
     def image_(self, request):
         return instance_mock(request, Image)
 
+    @pytest.fixture
+    def Image_(self, request):
+        return class_mock(request, 'docx.package.Image')
+
     @pytest.fixture
     def ImagePart_(self, request):
         return class_mock(request, 'docx.package.ImagePart')
@@ -0,0 +1,30 @@
+# encoding: utf-8
+
+"""Unit test suite for the docx.sdt module"""
+
+from __future__ import absolute_import, division, print_function, unicode_literals
+
+from docx.sdt import StructuredDocumentTag
+from docx.table import Table
+from docx.text.paragraph import Paragraph
+
+from .unitutil.cxml import element
+
+
+class DescribeStructuredDocumentTag(object):
+
+    def it_can_iterate_the_block_items_of_its_content(self):
+        sdt = StructuredDocumentTag(
+            element("w:sdt/(w:sdtPr,w:sdtContent/(w:p,w:tbl,w:sdt))"), None
+        )
+
+        block_items = list(sdt.iter_block_items())
+
+        assert [type(item) for item in block_items] == [
+            Paragraph, Table, StructuredDocumentTag
+        ]
+        assert block_items[0]._parent._parent is sdt
+
+    def it_has_no_block_items_when_it_has_no_content(self):
+        sdt = StructuredDocumentTag(element("w:sdt/w:sdtPr"), None)
+        assert list(sdt.iter_block_items()) == []
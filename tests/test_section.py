@@ -9,8 +9,12 @@ import pytest
 from docx.enum.section import WD_HEADER_FOOTER, WD_ORIENT, WD_SECTION
 from docx.parts.document import DocumentPart
 from docx.parts.hdrftr import FooterPart, HeaderPart
-from docx.section import _BaseHeaderFooter, _Footer, _Header, Section, Sections
+from docx.section import (
+    _BaseHeaderFooter, _Footer, _Header, Section, SectionIndex, Sections
+)
 from docx.shared import Inches
+from docx.table import Table
+from docx.text.paragraph import Paragraph
 
 from .unitutil.cxml import element, xml
 from .unitutil.mock import call, class_mock, instance_mock, method_mock, property_mock
@@ -18,10 +22,10 @@ from .unitutil.mock import call, class_mock, instance_mock, method_mock, propert
 
 class DescribeSections(object):
 
-    def it_knows_how_many_sections_it_contains(self):
-        sections = Sections(
-            element("w:document/w:body/(w:p/w:pPr/w:sectPr, w:sectPr)"), None
-        )
+    def it_knows_how_many_sections_it_contains(self, document_part_):
+        document_elm = element("w:document/w:body/(w:p/w:pPr/w:sectPr, w:sectPr)")
+        document_part_.section_index = SectionIndex(document_elm)
+        sections = Sections(document_elm, document_part_)
         assert len(sections) == 2
 
     def it_can_iterate_over_its_Section_instances(
@@ -30,6 +34,7 @@ class DescribeSections(object):
         document_elm = element("w:document/w:body/(w:p/w:pPr/w:sectPr, w:sectPr)")
         sectPrs = document_elm.xpath("//w:sectPr")
         Section_.return_value = section_
+        document_part_.section_index = SectionIndex(document_elm)
         sections = Sections(document_elm, document_part_)
 
         section_lst = [s for s in sections]
@@ -47,6 +52,7 @@ class DescribeSections(object):
         )
         sectPrs = document_elm.xpath("//w:sectPr")
         Section_.return_value = section_
+        document_part_.section_index = SectionIndex(document_elm)
         sections = Sections(document_elm, document_part_)
 
         section_lst = [sections[idx] for idx in range(3)]
@@ -66,6 +72,7 @@ class DescribeSections(object):
         )
         sectPrs = document_elm.xpath("//w:sectPr")
         Section_.return_value = section_
+        document_part_.section_index = SectionIndex(document_elm)
         sections = Sections(document_elm, document_part_)
 
         section_lst = sections[1:9]
@@ -90,8 +97,95 @@ class DescribeSections(object):
         return instance_mock(request, Section)
 
 
+class DescribeSectionIndex(object):
+
+    def it_finds_each_sectPr_and_the_one_before_it(self):
+        document_elm = element(
+            "w:document/w:body/(w:p/w:pPr/w:sectPr,w:tbl,w:p/w:pPr/w:sectPr,w:sectPr)"
+        )
+        sectPrs = document_elm.xpath("//w:sectPr")
+        section_index = SectionIndex(document_elm)
+
+        assert section_index.sectPr_lst == sectPrs
+        assert [section_index.preceding_sectPr(s) for s in sectPrs] == [
+            None, sectPrs[0], sectPrs[1]
+        ]
+
+    def it_knows_when_a_sectPr_it_indexed_has_been_removed(self):
+        document_elm = element(
+            "w:document/w:body/(w:p/w:pPr/w:sectPr,w:p/w:pPr/w:sectPr,w:sectPr)"
+        )
+        body = document_elm.body
+        section_index = SectionIndex(document_elm)
+        assert section_index.is_current is True
+
+        body[1].pPr.remove(body[1].pPr.sectPr)
+        assert section_index.is_current is False
+        assert SectionIndex(document_elm).is_current is True
+
+        body.remove(body[0])
+        assert section_index.is_current is False
+
+    def it_rebuilds_itself_when_a_sectPr_it_indexed_is_removed(self):
+        document_elm = element(
+            "w:document/w:body/(w:p/w:pPr/w:sectPr,w:p/w:pPr/w:sectPr,w:p,w:sectPr)"
+        )
+        body = document_elm.body
+        first, second, last = document_elm.xpath("//w:sectPr")
+        section_index = SectionIndex(document_elm)
+
+        body.remove(body[1])
+
+        assert section_index.preceding_sectPr(last) is first
+        assert list(section_index.iter_block_elements(last)) == [body[1]]
+        assert section_index.sectPr_lst == [first, last]
+
+    def it_looks_for_the_sectPr_before_one_it_does_not_index(self):
+        document_elm = element("w:document/w:body/(w:p/w:pPr/w:sectPr,w:sectPr)")
+        section_index = SectionIndex(element("w:document/w:body/w:sectPr"))
+        prior_sectPr, sectPr = document_elm.xpath("//w:sectPr")
+
+        assert section_index.preceding_sectPr(sectPr) is prior_sectPr
+
+    def it_knows_the_block_items_in_each_section(self):
+        document_elm = element(
+            "w:document/w:body/(w:p,w:p/w:pPr/w:sectPr,w:tbl,w:bookmarkStart,"
+            "w:p/w:pPr/w:sectPr,w:p,w:tbl,w:sectPr)"
+        )
+        body = document_elm.body
+        sectPrs = document_elm.xpath("//w:sectPr")
+        section_index = SectionIndex(document_elm)
+
+        assert [list(section_index.iter_block_elements(s)) for s in sectPrs] == [
+            [body[0], body[1]], [body[2], body[4]], [body[5], body[6]]
+        ]
+
+    def but_it_includes_block_items_added_after_it_was_built(self):
+        document_elm = element("w:document/w:body/(w:p/w:pPr/w:sectPr,w:sectPr)")
+        body = document_elm.body
+        sectPrs = document_elm.xpath("//w:sectPr")
+        section_index = SectionIndex(document_elm)
+
+        p = body.add_p()
+
+        assert list(section_index.iter_block_elements(sectPrs[1])) == [p]
+
+
 class DescribeSection(object):
 
+    def it_generates_the_block_items_in_it(self, document_part_):
+        document_elm = element(
+            "w:document/w:body/(w:p/w:pPr/w:sectPr,w:tbl,w:p,w:sectPr)"
+        )
+        document_part_.section_index = SectionIndex(document_elm)
+        section = Section(document_elm.body[-1], document_part_)
+
+        block_items = list(section.iter_block_items())
+
+        assert [type(item) for item in block_items] == [Table, Paragraph]
+        assert [item._element for item in block_items] == list(document_elm.body[1:3])
+        assert all(item._parent is document_part_ for item in block_items)
+
     def it_knows_when_it_displays_a_distinct_first_page_header(
         self, diff_first_header_get_fixture
     ):
@@ -540,12 +634,12 @@ class Describe_BaseHeaderFooter(object):
     ):
         _has_definition_prop_.return_value = False
         _prior_headerfooter_prop_.return_value = prior_headerfooter_
-        prior_headerfooter_._get_or_add_definition.return_value = header_part_
+        prior_headerfooter_._has_definition = True
+        prior_headerfooter_._definition = header_part_
         header = _BaseHeaderFooter(None, None, None)
 
         header_part = header._get_or_add_definition()
 
-        prior_headerfooter_._get_or_add_definition.assert_called_once_with()
         assert header_part is header_part_
 
     def and_it_adds_a_definition_when_it_is_linked_and_the_first_section(
@@ -668,6 +762,7 @@ class Describe_Footer(object):
     ):
         doc_elm = element("w:document/(w:sectPr,w:sectPr)")
         prior_sectPr, sectPr = doc_elm[0], doc_elm[1]
+        document_part_.section_index = SectionIndex(doc_elm)
         footer = _Footer(sectPr, document_part_, WD_HEADER_FOOTER.EVEN_PAGE)
         # ---mock must occur after construction of "real" footer---
         _Footer_ = class_mock(request, "docx.section._Footer", return_value=footer_)
@@ -679,10 +774,11 @@ class Describe_Footer(object):
         )
         assert prior_footer is footer_
 
-    def but_it_returns_None_when_its_the_first_footer(self):
+    def but_it_returns_None_when_its_the_first_footer(self, document_part_):
         doc_elm = element("w:document/w:sectPr")
         sectPr = doc_elm[0]
-        footer = _Footer(sectPr, None, None)
+        document_part_.section_index = SectionIndex(doc_elm)
+        footer = _Footer(sectPr, document_part_, None)
 
         prior_footer = footer._prior_headerfooter
 
@@ -764,6 +860,7 @@ class Describe_Header(object):
     ):
         doc_elm = element("w:document/(w:sectPr,w:sectPr)")
         prior_sectPr, sectPr = doc_elm[0], doc_elm[1]
+        document_part_.section_index = SectionIndex(doc_elm)
         header = _Header(sectPr, document_part_, WD_HEADER_FOOTER.PRIMARY)
         # ---mock must occur after construction of "real" header---
         _Header_ = class_mock(request, "docx.section._Header", return_value=header_)
@@ -775,10 +872,11 @@ class Describe_Header(object):
         )
         assert prior_header is header_
 
-    def but_it_returns_None_when_its_the_first_header(self):
+    def but_it_returns_None_when_its_the_first_header(self, document_part_):
         doc_elm = element("w:document/w:sectPr")
         sectPr = doc_elm[0]
-        header = _Header(sectPr, None, None)
+        document_part_.section_index = SectionIndex(doc_elm)
+        header = _Header(sectPr, document_part_, None)
 
         prior_header = header._prior_headerfooter
 
@@ -14,14 +14,16 @@ from docx.oxml import parse_xml
 from docx.oxml.table import CT_Tc
 from docx.parts.document import DocumentPart
 from docx.shared import Inches
-from docx.table import _Cell, _Column, _Columns, _Row, _Rows, Table
+from docx.table import (
+    _Cell, _cell_grids, _Column, _Columns, _Row, _Rows, Table
+)
 from docx.text.paragraph import Paragraph
 
 from .oxml.unitdata.table import a_gridCol, a_tbl, a_tblGrid, a_tc, a_tr
 from .oxml.unitdata.text import a_p
 from .unitutil.cxml import element, xml
 from .unitutil.file import snippet_seq
-from .unitutil.mock import instance_mock, property_mock
+from .unitutil.mock import instance_mock, method_mock, property_mock
 
 
 class DescribeTable(object):
@@ -34,6 +36,25 @@ class DescribeTable(object):
         assert row._tr is table._tbl.tr_lst[-1]
         assert row._parent is table
 
+    def it_can_add_rows_like_a_template_row(self):
+        table = Table(element(
+            'w:tbl/(w:tblGrid/(w:gridCol,w:gridCol),'
+            'w:tr/(w:tc/w:p/w:r/w:t"a",w:tc/w:p),'
+            'w:tr/(w:trPr/w:cantSplit,w:tc/w:p,w:tc/w:p))'
+        ), None)
+        first_row, last_row = table.rows
+
+        rows = table.add_rows(2)
+        more_rows = table.add_rows([['x']], template_row=first_row)
+
+        tr_lst = table._tbl.tr_lst
+        assert [row._tr for row in rows + more_rows] == tr_lst[2:]
+        assert all(row._parent is table for row in rows + more_rows)
+        assert [tr.trPr is not None for tr in tr_lst] == [
+            False, True, True, True, False
+        ]
+        assert [c.text for c in more_rows[0].cells] == ['x', '']
+
     def it_can_add_a_column(self, add_column_fixture):
         table, width, expected_xml = add_column_fixture
         column = table.add_column(width)
@@ -126,6 +147,72 @@ class DescribeTable(object):
             for idx in matching_idxs[1:]:
                 assert cells[idx] is cells[comparator_idx]
 
+    def it_keeps_its_cell_grid_in_step_with_its_layout(self):
+        table = Table(element(
+            'w:tbl/(w:tblGrid/(w:gridCol{w:w=1440},w:gridCol{w:w=1440}),'
+            'w:tr/(w:tc/w:p,w:tc/w:p))'
+        ), None)
+        cells = table._cells
+        assert table._cells is cells
+        assert table.cell(0, 1) is cells[1]
+
+        row = table.add_row()
+
+        assert table._cells is cells
+        assert [c._tc for c in table.row_cells(1)] == row._tr.tc_lst
+
+        rows = table.add_rows([('a', 'b')])
+
+        assert table._cells is cells
+        assert [c.text for c in table.row_cells(2)] == ['a', 'b']
+        assert table.row_cells(2)[0]._tc is rows[0]._tr.tc_lst[0]
+
+        table.add_column(Inches(1))
+
+        assert len(table._cells) == 9
+        assert table.cell(1, 2)._tc is row._tr.tc_lst[2]
+
+        table.cell(0, 0).merge(table.cell(0, 1))
+
+        assert table.cell(0, 0) is table.cell(0, 1)
+
+    def it_shares_its_cell_grid_with_other_objects_on_its_table(self):
+        tbl = element(
+            'w:tbl/(w:tblGrid/(w:gridCol{w:w=1440},w:gridCol{w:w=1440}),'
+            'w:tr/(w:tc/w:p,w:tc/w:p))'
+        )
+        table, other_table = Table(tbl, None), Table(tbl, None)
+        table.cell(0, 0)
+
+        row = other_table.add_row()
+        assert table.cell(1, 1)._tc is row._tr.tc_lst[1]
+
+        other_table.add_column(Inches(1))
+        assert table.cell(1, 2)._tc is row._tr.tc_lst[2]
+
+        other_table.cell(0, 0).merge(other_table.cell(0, 1))
+        assert table.cell(0, 0) is table.cell(0, 1)
+
+        tbl.remove(row._tr)
+        with pytest.raises(IndexError):
+            table.cell(1, 0)
+
+    def it_notices_a_row_moved_in_the_xml(self):
+        tbl = element(
+            'w:tbl/(w:tblGrid/w:gridCol{w:w=1440},'
+            'w:tr/w:tc/w:p/w:r/w:t"a",w:tr/w:tc/w:p/w:r/w:t"b",'
+            'w:tr/w:tc/w:p/w:r/w:t"c")'
+        )
+        table = Table(tbl, None)
+        assert [table.cell(i, 0).text for i in range(3)] == ['a', 'b', 'c']
+        tr_a, tr_b = tbl.tr_lst[:2]
+
+        tr_b.addnext(tr_a)
+
+        assert [table.cell(i, 0).text for i in range(3)] == ['b', 'a', 'c']
+        assert [row.cells[0].text for row in table.rows] == ['b', 'a', 'c']
+        assert Table(tbl, None).cell(1, 0).text == 'a'
+
     def it_knows_its_column_count_to_help(self, column_count_fixture):
         table, expected_value = column_count_fixture
         column_count = table._column_count
@@ -261,10 +348,11 @@ class DescribeTable(object):
         return table, new_value, expected_xml
 
     @pytest.fixture
-    def row_cells_fixture(self, _cells_, _column_count_):
+    def row_cells_fixture(self, _cell_grid_at_):
         table = Table(None, None)
-        _cells_.return_value = [0, 1, 2, 3, 4, 5, 6, 7, 8]
-        _column_count_.return_value = 3
+        cell_grid = _cell_grid_at_.return_value
+        cell_grid.cells = [0, 1, 2, 3, 4, 5, 6, 7, 8]
+        cell_grid.col_count = 3
         row_idx = 1
         expected_cells = [3, 4, 5]
         return table, row_idx, expected_cells
@@ -303,6 +391,10 @@ class DescribeTable(object):
     def _cells_(self, request):
         return property_mock(request, Table, '_cells')
 
+    @pytest.fixture
+    def _cell_grid_at_(self, request):
+        return method_mock(request, Table, '_cell_grid_at')
+
     @pytest.fixture
     def _column_count_(self, request):
         return property_mock(request, Table, '_column_count')
@@ -397,6 +489,7 @@ class Describe_Cell(object):
         cell, other_cell, merged_tc_ = merge_fixture
         merged_cell = cell.merge(other_cell)
         cell._tc.merge.assert_called_once_with(other_cell._tc)
+        assert merged_tc_._tbl not in _cell_grids
         assert isinstance(merged_cell, _Cell)
         assert merged_cell._tc is merged_tc_
         assert merged_cell._parent is cell._parent
@@ -9,6 +9,7 @@ from docx.enum.text import WD_ALIGN_PARAGRAPH
 from docx.oxml.text.paragraph import CT_P
 from docx.oxml.text.run import CT_R
 from docx.parts.document import DocumentPart
+from docx.styles.styles import ResolvedStyles
 from docx.text.paragraph import Paragraph
 from docx.text.parfmt import ParagraphFormat
 from docx.text.run import Run
@@ -45,6 +46,14 @@ class DescribeParagraph(object):
         paragraph, expected_text = text_get_fixture
         assert paragraph.text == expected_text
 
+    def it_includes_the_text_of_its_hyperlinks_in_its_text(self):
+        paragraph = Paragraph(element(
+            'w:p/(w:r/w:t"See ",w:hyperlink{r:id=rId6}/w:r/w:t"the docs",'
+            'w:r/w:t".")'
+        ), None)
+        assert paragraph.text == 'See the docs.'
+        assert [run.text for run in paragraph.runs] == ['See ', '.']
+
     def it_can_replace_the_text_it_contains(self, text_set_fixture):
         paragraph, text, expected_text = text_set_fixture
         paragraph.text = text
@@ -59,6 +68,24 @@ class DescribeParagraph(object):
         paragraph.alignment = value
         assert paragraph._p.xml == expected_xml
 
+    def it_knows_its_effective_format(
+            self, request, part_prop_, document_part_):
+        p = element('w:p')
+        resolved_styles_ = instance_mock(request, ResolvedStyles)
+        resolved_styles_.paragraph_properties.return_value = element(
+            'w:pPr/w:keepNext'
+        )
+        document_part_.resolved_styles = resolved_styles_
+        paragraph = Paragraph(p, None)
+
+        paragraph_format = paragraph.effective_format
+
+        resolved_styles_.paragraph_properties.assert_called_once_with(p)
+        assert isinstance(paragraph_format, ParagraphFormat)
+        assert paragraph_format.keep_with_next is True
+        assert paragraph_format.keep_together is None
+        assert p.pPr is None
+
     def it_provides_access_to_its_paragraph_format(self, parfmt_fixture):
         paragraph, ParagraphFormat_, paragraph_format_ = parfmt_fixture
         paragraph_format = paragraph.paragraph_format
@@ -227,6 +254,9 @@ class DescribeParagraph(object):
         ('w:p/w:r/(w:t"foo", w:tab, w:t"bar")', 'foo\tbar'),
         ('w:p/w:r/(w:t"foo", w:br,  w:t"bar")', 'foo\nbar'),
         ('w:p/w:r/(w:t"foo", w:cr,  w:t"bar")', 'foo\nbar'),
+        ('w:p/(w:r/w:t"foo", w:hyperlink/w:r/w:t"bar", w:r/w:t"baz")',
+         'foobarbaz'),
+        ('w:p/(w:r/w:t"foo", w:r/w:rPr/w:b, w:ins/w:r/w:t"bar")', 'foo'),
     ])
     def text_get_fixture(self, request):
         p_cxml, expected_text_value = request.param
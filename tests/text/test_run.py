@@ -8,6 +8,7 @@ from docx.enum.style import WD_STYLE_TYPE
 from docx.enum.text import WD_BREAK, WD_UNDERLINE
 from docx.parts.document import DocumentPart
 from docx.shape import InlineShape
+from docx.styles.styles import ResolvedStyles
 from docx.text.font import Font
 from docx.text.run import Run
 
@@ -65,6 +66,21 @@ class DescribeRun(object):
         Font_.assert_called_once_with(run._element)
         assert font is font_
 
+    def it_knows_its_effective_font(self, request, part_prop_, document_part_):
+        r = element('w:p/w:r')[0]
+        resolved_styles_ = instance_mock(request, ResolvedStyles)
+        resolved_styles_.run_properties.return_value = element('w:rPr/w:b')
+        document_part_.resolved_styles = resolved_styles_
+        run = Run(r, None)
+
+        font = run.effective_font
+
+        resolved_styles_.run_properties.assert_called_once_with(r)
+        assert isinstance(font, Font)
+        assert font.bold is True
+        assert font.italic is None
+        assert r.rPr is None
+
     def it_can_add_text(self, add_text_fixture, Text_):
         r, text_str, expected_xml = add_text_fixture
         run = Run(r, None)